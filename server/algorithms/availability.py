@@ -0,0 +1,66 @@
+# testing/algorithms/availability.py
+
+import numpy as np
+from typing import Dict, Union, List
+
+# Availability as stored in the data files: {"0": [bool, ...], ...}; tests
+# and older callers also use int day keys or a plain list of per-day lists
+Availability = Union[Dict[Union[str, int], List[bool]], List[List[bool]]]
+
+
+class AvailabilityGrid:
+    """Week grid of n_days x n_slots periods, with resource availability as int bitmasks.
+
+    Bit day * n_slots + slot is set when the resource is free in that
+    period, so a whole week fits in one Python int whatever the grid size.
+    """
+
+    def __init__(self, n_days: int = 5, n_slots: int = 8):
+        self.n_days = n_days
+        self.n_slots = n_slots
+        self.full_mask = (1 << (n_days * n_slots)) - 1
+
+        # Bits where a run of four periods can start without leaving the day
+        day_starts = (1 << max(n_slots - 3, 0)) - 1
+        self.window_mask = sum(day_starts << (day * n_slots) for day in range(n_days))
+
+    def bit(self, day: int, slot: int) -> int:
+        return 1 << (day * self.n_slots + slot)
+
+    def compile(self, availability: Availability) -> int:
+        """Pack per-day boolean lists into a bitmask; missing days or slots count as unavailable"""
+        mask = 0
+        for day in range(self.n_days):
+            if isinstance(availability, dict):
+                periods = availability.get(str(day), availability.get(day, []))
+            else:
+                periods = availability[day] if day < len(availability) else []
+            for slot, free in enumerate(periods[:self.n_slots]):
+                if free:
+                    mask |= self.bit(day, slot)
+        return mask
+
+    def is_free(self, mask: int, day: int, slot: int) -> bool:
+        return bool(mask >> (day * self.n_slots + slot) & 1)
+
+    def to_array(self, mask: int) -> np.ndarray:
+        """Boolean (n_days, n_slots) view of a bitmask"""
+        bits = np.array([mask >> i & 1 for i in range(self.n_days * self.n_slots)], dtype=bool)
+        return bits.reshape(self.n_days, self.n_slots)
+
+    def consecutive_penalty(self, occupied: int) -> int:
+        """Classes beyond the third in every run of consecutive occupied periods.
+
+        A run of L periods contains L - 3 windows of four, so counting the
+        window start bits of busy & busy>>1 & busy>>2 & busy>>3 gives the
+        penalty without walking the runs.
+        """
+        windows = occupied & (occupied >> 1) & (occupied >> 2) & (occupied >> 3)
+        return bin(windows & self.window_mask).count('1')
+
+    def mask_of(self, resource: Dict) -> int:
+        """Compiled mask of a teacher or classroom, compiling it if loading skipped that"""
+        mask = resource.get('availability_mask')
+        if mask is None:
+            mask = self.compile(resource.get('availability', {}))
+        return mask
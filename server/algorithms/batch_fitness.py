@@ -0,0 +1,130 @@
+# testing/algorithms/batch_fitness.py
+
+import numpy as np
+from typing import List, Dict, Optional
+from .encoding import EncodedChromosome
+
+# Column order of a stacked population, matching EncodedChromosome
+COURSE, SESSION, DAY, SLOT, TEACHER, ROOM = range(6)
+
+
+def stack_population(population: List[EncodedChromosome]) -> np.ndarray:
+    """Stack encoded chromosomes into one (population, column, gene) array.
+
+    Shorter chromosomes are padded with -1, which the evaluator ignores.
+    """
+    width = max((len(chrom) for chrom in population), default=0)
+    stacked = np.full((len(population), len(EncodedChromosome.COLUMNS), width), -1,
+                      dtype=np.int32)
+    for row, chrom in enumerate(population):
+        for col, values in enumerate(chrom.columns()):
+            stacked[row, col, :len(values)] = values
+    return stacked
+
+
+class BatchFitnessEvaluator:
+    """Score a whole stacked population with vectorized occupancy counts"""
+
+    COUNTS = ('teacher_conflict', 'room_conflict', 'adjacent_classes',
+              'consecutive_classes', 'capacity_violation', 'teacher_preference')
+    DENSE_CELL_LIMIT = 1 << 22
+
+    def __init__(self, n_days: int, n_slots: int,
+                 course_students: Optional[np.ndarray] = None,
+                 room_capacity: Optional[np.ndarray] = None,
+                 teacher_availability: Optional[np.ndarray] = None):
+        self.n_days = n_days
+        self.n_slots = n_slots
+        # Optional lookup tables for FitnessCalculator's capacity and
+        # preference checks: students per course, capacity per room and a
+        # (teacher, day, slot) boolean availability grid
+        self.course_students = course_students
+        self.room_capacity = room_capacity
+        self.teacher_availability = teacher_availability
+
+    def _occupancy(self, rows: np.ndarray, resource: np.ndarray, day: np.ndarray,
+                   slot: np.ndarray, n_population: int, neighbours: bool) -> Dict[str, np.ndarray]:
+        """Per-chromosome colliding pairs and, optionally, same-day slot neighbour counts"""
+        n_resources = int(resource.max()) + 1
+        lanes = n_resources * self.n_days
+        keys = ((rows * n_resources + resource) * self.n_days + day) * self.n_slots + slot
+
+        if n_population * lanes * self.n_slots <= self.DENSE_CELL_LIMIT:
+            # Small grids: scatter into a dense (population, resource-day, slot) histogram
+            hist = np.bincount(keys, minlength=n_population * lanes * self.n_slots)
+            hist = hist.reshape(n_population, lanes, self.n_slots)
+            result = {'pairs': (hist * (hist - 1) // 2).sum(axis=(1, 2))}
+            if neighbours:
+                result['adjacent'] = (hist[:, :, :-1] * hist[:, :, 1:]).sum(axis=(1, 2))
+                busy = hist > 0
+                window = busy[:, :, 3:] & busy[:, :, 2:-1] & busy[:, :, 1:-2] & busy[:, :, :-3]
+                result['consecutive'] = window.sum(axis=(1, 2))
+            return result
+
+        # Large grids: work on the sorted occupied cells only
+        keys, counts = np.unique(keys, return_counts=True)
+        cell_rows = keys // (lanes * self.n_slots)
+
+        def per_row(weights):
+            return np.bincount(cell_rows, weights=weights, minlength=n_population)
+
+        result = {'pairs': per_row(counts * (counts - 1) // 2)}
+        if neighbours:
+            # key + 1 is the next day's first slot when slot is the last one
+            position = keys % self.n_slots
+            result['adjacent'] = per_row(
+                counts * self._count_at(keys, counts, keys + 1) * (position < self.n_slots - 1))
+            window = position <= self.n_slots - 4
+            for offset in (1, 2, 3):
+                window &= self._count_at(keys, counts, keys + offset) > 0
+            result['consecutive'] = per_row(window)
+        return result
+
+    @staticmethod
+    def _count_at(keys: np.ndarray, counts: np.ndarray, wanted: np.ndarray) -> np.ndarray:
+        """Gene count of each wanted key, 0 where the cell is empty"""
+        idx = np.minimum(np.searchsorted(keys, wanted), len(keys) - 1)
+        return np.where(keys[idx] == wanted, counts[idx], 0)
+
+    def conflict_counts(self, stacked: np.ndarray) -> Dict[str, np.ndarray]:
+        """Per-chromosome constraint counts for a stacked population"""
+        n_population = stacked.shape[0]
+        rows, genes = np.nonzero(stacked[:, COURSE, :] >= 0)
+        values = stacked[rows, :, genes].astype(np.int64)
+        day, slot = values[:, DAY], values[:, SLOT]
+
+        counts = {name: np.zeros(n_population) for name in self.COUNTS}
+        if not len(rows):
+            return counts
+
+        # Teacher and room collisions: k genes in one cell are k*(k-1)/2 pairs.
+        # A run of L busy teacher slots holds L-3 windows of four busy slots,
+        # which is the number of classes beyond the third in that run.
+        teacher = self._occupancy(rows, values[:, TEACHER], day, slot, n_population, True)
+        counts['teacher_conflict'] = teacher['pairs']
+        counts['adjacent_classes'] = teacher['adjacent']
+        counts['consecutive_classes'] = teacher['consecutive']
+        counts['room_conflict'] = self._occupancy(rows, values[:, ROOM], day, slot,
+                                                  n_population, False)['pairs']
+
+        if self.course_students is not None and self.room_capacity is not None:
+            over = self.course_students[values[:, COURSE]] > self.room_capacity[values[:, ROOM]]
+            counts['capacity_violation'] = np.bincount(rows, weights=over, minlength=n_population)
+        if self.teacher_availability is not None:
+            unavailable = ~self.teacher_availability[values[:, TEACHER], day, slot]
+            counts['teacher_preference'] = np.bincount(rows, weights=unavailable,
+                                                       minlength=n_population)
+        return counts
+
+    def fitness(self, stacked: np.ndarray) -> np.ndarray:
+        """Fitness vector matching AGADRScheduler.fitness"""
+        counts = self.conflict_counts(stacked)
+        conflicts = (counts['teacher_conflict'] + counts['room_conflict'] +
+                     0.5 * counts['adjacent_classes'])
+        return 1 / (1 + conflicts)
+
+    def weighted_fitness(self, stacked: np.ndarray, weights: Dict[str, float]) -> np.ndarray:
+        """Fitness vector matching FitnessCalculator.calculate_fitness"""
+        counts = self.conflict_counts(stacked)
+        penalties = sum(counts[name] * weight for name, weight in weights.items())
+        return 1 / (1 + penalties)
@@ -1,7 +1,8 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
 from flask_cors import CORS
 import sys
 import os
+import json
 from pathlib import Path
 
 # Get absolute path to project root
@@ -16,21 +17,25 @@ print(f"\nPython path: {sys.path[0]}")
 try:
     # Import using absolute paths from testing directory
     from testing.algorithms.agadr import AGADRScheduler
-    from utils.data_generator import generate_test_data
+    from testing.algorithms.decomposition import DecomposedSolver
+    from testing.algorithms.jobs import JobManager, QueueFullError
+    from testing.algorithms.result_cache import ResultCache
+    from testing.algorithms.problem import ProblemPool, dataset_version, directory_version
+    from testing.algorithms.profiling import MetricsRegistry
     print("Successfully imported all modules")
 except ImportError:
     # Fallback import method if the first fails
     try:
-        import importlib.util
+        # agadr.py uses package-relative imports, so load it through the
+        # algorithms package on TESTING_DIR instead of as a standalone file
+        from algorithms.agadr import AGADRScheduler
+        from algorithms.decomposition import DecomposedSolver
+        from algorithms.jobs import JobManager, QueueFullError
+        from algorithms.result_cache import ResultCache
+        from algorithms.problem import ProblemPool, dataset_version, directory_version
+        from algorithms.profiling import MetricsRegistry
         
-        # Dynamic import for AGADRScheduler
-        agadr_path = TESTING_DIR / 'algorithms' / 'agadr.py'
-        spec = importlib.util.spec_from_file_location("agadr", str(agadr_path))
-        agadr_module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(agadr_module)
-        AGADRScheduler = agadr_module.AGADRScheduler
-        
-        print("Successfully imported modules using dynamic import")
+        print("Successfully imported modules from testing directory")
     except Exception as e:
         print(f"Import error: {e}")
         raise
@@ -38,43 +43,210 @@ except ImportError:
 app = Flask(__name__)
 CORS(app)
 
+# GA settings a request may override
+SOLVER_OPTIONS = ('population_size', 'generations', 'encoding', 'fitness_engine',
+                  'crossover_method', 'target_fitness', 'time_budget',
+                  'stagnation_limit', 'stagnation_epsilon', 'seeding', 'seed_ratio',
+                  'local_search_budget', 'selection', 'selection_pressure',
+                  'adaptive_rates', 'restart_threshold', 'restart_fraction',
+                  'eliminate_clones')
+
+# Wall-clock limit in seconds for requests that don't set time_budget; unset means none
+DEFAULT_TIME_BUDGET = os.environ.get('SOLVER_TIME_BUDGET')
+
+# Everything that can change a solve's result, and so goes into the result cache key
+CACHE_FIELDS = ('divisions', 'teachers', 'classrooms', 'courses', 'semester', 'seed',
+                'dataset_version', 'decompose') + SOLVER_OPTIONS
+
+# Default instance, found relative to this file rather than the working directory
+DATA_DIR = TESTING_DIR / 'data'
+
+# Compiled problems by dataset version, so requests reuse them instead of
+# re-reading and re-indexing the data
+problems = ProblemPool(maxsize=int(os.environ.get('SOLVER_POOL_SIZE', 8)))
+
+def problem_version(payload):
+    """Dataset version a payload solves: its own records, or the data files on disk"""
+    if payload.get('courses'):
+        return dataset_version(payload.get('teachers') or [], payload.get('classrooms') or [],
+                               payload['courses'])
+    return directory_version(DATA_DIR)
+
+# Profile every Nth generation's operators; phase totals are always collected
+PROFILE_EVERY = int(os.environ.get('SOLVER_PROFILE_EVERY', 10))
+# Fitness worker processes per solve for large instances; unset means one per CPU
+FITNESS_WORKERS = os.environ.get('SOLVER_FITNESS_WORKERS')
+
+# Totals over finished runs, served on /metrics
+metrics = MetricsRegistry()
+
+def solve(payload, callback=None):
+    """Run one solve for a request payload on a pooled compiled problem.
+
+    callback gets each generation's stats, then once more a summary of the
+    run (generations, best_fitness, elapsed, stop_reason) with its profile
+    under 'report'. Decomposed solves report each part's generations, with
+    its number under 'part', and keep each part's profile in its entry of
+    the summary's 'parts' instead.
+    """
+    options = {key: payload[key] for key in SOLVER_OPTIONS if key in payload}
+    if DEFAULT_TIME_BUDGET and options.get('time_budget') is None:
+        options['time_budget'] = float(DEFAULT_TIME_BUDGET)
+    # Requests may carry the problem instance in the scheduler's own format;
+    # otherwise the data files are solved
+    if payload.get('courses'):
+        problem = problems.from_records(payload.get('teachers') or [],
+                                        payload.get('classrooms') or [], payload['courses'])
+    else:
+        problem = problems.from_directory(DATA_DIR)
+    # A seeded request draws from its own random stream, so it is reproducible
+    # however many other requests are solving in other threads
+    scheduler = AGADRScheduler(problem=problem, profile_every=PROFILE_EVERY,
+                               fitness_workers=int(FITNESS_WORKERS) if FITNESS_WORKERS else None,
+                               seed=payload.get('seed'), **options)
+
+    # decompose solves the instance's teacher-disjoint parts separately and merges them
+    if payload.get('decompose'):
+        outcome = DecomposedSolver(scheduler).solve(callback=callback)
+    else:
+        outcome = scheduler.solve(callback=callback)
+    if callback is not None:
+        summary = {key: value for key, value in outcome.items() if key != 'timetable'}
+        if not payload.get('decompose'):
+            summary['report'] = scheduler.run_report()
+        callback(summary)
+    return outcome['timetable']
+
+def record_run_metrics(summary):
+    """Add a finished solve's run profiles to the totals: one per part for decomposed solves"""
+    if 'parts' in summary:
+        for part in summary['parts']:
+            metrics.record(part.get('report'))
+    else:
+        metrics.record(summary.get('report'))
+
+def record_job_metrics(status):
+    """Add a finished job's run profiles, which arrive in its last progress, to the totals"""
+    record_run_metrics(status['progress'] or {})
+
+# Compile the default instance at startup; forked solver workers inherit it
+try:
+    problems.from_directory(DATA_DIR)
+except FileNotFoundError as e:
+    print(f"Default data not available: {e}")
+
+# Results by canonical payload hash; SOLVER_CACHE_DIR adds a tier that survives restarts
+results = ResultCache(CACHE_FIELDS,
+                      maxsize=int(os.environ.get('SOLVER_CACHE_SIZE', 128)),
+                      directory=os.environ.get('SOLVER_CACHE_DIR'))
+
+# Background solver pool, started on first use so importing this module stays cheap
+jobs = None
+
+def get_jobs():
+    global jobs
+    if jobs is None:
+        jobs = JobManager(solve,
+                          max_workers=int(os.environ.get('SOLVER_WORKERS', 2)),
+                          max_queue=int(os.environ.get('SOLVER_QUEUE_DEPTH', 32)),
+                          cache=results,
+                          on_finish=record_job_metrics)
+    return jobs
+
 @app.route('/generate-timetable', methods=['POST'])
 def generate_timetable():
     try:
-        data = request.json
+        data = request.get_json(silent=True)
         print("Received data:", data)
+        if not isinstance(data, dict) or not data:
+            return jsonify({"error": "Request body must be a JSON object"}), 400
 
-        # Generate additional test data if needed
-        test_data = generate_test_data()
-        
-        # Merge test data with received data
-        divisions = data.get('divisions') or test_data['divisions']
-        teachers = data.get('teachers') or test_data['teachers']
-        classrooms = data.get('classrooms') or test_data['classrooms']
-
-        print("Using data:", {
-            "divisions": len(divisions),
-            "teachers": len(teachers),
-            "classrooms": len(classrooms)
-        })
-
-        scheduler = AGADRScheduler(
-            divisions=divisions,
-            teachers=teachers,
-            classrooms=classrooms,
-            semester=data['semester']
-        )
-        
-        timetable = scheduler.generate_timetable()
+        data = dict(data, dataset_version=problem_version(data))
+        key = results.key(data)
+        timetable = results.get(key)
+        if timetable is not None:
+            print("Serving cached timetable", key)
+            return jsonify(timetable), 200, {'X-Cache': 'HIT'}
+
+        progress = {}
+        timetable = solve(data, callback=progress.update)
+        record_run_metrics(progress)
         print("Generated timetable:", timetable)
+        results.put(key, timetable)
         
-        return jsonify(timetable)
+        return jsonify(timetable), 200, {'X-Cache': 'MISS',
+                                         'X-Stop-Reason': progress.get('stop_reason', '')}
     except Exception as e:
         print("Error generating timetable:", str(e))
         import traceback
         traceback.print_exc()
         return jsonify({"error": str(e)}), 500
 
+@app.route('/jobs', methods=['POST'])
+def submit_job():
+    try:
+        data = request.json or {}
+        job_id = get_jobs().submit(dict(data, dataset_version=problem_version(data)))
+    except QueueFullError as e:
+        return jsonify({"error": str(e)}), 429, {'Retry-After': str(e.retry_after)}
+    return jsonify({"job_id": job_id, "status": "queued"}), 202, {'Location': f'/jobs/{job_id}'}
+
+@app.route('/jobs/<job_id>', methods=['GET'])
+def job_status(job_id):
+    status = get_jobs().status(job_id)
+    if status is None:
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(status)
+
+@app.route('/jobs/<job_id>/result', methods=['GET'])
+def job_result(job_id):
+    status = get_jobs().status(job_id)
+    if status is None:
+        return jsonify({"error": "Unknown job"}), 404
+    if status['status'] == 'succeeded':
+        return jsonify(get_jobs().result(job_id))
+    if status['status'] == 'failed':
+        return jsonify({"error": status['error']}), 500
+    if status['status'] == 'cancelled':
+        return jsonify({"error": "Job was cancelled"}), 409
+    return jsonify(status), 202
+
+@app.route('/jobs/<job_id>/events', methods=['GET'])
+def job_events(job_id):
+    """Server-sent events: one 'progress' event per generation, then a final 'done'"""
+    if get_jobs().status(job_id) is None:
+        return jsonify({"error": "Unknown job"}), 404
+
+    def stream():
+        for status in get_jobs().watch(job_id):
+            event = 'done' if status['status'] in JobManager.FINISHED else 'progress'
+            yield f"event: {event}\ndata: {json.dumps(status)}\n\n"
+
+    return Response(stream(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+
+@app.route('/jobs/<job_id>', methods=['DELETE'])
+def cancel_job(job_id):
+    if not get_jobs().cancel(job_id):
+        return jsonify({"error": "Unknown job"}), 404
+    return jsonify(get_jobs().status(job_id)), 202
+
+@app.route('/metrics', methods=['GET'])
+def metrics_endpoint():
+    """Prometheus text exposition of run totals, job states and result cache counters"""
+    cache_stats = results.stats()
+    gauges = {
+        'result_cache_lookups_total': {'help': 'Result cache lookups', 'type': 'counter',
+                                       'label': 'outcome',
+                                       'values': {'hit': cache_stats['hits'],
+                                                  'disk_hit': cache_stats['disk_hits'],
+                                                  'miss': cache_stats['misses']}}
+    }
+    if jobs is not None:
+        gauges['jobs'] = {'help': 'Tracked jobs by status', 'label': 'status',
+                          'values': jobs.counts()}
+    return Response(metrics.render(gauges), mimetype='text/plain; version=0.0.4')
+
 if __name__ == "__main__":
     print("Starting Flask server...")
     app.run(port=5002, debug=True)
\ No newline at end of file
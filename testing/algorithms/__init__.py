@@ -2,5 +2,17 @@
 
 from .agadr import AGADRScheduler
 from .fitness import FitnessCalculator
+from .encoding import ChromosomeEncoder, EncodedChromosome
+from .batch_fitness import BatchFitnessEvaluator, stack_population
+from .incremental import OccupancyState
+from .islands import IslandModel
+from .decomposition import DecomposedSolver
+from .problem_index import ProblemIndex
+from .problem import CompiledProblem, ProblemPool
+from .availability import AvailabilityGrid
+from .fitness_cache import FitnessCache, chromosome_key
 
-__all__ = ['AGADRScheduler', 'FitnessCalculator']
\ No newline at end of file
+__all__ = ['AGADRScheduler', 'FitnessCalculator', 'ChromosomeEncoder', 'EncodedChromosome',
+           'BatchFitnessEvaluator', 'stack_population', 'OccupancyState',
+           'IslandModel', 'DecomposedSolver', 'ProblemIndex', 'CompiledProblem', 'ProblemPool', 'AvailabilityGrid',
+           'FitnessCache', 'chromosome_key']
\ No newline at end of file
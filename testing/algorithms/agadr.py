@@ -1,200 +1,524 @@
 # testing/algorithms/agadr.py
 import os
+import time
 import random
 import numpy as np
-from typing import List, Dict, Tuple
-import json
+from typing import List, Dict, Tuple, Callable, Iterator
+from collections import Counter
+from .encoding import EncodedChromosome, Gene, is_compact
+from .batch_fitness import stack_population
+from .incremental import OccupancyState
+from .problem import CompiledProblem
+from .fitness_cache import FitnessCache, chromosome_key
+from .profiling import RunProfiler
+from .local_search import TabuSearch
+from .parallel_fitness import ParallelFitnessEvaluator, shared_evaluator, close_shared_evaluators
+from .selection import SCHEMES
+from .diversity import DiversityTracker
 
 class AGADRScheduler:
-    def __init__(self, population_size: int = 50, generations: int = 100):
+    # Fitness cache size per encoding when fitness_cache_size is not given
+    DEFAULT_CACHE_SIZES = {'dict': 0, 'array': 2048, 'compact': 0}
+
+    def __init__(self, population_size: int = 50, generations: int = 100,
+                 encoding: str = 'dict', fitness_engine: str = 'scalar',
+                 incremental: bool = False, crossover_method: str = 'adaptive',
+                 n_days: int = 5, n_slots: int = 8, fitness_cache_size: int = None,
+                 teachers: List[Dict] = None, classrooms: List[Dict] = None,
+                 courses: List[Dict] = None, verbose: bool = False,
+                 problem: CompiledProblem = None, profile_every: int = 0,
+                 target_fitness: float = 0.95, time_budget: float = None,
+                 stagnation_limit: int = None, stagnation_epsilon: float = 0.0,
+                 seeding: str = 'random', seed_ratio: float = 0.5,
+                 local_search_budget: int = 0, fitness_workers: int = None,
+                 selection: str = 'tournament', selection_pressure: float = None,
+                 adaptive_rates: bool = False, restart_threshold: float = 0.2,
+                 restart_fraction: float = 0.5, eliminate_clones: bool = False,
+                 seed: int = None):
+        if encoding not in ('dict', 'array', 'compact'):
+            raise ValueError(f"Unknown chromosome encoding: {encoding}")
+        if fitness_engine not in ('scalar', 'batch'):
+            raise ValueError(f"Unknown fitness engine: {fitness_engine}")
+        if crossover_method not in ('adaptive', 'uniform', 'segment'):
+            raise ValueError(f"Unknown crossover method: {crossover_method}")
+        if incremental and encoding != 'array':
+            raise ValueError("Incremental fitness requires the array encoding")
+        if selection not in SCHEMES:
+            raise ValueError(f"Unknown selection scheme: {selection}")
+        if selection == 'rank' and selection_pressure is not None and not 1 <= selection_pressure <= 2:
+            raise ValueError(f"Rank selection pressure must be between 1 and 2: {selection_pressure}")
+        if not 0 <= restart_fraction <= 1:
+            raise ValueError(f"Restart fraction must be between 0 and 1: {restart_fraction}")
+        if seeding not in ('random', 'constructive'):
+            raise ValueError(f"Unknown seeding mode: {seeding}")
+        if time_budget is not None and time_budget <= 0:
+            raise ValueError(f"Time budget must be positive: {time_budget}")
+        if local_search_budget < 0:
+            raise ValueError(f"Local search budget cannot be negative: {local_search_budget}")
+        if stagnation_limit is not None and stagnation_limit < 1:
+            raise ValueError(f"Stagnation limit must be at least one generation: {stagnation_limit}")
         self.population_size = population_size
         self.generations = generations
+        self.encoding = encoding
+        self.fitness_engine = fitness_engine
+        # Array chromosomes carry occupancy counters so mutations update fitness by delta
+        self.incremental = incremental
+        self.crossover_method = crossover_method
+        # Print every generation's best fitness; evolve otherwise prints one summary line
+        self.verbose = verbose
+        # Scores of chromosomes seen before (elites, untouched parents); 0 disables.
+        # By default only array chromosomes are cached: their key is one bytes
+        # join, while a dict or compact key costs a sizeable share of a fitness call
+        if fitness_cache_size is None:
+            fitness_cache_size = self.DEFAULT_CACHE_SIZES[encoding]
+        self.fitness_cache = FitnessCache(fitness_cache_size) if fitness_cache_size > 0 else None
+        # Phase timers and operator counters; operators are timed every profile_every-th generation
+        self.profiler = RunProfiler(profile_every) if profile_every > 0 else None
+        # Stopping rules besides the generation count: a good-enough fitness, a
+        # wall-clock budget in seconds, and no improvement above stagnation_epsilon
+        # for stagnation_limit generations
+        self.target_fitness = target_fitness
+        self.time_budget = time_budget
+        self.stagnation_limit = stagnation_limit
+        self.stagnation_epsilon = stagnation_epsilon
+        self.stop_reason = None
+        # Share of the initial population built by the constructive seeder
+        # instead of random placement, when seeding='constructive'
+        self.seeding = seeding
+        self.seed_ratio = seed_ratio
+        # Neighbour evaluations per generation for tabu search on the elite; 0 disables
+        self.local_search_budget = local_search_budget
+        self.local_search_stats = self._empty_local_search_stats()
+        # Processes scoring populations of at least parallel_min_genes genes
+        # through shared memory; None means one per CPU, 0 or 1 never. The pool
+        # is shared by every scheduler in the process on the same grid size and
+        # outlives runs (see close)
+        self.fitness_workers = fitness_workers
+        self.parallel_min_genes = ParallelFitnessEvaluator.MIN_GENES
+        # Parent selection: 'tournament' (pressure = tournament size, default 3),
+        # 'rank' (linear ranking, pressure 1-2, default 1.5) or 'sus' (stochastic
+        # universal sampling on fitness ** pressure, default 1)
+        self.selection = selection
+        self.selection_pressure = selection_pressure
         self.mutation_rate = 0.1
         self.crossover_rate = 0.8
         self.elite_size = 2
+        # Set both rates each generation from the share of distinct chromosomes,
+        # replacing restart_fraction of the population with fresh ones when it
+        # falls below restart_threshold; rate_history records the trajectory
+        self.adaptive_rates = adaptive_rates
+        self.restart_threshold = restart_threshold
+        self.restart_fraction = restart_fraction
+        self.diversity = DiversityTracker()
+        self.rate_history = []
+        # Replace structurally identical chromosomes at each generation boundary
+        # with copies mutated clone_mutations times (fresh ones if that fails)
+        self.eliminate_clones = eliminate_clones
+        self.clone_mutations = 3
+        # Every random choice comes from rng: a private stream when seeded, so
+        # seeded runs are reproducible even with other runs in other threads,
+        # otherwise the shared random module
+        self.seed = seed
+        self.rng = random.Random(seed) if seed is not None else random
         
-        # Time slots and days
-        self.time_slots = list(range(8))  # 8 periods per day
-        self.days = list(range(5))        # 5 days per week
+        # Compiled instance: passed in (e.g. from a ProblemPool), built from the
+        # records given, or loaded from the data files
+        if problem is None:
+            if courses is not None:
+                problem = CompiledProblem(teachers or [], classrooms or [], courses, n_days, n_slots)
+            else:
+                problem = self.load_data(n_days=n_days, n_slots=n_slots)
+        self.use_problem(problem)
+
+    def use_problem(self, problem: CompiledProblem):
+        """Solve the given compiled instance from now on"""
+        self.problem = problem
+        self.teachers = problem.teachers
+        self.classrooms = problem.classrooms
+        self.courses = problem.courses
+        self.grid = problem.grid
+        self.encoder = problem.encoder
+        self.batch_evaluator = problem.batch_evaluator
+        self.index = problem.index
+        self.tabu_search = TabuSearch(problem.index, problem.grid.n_slots)
         
-        # Load data
-        self.load_data()
+        # Time slots and days
+        self.time_slots = list(range(problem.grid.n_slots))  # periods per day
+        self.days = list(range(problem.grid.n_days))         # days per week
+
+    def close(self):
+        """Stop the parallel fitness workers for this grid size, shared with other schedulers.
+
+        They otherwise keep running between runs and stop at interpreter exit;
+        the next run that needs them starts them again.
+        """
+        close_shared_evaluators(self.grid.n_days, self.grid.n_slots)
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        # The random module can't be pickled; unseeded copies use the receiving process's
+        if state.get('rng') is random:
+            state['rng'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.rng is None:
+            self.rng = random
 
-    def load_data(self):
+    def load_data(self, data_dir: str = './data', n_days: int = 5, n_slots: int = 8) -> CompiledProblem:
+        """Compile the instance in the data files, or an empty one if they are missing"""
         try:
-        # Change paths to be relative to testing directory
-            with open('./data/teachers.json', 'r') as f:
-                data = json.load(f)
-                self.teachers = data['teachers']
-                print("Loaded teachers:", len(self.teachers))
-        
-            with open('./data/classrooms.json', 'r') as f:
-                data = json.load(f)
-                self.classrooms = data['classrooms']
-                print("Loaded classrooms:", len(self.classrooms))
-            
-            with open('./data/courses.json', 'r') as f:
-                data = json.load(f)
-                self.courses = data['courses']
-                print("Loaded courses:", len(self.courses))
+            problem = CompiledProblem.from_directory(data_dir, n_days, n_slots)
+            print("Loaded teachers:", len(problem.teachers))
+            print("Loaded classrooms:", len(problem.classrooms))
+            print("Loaded courses:", len(problem.courses))
+            return problem
             
         except FileNotFoundError as e:
             print(f"Error loading data files: {e}")
             print("Current working directory:", os.getcwd())
-            self.teachers = []
-            self.classrooms = []
-            self.courses = []
+            return CompiledProblem([], [], [], n_days, n_slots)
 
-    def create_chromosome(self) -> List[Dict]:
-        """Create a single chromosome (complete timetable solution)"""
-        chromosome = []
-    
-    # Make a deep copy of courses to avoid modifying original
-        unassigned_courses = self.courses.copy()
-    
-        if not unassigned_courses:
+    def create_chromosome(self, constructive: bool = False):
+        """Create a single chromosome (complete timetable solution), randomly or constructively"""
+        if not self.courses:
             print("No courses available")
-            return chromosome
-        
-        for course in unassigned_courses:
+            return EncodedChromosome.from_rows([]) if self.encoding == 'array' else []
+
+        rows = list(self.problem.seeder.place(self.rng) if constructive else self._place_sessions())
+        if self.encoding == 'array':
+            return EncodedChromosome.from_rows(rows)
+        if self.encoding == 'compact':
+            return [Gene(*row) for row in rows]
+        return [self.encoder.decode_gene(course_idx, day, slot, teacher_idx, room_idx)
+                for course_idx, _, day, slot, teacher_idx, room_idx in rows]
+
+    def _place_sessions(self):
+        """Yield (course, session, day, slot, teacher, room) index rows for a random timetable"""
+        for course_idx, course in enumerate(self.courses):
         # Get number of sessions needed for this course
             sessions_needed = course.get('sessions_per_week', 1)
         
-            for _ in range(sessions_needed):
-            # Try different time slots and days until a valid slot is found
-                for day in random.sample(self.days, len(self.days)):
-                    for slot in random.sample(self.time_slots, len(self.time_slots)):
-                    # Get available teachers for this course
-                        available_teachers = [t for t in self.teachers 
-                                           if course['subject'] in t['subjects'] and 
-                                           t['availability'][str(day)][slot]]
-
-                    # Get suitable classrooms
-                        suitable_rooms = [c for c in self.classrooms 
-                                        if c['capacity'] >= course['students'] and
-                                        c['availability'][str(day)][slot]]
-                    
-                    # If we have both teacher and room available
-                        if available_teachers and suitable_rooms:
-                            teacher = random.choice(available_teachers)
-                            classroom = random.choice(suitable_rooms)
-                        
-                            gene = {
-                                'day': day,
-                                'time_slot': slot,
-                                'course': course,
-                                'teacher': teacher,
-                                'classroom': classroom
-                            }
-                            chromosome.append(gene)
-                        # Move to next course session
-                            break
-                    if len(chromosome) > 0 and chromosome[-1]['course'] == course:
-                        # Successfully added this session
-                        break
-                    
-        return chromosome
+            # Picking a uniform open day, then a uniform open slot on it, is
+            # what trying days and slots in random order until one fits did
+            open_days = self.index.open_slots_for(course_idx)
+            if not open_days:
+                continue
 
-    def initialize_population(self) -> List[List[Dict]]:
+            for session in range(sessions_needed):
+                day, slots = self.rng.choice(open_days)
+                slot = self.rng.choice(slots)
+                teacher_idx = self.rng.choice(self.index.free_teachers_for(course_idx, day, slot))
+                room_idx = self.rng.choice(self.index.free_rooms_for(course_idx, day, slot))
+                yield course_idx, session, day, slot, teacher_idx, room_idx
+
+    def initialize_population(self) -> List:
         """Create initial population of chromosomes"""
-        return [self.create_chromosome() for _ in range(self.population_size)]
+        constructive = round(self.population_size * self.seed_ratio) if self.seeding == 'constructive' else 0
+        return [self.create_chromosome(constructive=i < constructive)
+                for i in range(self.population_size)]
 
-    def fitness(self, chromosome: List[Dict]) -> float:
+    def decode(self, chromosome) -> List[Dict]:
+        """Return chromosome in the dict gene format, decoding array and compact chromosomes"""
+        if isinstance(chromosome, EncodedChromosome) or is_compact(chromosome):
+            return self.encoder.decode(chromosome)
+        return chromosome
+
+    def _like(self, encoded: EncodedChromosome, chromosome):
+        """encoded converted to chromosome's encoding"""
+        if isinstance(chromosome, EncodedChromosome):
+            return encoded
+        if is_compact(chromosome):
+            return self.encoder.compact(encoded)
+        return self.encoder.decode(encoded)
+
+    def fitness(self, chromosome) -> float:
         """Calculate fitness score for a chromosome"""
-        score = 0
-        conflicts = 0
-        
-        # Check for various constraints
-        for i, gene1 in enumerate(chromosome):
-            for j, gene2 in enumerate(chromosome[i+1:], i+1):
-                # Teacher collision
-                if (gene1['day'] == gene2['day'] and 
-                    gene1['time_slot'] == gene2['time_slot']):
-                    if gene1['teacher'] == gene2['teacher']:
-                        conflicts += 1
-                    if gene1['classroom'] == gene2['classroom']:
-                        conflicts += 1
-                        
-                # Teacher consecutive classes
-                if (gene1['day'] == gene2['day'] and 
-                    abs(gene1['time_slot'] - gene2['time_slot']) == 1 and
-                    gene1['teacher'] == gene2['teacher']):
-                    conflicts += 0.5
+        if isinstance(chromosome, EncodedChromosome) and self.incremental:
+            return 1 / (1 + self.occupancy(chromosome).conflicts)
+        if self.fitness_cache is None:
+            return self._score(chromosome)
+
+        key = chromosome_key(chromosome)
+        score = self.fitness_cache.get(key)
+        if score is None:
+            score = self._score(chromosome)
+            self.fitness_cache.put(key, score)
+        return score
+
+    def _score(self, chromosome) -> float:
+        """Uncached fitness of a chromosome"""
+        if isinstance(chromosome, EncodedChromosome):
+            return float(self.batch_evaluator.fitness(stack_population([chromosome]))[0])
+
+        # Bucket genes by occupied cell instead of comparing every pair
+        if is_compact(chromosome):
+            teacher_cells = Counter((gene.teacher, gene.day, gene.slot) for gene in chromosome)
+            room_cells = Counter((gene.room, gene.day, gene.slot) for gene in chromosome)
+        else:
+            teacher_cells = Counter((gene['teacher']['id'], gene['day'], gene['time_slot'])
+                                    for gene in chromosome)
+            room_cells = Counter((gene['classroom']['id'], gene['day'], gene['time_slot'])
+                                 for gene in chromosome)
+
+        # Teacher and room collisions: k genes in one cell are k*(k-1)/2 pairs
+        conflicts = sum(k * (k - 1) // 2 for k in teacher_cells.values())
+        conflicts += sum(k * (k - 1) // 2 for k in room_cells.values())
+
+        # Teacher consecutive classes: pairs in neighbouring slots of the same day
+        for (teacher_id, day, slot), k in teacher_cells.items():
+            conflicts += 0.5 * k * teacher_cells.get((teacher_id, day, slot + 1), 0)
         
         # Calculate final fitness score
         score = 1 / (1 + conflicts)
         return score
 
-    def select_parents(self, population: List[List[Dict]], fitness_scores: List[float]) -> Tuple[List[Dict], List[Dict]]:
-        """Select parents using tournament selection"""
-        tournament_size = 3
-        parent1 = max(random.sample(list(zip(population, fitness_scores)), tournament_size), 
-                     key=lambda x: x[1])[0]
-        parent2 = max(random.sample(list(zip(population, fitness_scores)), tournament_size), 
-                     key=lambda x: x[1])[0]
-        return parent1, parent2
+    def occupancy(self, chromosome: EncodedChromosome) -> OccupancyState:
+        """Occupancy counters of a chromosome, rebuilt in full only when it has none (e.g. crossover children)"""
+        if chromosome.state is None:
+            chromosome.state = OccupancyState.build(chromosome, len(self.teachers),
+                                                    len(self.classrooms), len(self.days),
+                                                    len(self.time_slots))
+        return chromosome.state
+
+    def parallel_evaluator(self, population: List):
+        """The shared-memory worker pool if population is large enough to gain from it, else None"""
+        workers = self.fitness_workers if self.fitness_workers is not None else (os.cpu_count() or 1)
+        if workers < 2 or sum(len(chrom) for chrom in population) < self.parallel_min_genes:
+            return None
+        return shared_evaluator(self.grid.n_days, self.grid.n_slots, workers)
 
-    def crossover(self, parent1: List[Dict], parent2: List[Dict]) -> Tuple[List[Dict], List[Dict]]:
+    def evaluate_population(self, population: List) -> List[float]:
+        """Calculate fitness for every chromosome, in one vectorized pass for the batch engine.
+
+        Large populations are scored on worker processes instead, whichever
+        engine is configured, as both give the same scores.
+        """
+        if self.incremental:
+            return [self.fitness(chrom) for chrom in population]
+        parallel = self.parallel_evaluator(population)
+        if parallel is None and self.fitness_engine != 'batch':
+            return [self.fitness(chrom) for chrom in population]
+        evaluator = parallel or self.batch_evaluator
+
+        # Only chromosomes missing from the cache go through the batch evaluator
+        scores = [None] * len(population)
+        keys = [None] * len(population)
+        if self.fitness_cache is not None:
+            keys = [chromosome_key(chrom) for chrom in population]
+            scores = [self.fitness_cache.get(key) for key in keys]
+        pending = [i for i, score in enumerate(scores) if score is None]
+        if pending:
+            encoded = [population[i] if isinstance(population[i], EncodedChromosome)
+                       else self.encoder.encode(population[i]) for i in pending]
+            for i, score in zip(pending, evaluator.fitness(stack_population(encoded)).tolist()):
+                scores[i] = score
+                if self.fitness_cache is not None:
+                    self.fitness_cache.put(keys[i], score)
+        return scores
+
+    # Rate bounds for adaptive_rates: mutation rises and crossover falls as diversity drops
+    MUTATION_RANGE = (0.05, 0.5)
+    CROSSOVER_RANGE = (0.6, 0.95)
+    # Per-generation stats kept in rate_history under adaptive_rates
+    RATE_KEYS = ('generation', 'distinct', 'mutation_rate', 'crossover_rate', 'restarted')
+
+    def adapt_rates(self, diversity: float):
+        """Set mutation and crossover rates for a population with the given distinct share"""
+        low, high = self.MUTATION_RANGE
+        self.mutation_rate = high - (high - low) * diversity
+        low, high = self.CROSSOVER_RANGE
+        self.crossover_rate = low + (high - low) * diversity
+
+    def restart(self, population: List) -> List:
+        """Replace the tail of a bred population, past the elite, with new chromosomes"""
+        keep = max(self.elite_size, len(population) - round(len(population) * self.restart_fraction))
+        return population[:keep] + [self.create_chromosome(constructive=self.seeding == 'constructive')
+                                    for _ in range(len(population) - keep)]
+
+    def replace_clones(self, population: List, keys: List[bytes]) -> Tuple[List, int]:
+        """Population with every repeat of an earlier chromosome replaced, and the number replaced"""
+        seen = set()
+        unique = []
+        replaced = 0
+        for chrom, key in zip(population, keys):
+            if key in seen:
+                chrom, key = self._distinct_variant(chrom, seen)
+                replaced += 1
+            seen.add(key)
+            unique.append(chrom)
+        return unique, replaced
+
+    def _distinct_variant(self, chromosome, seen: set) -> Tuple[object, bytes]:
+        """A heavily mutated copy whose key is not in seen, or a fresh chromosome"""
+        if len(chromosome):
+            for _ in range(3):
+                variant = chromosome
+                for _ in range(self.clone_mutations):
+                    variant = self.mutate_once(variant)
+                key = chromosome_key(variant)
+                if key not in seen:
+                    return variant, key
+        fresh = self.create_chromosome(constructive=self.seeding == 'constructive')
+        return fresh, chromosome_key(fresh)
+
+    def select_parent_pairs(self, fitness_scores: List[float], n_pairs: int) -> np.ndarray:
+        """(n_pairs, 2) population indices of parents, drawn for a whole generation in one go"""
+        select, default_pressure = SCHEMES[self.selection]
+        pressure = self.selection_pressure if self.selection_pressure is not None else default_pressure
+        # Seeded from the scheduler's random stream, so seeded runs stay reproducible
+        rng = np.random.default_rng(self.rng.getrandbits(64))
+        chosen = select(np.asarray(fitness_scores, dtype=float), 2 * n_pairs, pressure, rng)
+        return chosen.reshape(n_pairs, 2)
+
+    def select_parents(self, population: List, fitness_scores: List[float]) -> Tuple:
+        """Select one pair of parents with the configured selection scheme"""
+        first, second = self.select_parent_pairs(fitness_scores, 1)[0]
+        return population[first], population[second]
+
+    def crossover(self, parent1, parent2) -> Tuple:
         """Perform crossover between parents using adaptive crossover point"""
-        if random.random() > self.crossover_rate or not parent1 or not parent2:
-            return parent1, parent2
-        
-    # Add safety check
-        if len(parent1) == 0 or len(parent2) == 0:
+        if self.rng.random() > self.crossover_rate or not len(parent1) or not len(parent2):
             return parent1, parent2
 
+        if self.crossover_method == 'uniform':
+            return self._uniform_crossover(parent1, parent2)
+        if self.crossover_method == 'segment':
+            return self._segment_crossover(parent1, parent2)
+
     # Find adaptive crossover point based on fitness contribution
-        fitness_contributions = []
-        for i in range(max(1, len(parent1))):
-            temp_child = parent1[:i] + parent2[i:]
-            fitness_contributions.append(self.fitness(temp_child))
-        
-    # Add safety check for empty fitness_contributions
-        if not fitness_contributions:
-            return parent1, parent2
-        
-        crossover_point = fitness_contributions.index(max(fitness_contributions))
+        crossover_point = self.best_crossover_point(parent1, parent2)
+
+        if isinstance(parent1, EncodedChromosome):
+            return (parent1.splice(parent2, crossover_point),
+                    parent2.splice(parent1, crossover_point))
     
         child1 = parent1[:crossover_point] + parent2[crossover_point:]
         child2 = parent2[:crossover_point] + parent1[crossover_point:]
     
         return child1, child2
 
-    def mutate(self, chromosome: List[Dict]) -> List[Dict]:
+    def _gene_cells(self, chromosome) -> List[Tuple[int, int, int, int]]:
+        """(day, slot, teacher, room) index tuple of every gene"""
+        if isinstance(chromosome, EncodedChromosome):
+            return list(zip(chromosome.day.tolist(), chromosome.slot.tolist(),
+                            chromosome.teacher.tolist(), chromosome.room.tolist()))
+        if is_compact(chromosome):
+            return [(gene.day, gene.slot, gene.teacher, gene.room) for gene in chromosome]
+        return [(gene['day'], gene['time_slot'],
+                 self.encoder.teacher_index[gene['teacher']['id']],
+                 self.encoder.room_index[gene['classroom']['id']]) for gene in chromosome]
+
+    def best_crossover_point(self, parent1, parent2) -> int:
+        """Cut point i giving the fittest parent1[:i] + parent2[i:], found in one sweep.
+
+        Starts from the counters of parent2 alone (i = 0) and moves the cut
+        right one gene at a time, so every candidate costs one delta update
+        instead of a full fitness evaluation of a materialized child.
+        """
+        encoded = parent2 if isinstance(parent2, EncodedChromosome) else self.encoder.encode(parent2)
+        state = OccupancyState.build(encoded, len(self.teachers), len(self.classrooms),
+                                     len(self.days), len(self.time_slots))
+        cells1, cells2 = self._gene_cells(parent1), self._gene_cells(parent2)
+
+        best_point, best_conflicts = 0, state.conflicts
+        for i in range(1, len(cells1)):
+            # Gene i-1 switches from parent2's to parent1's
+            if i - 1 < len(cells2):
+                state.remove(*cells2[i - 1])
+            state.add(*cells1[i - 1])
+            if state.conflicts < best_conflicts:
+                best_point, best_conflicts = i, state.conflicts
+        return best_point
+
+    def _uniform_mask(self, n_genes: int) -> np.ndarray:
+        """One fair coin flip per gene, drawn from the scheduler's random stream in a single call"""
+        n_bytes = (n_genes + 7) // 8
+        bits = self.rng.getrandbits(n_bytes * 8).to_bytes(n_bytes, 'little')
+        return np.unpackbits(np.frombuffer(bits, dtype=np.uint8))[:n_genes].astype(bool)
+
+    def _uniform_crossover(self, parent1, parent2) -> Tuple:
+        """Swap each aligned gene between the parents with probability 0.5"""
+        n_genes = min(len(parent1), len(parent2))
+        take = self._uniform_mask(n_genes)
+
+        if isinstance(parent1, EncodedChromosome):
+            child1, child2 = parent1.copy(), parent2.copy()
+            child1.state = child2.state = None
+            for col1, col2 in zip(child1.columns(), child2.columns()):
+                swapped = col1[:n_genes][take]
+                col1[:n_genes][take] = col2[:n_genes][take]
+                col2[:n_genes][take] = swapped
+            return child1, child2
+
+        take = take.tolist()
+        child1 = [g2 if t else g1 for g1, g2, t in zip(parent1, parent2, take)]
+        child2 = [g1 if t else g2 for g1, g2, t in zip(parent1, parent2, take)]
+        child1.extend(parent1[n_genes:])
+        child2.extend(parent2[n_genes:])
+        return child1, child2
+
+    def _segment_crossover(self, parent1, parent2) -> Tuple:
+        """Exchange one random contiguous segment of aligned genes"""
+        n_genes = min(len(parent1), len(parent2))
+        start, end = sorted(self.rng.sample(range(n_genes + 1), 2)) if n_genes else (0, 0)
+
+        if isinstance(parent1, EncodedChromosome):
+            child1, child2 = parent1.copy(), parent2.copy()
+            child1.state = child2.state = None
+            for col1, col2 in zip(child1.columns(), child2.columns()):
+                col1[start:end], col2[start:end] = col2[start:end].copy(), col1[start:end].copy()
+            return child1, child2
+
+        child1 = parent1.copy()
+        child2 = parent2.copy()
+        child1[start:end], child2[start:end] = parent2[start:end], parent1[start:end]
+        return child1, child2
+
+    def mutate(self, chromosome):
         """Perform mutation on chromosome"""
-        if random.random() > self.mutation_rate or not chromosome:
+        if self.rng.random() > self.mutation_rate or not len(chromosome):
             return chromosome
+        return self.mutate_once(chromosome)
+
+    def mutate_once(self, chromosome):
+        """Copy of a non-empty chromosome with one random gene changed"""
+        if isinstance(chromosome, EncodedChromosome):
+            return self._mutate_encoded(chromosome)
+        if is_compact(chromosome):
+            return self._mutate_compact(chromosome)
         
         mutated = chromosome.copy()
     # Safety check for empty chromosome
         if not mutated:
             return mutated
         
-        gene_idx = random.randrange(len(mutated))
+        gene_idx = self.rng.randrange(len(mutated))
     
     # Randomly choose mutation type
-        mutation_type = random.choice(['swap_time', 'swap_teacher', 'swap_room'])
+        mutation_type = self.rng.choice(['swap_time', 'swap_teacher', 'swap_room'])
     
         try:
+            # The gene dict is shared with the parent, so replace it rather than edit it
             if mutation_type == 'swap_time':
-                new_day = random.choice(self.days)
-                new_slot = random.choice(self.time_slots)
-                mutated[gene_idx]['day'] = new_day
-                mutated[gene_idx]['time_slot'] = new_slot
+                new_day = self.rng.choice(self.days)
+                new_slot = self.rng.choice(self.time_slots)
+                mutated[gene_idx] = dict(mutated[gene_idx], day=new_day, time_slot=new_slot)
             
             elif mutation_type == 'swap_teacher':
-                course = mutated[gene_idx]['course']
-                available_teachers = [t for t in self.teachers 
-                                   if course['subject'] in t['subjects']]
+                course_idx = self.encoder.course_index[mutated[gene_idx]['course']['id']]
+                available_teachers = self.index.teachers_for(course_idx)
                 if available_teachers:
-                    mutated[gene_idx]['teacher'] = random.choice(available_teachers)
+                    mutated[gene_idx] = dict(mutated[gene_idx],
+                                             teacher=self.teachers[self.rng.choice(available_teachers)])
                 
             else:  # swap_room
-                course = mutated[gene_idx]['course']
-                available_rooms = [c for c in self.classrooms 
-                                 if c['capacity'] >= course['students']]
+                course_idx = self.encoder.course_index[mutated[gene_idx]['course']['id']]
+                available_rooms = self.index.rooms_for(course_idx)
                 if available_rooms:
-                    mutated[gene_idx]['classroom'] = random.choice(available_rooms)
+                    mutated[gene_idx] = dict(mutated[gene_idx],
+                                             classroom=self.classrooms[self.rng.choice(available_rooms)])
                 
         except (IndexError, KeyError) as e:
             print(f"Error in mutation: {e}")
@@ -202,51 +526,430 @@ class AGADRScheduler:
                 
         return mutated
 
-    def evolve(self) -> List[Dict]:
-        """Main evolution process"""
-        population = self.initialize_population()
-        
-        for generation in range(self.generations):
-            # Calculate fitness for entire population
-            fitness_scores = [self.fitness(chrom) for chrom in population]
-            
-            # Sort population by fitness
-            population = [x for _, x in sorted(zip(fitness_scores, population), 
-                                            key=lambda pair: pair[0], 
-                                            reverse=True)]
+    def _mutate_encoded(self, chromosome: EncodedChromosome) -> EncodedChromosome:
+        mutated = chromosome.copy()
+        gene_idx = self.rng.randrange(len(mutated))
+        mutation_type = self.rng.choice(['swap_time', 'swap_teacher', 'swap_room'])
+        course_idx = int(mutated.course[gene_idx])
+        day, slot, teacher, room = (int(mutated.day[gene_idx]), int(mutated.slot[gene_idx]),
+                                    int(mutated.teacher[gene_idx]), int(mutated.room[gene_idx]))
+
+        if mutation_type == 'swap_time':
+            day = self.rng.choice(self.days)
+            slot = self.rng.choice(self.time_slots)
+        elif mutation_type == 'swap_teacher':
+            available_teachers = self.index.teachers_for(course_idx)
+            if available_teachers:
+                teacher = self.rng.choice(available_teachers)
+        else:  # swap_room
+            available_rooms = self.index.rooms_for(course_idx)
+            if available_rooms:
+                room = self.rng.choice(available_rooms)
+
+        self.move_gene(mutated, gene_idx, day, slot, teacher, room)
+        return mutated
+
+    def _mutate_compact(self, chromosome: List[Gene]) -> List[Gene]:
+        """Copy of the gene list with one gene replaced; the other genes stay shared"""
+        mutated = list(chromosome)
+        gene_idx = self.rng.randrange(len(mutated))
+        gene = mutated[gene_idx]
+        mutation_type = self.rng.choice(['swap_time', 'swap_teacher', 'swap_room'])
+
+        if mutation_type == 'swap_time':
+            gene = gene._replace(day=self.rng.choice(self.days), slot=self.rng.choice(self.time_slots))
+        elif mutation_type == 'swap_teacher':
+            available_teachers = self.index.teachers_for(gene.course)
+            if available_teachers:
+                gene = gene._replace(teacher=self.rng.choice(available_teachers))
+        else:  # swap_room
+            available_rooms = self.index.rooms_for(gene.course)
+            if available_rooms:
+                gene = gene._replace(room=self.rng.choice(available_rooms))
+
+        mutated[gene_idx] = gene
+        return mutated
+
+    def move_gene(self, chromosome: EncodedChromosome, gene_idx: int,
+                  day: int, slot: int, teacher: int, room: int):
+        """Reassign one gene, updating the chromosome's occupancy counters if it carries them"""
+        if chromosome.state is not None:
+            old = (int(chromosome.day[gene_idx]), int(chromosome.slot[gene_idx]),
+                   int(chromosome.teacher[gene_idx]), int(chromosome.room[gene_idx]))
+            chromosome.state.move(old, (day, slot, teacher, room))
+        chromosome.day[gene_idx] = day
+        chromosome.slot[gene_idx] = slot
+        chromosome.teacher[gene_idx] = teacher
+        chromosome.room[gene_idx] = room
+
+    def next_generation(self, population: List, fitness_scores: List[float]) -> List:
+        """Breed the next population from a scored one, keeping the elite first"""
+        # Sort population by fitness, keeping the scores aligned for selection
+        ranked = sorted(zip(fitness_scores, population), key=lambda pair: pair[0], reverse=True)
+        fitness_scores = [score for score, _ in ranked]
+        population = [chrom for _, chrom in ranked]
             
-            # Keep elite chromosomes
-            new_population = population[:self.elite_size]
+        # Keep elite chromosomes, polished by local search when it has a budget
+        new_population = population[:self.elite_size]
+        if self.local_search_budget and new_population:
+            budget = max(1, self.local_search_budget // len(new_population))
+            new_population = [self.improve(chrom, budget) for chrom in new_population]
             
-            # Generate new population
-            while len(new_population) < self.population_size:
-                parent1, parent2 = self.select_parents(population, fitness_scores)
-                child1, child2 = self.crossover(parent1, parent2)
+        # Generate new population from parent pairs selected all at once
+        profiler = self.profiler
+        started = time.perf_counter()
+        n_pairs = max(0, self.population_size - len(new_population) + 1) // 2
+        pairs = self.select_parent_pairs(fitness_scores, n_pairs).tolist() if n_pairs else []
+        if profiler is not None and profiler.sampling:
+            profiler.seconds['selection'] += time.perf_counter() - started
+            return self._breed_profiled(population, fitness_scores, new_population, pairs)
+        for first, second in pairs:
+            child1, child2 = self.crossover(population[first], population[second])
                 
-                child1 = self.mutate(child1)
-                child2 = self.mutate(child2)
+            child1 = self.mutate(child1)
+            child2 = self.mutate(child2)
                 
-                new_population.extend([child1, child2])
-            
-            population = new_population[:self.population_size]
+            new_population.extend([child1, child2])
             
-            # Print progress
+        return new_population[:self.population_size]
+
+    @staticmethod
+    def _empty_local_search_stats() -> Dict:
+        return {'calls': 0, 'evaluations': 0, 'moves': 0, 'improved': 0, 'fitness_gain': 0.0}
+
+    def improve(self, chromosome, budget: int):
+        """Tabu-search a copy of a chromosome for up to budget neighbour evaluations.
+
+        Returns the chromosome itself when the search found nothing better,
+        otherwise the improved copy in the same encoding.
+        """
+        encoded = chromosome.copy() if isinstance(chromosome, EncodedChromosome) else self.encoder.encode(chromosome)
+        state = self.occupancy(encoded)
+        before = state.conflicts
+        evaluated, moves = self.tabu_search.improve(encoded, state, budget, self.rng)
+
+        stats = self.local_search_stats
+        stats['calls'] += 1
+        stats['evaluations'] += evaluated
+        stats['moves'] += moves
+        if self.profiler is not None:
+            self.profiler.counters['local_search_evaluations'] += evaluated
+        if state.conflicts >= before:
+            return chromosome
+        stats['improved'] += 1
+        stats['fitness_gain'] += 1 / (1 + state.conflicts) - 1 / (1 + before)
+
+        if not self.incremental:
+            encoded.state = None
+        return self._like(encoded, chromosome)
+
+    def _breed_profiled(self, population: List, fitness_scores: List[float],
+                        new_population: List, pairs: List[List[int]]) -> List:
+        """next_generation's breeding loop with per-operator timers and lineage for the profiler"""
+        profiler = self.profiler
+        clock = time.perf_counter
+        lineage = [None] * len(new_population)
+        for first, second in pairs:
+            parent1, parent2 = population[first], population[second]
+            selected = clock()
+            child1, child2 = self.crossover(parent1, parent2)
+            crossed = clock()
+            mutated1 = self.mutate(child1)
+            mutated2 = self.mutate(child2)
+            profiler.seconds['crossover'] += crossed - selected
+            profiler.seconds['mutation'] += clock() - crossed
+
+            parent_best = max(fitness_scores[first], fitness_scores[second])
+            crossed_over = child1 is not parent1
+            for child, mutated in ((child1, mutated1), (child2, mutated2)):
+                operators = (('crossover',) if crossed_over else ()) + \
+                            (('mutation',) if mutated is not child else ())
+                profiler.counters.update(operators)
+                lineage.append((parent_best, operators) if operators else None)
+            new_population.extend([mutated1, mutated2])
+
+        profiler.lineage = lineage[:self.population_size]
+        return new_population[:self.population_size]
+
+    def evolution(self, time_budget: float = None) -> Iterator[Tuple[Dict, object]]:
+        """Run the GA one generation at a time, yielding (stats, best chromosome so far).
+
+        Stats hold the generation number, best and mean fitness, diversity
+        (share of distinct fitness values, a cheap proxy for distinct
+        chromosomes) and seconds elapsed since the run started, plus the
+        fitness local search added to the elite when it is on, and the
+        distinct-chromosome share, operator rates and whether the population
+        was partially restarted under adaptive_rates, and the number of
+        clones replaced under eliminate_clones. When the run
+        ends by itself, stop_reason says which rule ended it: 'target_reached',
+        'time_budget', 'stagnation' or 'generations'. time_budget overrides
+        the scheduler's for this run; it is checked between generations.
+        """
+        started = time.perf_counter()
+        time_budget = time_budget if time_budget is not None else self.time_budget
+        deadline = started + time_budget if time_budget is not None else None
+        self.stop_reason = None
+        self.local_search_stats = self._empty_local_search_stats()
+        self.diversity.reset()
+        self.rate_history = []
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.reset(self.fitness_cache.stats() if self.fitness_cache is not None else None)
+        population = self.initialize_population()
+        if profiler is not None:
+            profiler.seconds['initialization'] += time.perf_counter() - started
+
+        best_seen, stale = float('-inf'), 0
+        for generation in range(self.generations):
+            population, fitness_scores, extras = self.step(generation, population)
             best_fitness = max(fitness_scores)
-            print(f"Generation {generation}: Best Fitness = {best_fitness}")
-            
+            stats = {
+                'generation': generation,
+                'best_fitness': best_fitness,
+                'mean_fitness': sum(fitness_scores) / len(fitness_scores),
+                'diversity': len(set(fitness_scores)) / len(fitness_scores),
+                'elapsed': time.perf_counter() - started
+            }
+            stats.update(extras)
+            if self.adaptive_rates:
+                self.rate_history.append({key: extras[key] for key in self.RATE_KEYS})
+            if self.verbose:
+                print(f"Generation {generation}: Best Fitness = {best_fitness}")
+            yield stats, population[0]
+        
             # Convergence check
-            if best_fitness > 0.95:
+            if best_fitness > self.target_fitness:
+                self.stop_reason = 'target_reached'
+                return
+            if best_fitness > best_seen + self.stagnation_epsilon:
+                best_seen, stale = best_fitness, 0
+            else:
+                stale += 1
+            if self.stagnation_limit is not None and stale >= self.stagnation_limit:
+                self.stop_reason = 'stagnation'
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                self.stop_reason = 'time_budget'
+                return
+        self.stop_reason = 'generations'
+
+    def step(self, generation: int, population: List) -> Tuple[List, List[float], Dict]:
+        """Score a population and breed the next one, applying adaptive_rates and eliminate_clones.
+
+        Returns the bred population, the scores of the one given and the
+        stats those options add to evolution's (see there).
+        """
+        profiler = self.profiler
+        gain = self.local_search_stats['fitness_gain']
+        if self.adaptive_rates or self.eliminate_clones:
+            keys = self.diversity.keys(population)
+            distinct = len(set(keys)) / len(keys)
+        if self.adaptive_rates:
+            self.adapt_rates(distinct)
+        if self.eliminate_clones:
+            population, clones = self.replace_clones(population, keys)
+            if profiler is not None:
+                profiler.counters['clones_eliminated'] += clones
+        if profiler is None:
+            fitness_scores = self.evaluate_population(population)
+            population = self.next_generation(population, fitness_scores)
+        else:
+            population, fitness_scores = self._profiled_generation(generation, population)
+        restarted = self.adaptive_rates and distinct < self.restart_threshold
+        if restarted:
+            population = self.restart(population)
+
+        extras = {}
+        if self.local_search_budget:
+            extras['local_search_gain'] = self.local_search_stats['fitness_gain'] - gain
+        if self.eliminate_clones:
+            extras['clones_eliminated'] = clones
+        if self.adaptive_rates:
+            extras.update({'generation': generation, 'distinct': distinct,
+                           'mutation_rate': self.mutation_rate,
+                           'crossover_rate': self.crossover_rate, 'restarted': restarted})
+        return population, fitness_scores, extras
+
+    def _profiled_generation(self, generation: int, population: List) -> Tuple[List, List[float]]:
+        """One evolution step, timing fitness and breeding and counting operator use"""
+        profiler = self.profiler
+        profiler.start_generation(generation)
+        started = time.perf_counter()
+        fitness_scores = self.evaluate_population(population)
+        evaluated = time.perf_counter()
+        profiler.credit(fitness_scores)
+        next_population = self.next_generation(population, fitness_scores)
+        bred = time.perf_counter()
+
+        profiler.seconds['fitness'] += evaluated - started
+        profiler.breeding_seconds += bred - evaluated
+        if profiler.sampling:
+            profiler.sampled_breeding_seconds += bred - evaluated
+            profiler.sampled_generations += 1
+        profiler.generations += 1
+        profiler.counters['evaluations'] += len(population)
+        return next_population, fitness_scores
+
+    def run_report(self) -> Dict:
+        """Profile of the last evolution run, with its rate trajectory under adaptive_rates, or None when profiling is off"""
+        if self.profiler is None:
+            return None
+        report = self.profiler.report(self.fitness_cache.stats() if self.fitness_cache is not None else None)
+        if self.adaptive_rates:
+            report['rates'] = list(self.rate_history)
+        return report
+
+    def evolve(self, callback: Callable[[Dict], bool] = None, time_budget: float = None):
+        """Main evolution process.
+
+        callback, if given, receives each generation's stats and can stop
+        the run early by returning False (stop_reason 'callback').
+        """
+        best, stats = None, None
+        for stats, best in self.evolution(time_budget):
+            if callback is not None and callback(stats) is False:
+                self.stop_reason = 'callback'
                 break
-                
-        return population[0]  # Return best solution
+        if stats is not None:
+            print(f"Finished after {stats['generation'] + 1} generations ({self.stop_reason}): "
+                  f"Best Fitness = {stats['best_fitness']}")
+        return best  # Return best solution
+
+    def solve(self, callback: Callable[[Dict], bool] = None, time_budget: float = None) -> Dict:
+        """Best-so-far timetable together with why and when the run stopped"""
+        last = {}
+
+        def track(stats: Dict):
+            last.update(stats)
+            return callback(stats) if callback is not None else None
+
+        best = self.evolve(track, time_budget)
+        return {
+            'timetable': self.format_timetable(best) if best is not None else None,
+            'stop_reason': self.stop_reason,
+            'generations': last['generation'] + 1 if last else 0,
+            'best_fitness': last.get('best_fitness'),
+            'elapsed': last.get('elapsed'),
+            'local_search': dict(self.local_search_stats) if self.local_search_budget else None,
+            'rates': list(self.rate_history) if self.adaptive_rates else None
+        }
+
+    def apply_changes(self, changes: Dict):
+        """Switch to a copy of the problem with field updates applied.
+
+        changes maps 'teachers', 'classrooms' or 'courses' to {id: {field: new value}},
+        e.g. {'teachers': {3: {'availability': {...}}}, 'courses': {7: {'students': 45}}}.
+        The current problem is left untouched, as other schedulers may share it.
+        """
+        self.use_problem(self.problem.with_changes(changes))
+
+    def repair(self, solution, changes: Dict = None, passes: int = 2) -> Tuple[object, Dict]:
+        """Adapt an existing timetable to a change set, moving as few sessions as possible.
+
+        Only sessions whose teacher or room can no longer take them are
+        re-placed, each at the conflict-cheapest allowed (day, slot,
+        teacher, room), preferring to keep its current day, slot, teacher
+        and room. Returns the repaired solution, in the same encoding as the
+        one passed in, and a report with the number of assignments moved.
+        """
+        started = time.perf_counter()
+        if changes:
+            self.apply_changes(changes)
+        encoded = solution.copy() if isinstance(solution, EncodedChromosome) else self.encoder.encode(solution)
+        original = encoded.copy()
+        state = self.occupancy(encoded)
+        conflicts_before = state.conflicts
+
+        affected = [i for i in range(len(encoded)) if not self._placement_allowed(encoded, i)]
+        unplaceable = 0
+        for _ in range(passes):
+            moved_this_pass = 0
+            unplaceable = 0
+            for gene_idx in affected:
+                placement = self.best_placement(encoded, gene_idx, original)
+                if placement is None:
+                    unplaceable += 1
+                elif placement != self.cell_of(encoded, gene_idx):
+                    self.move_gene(encoded, gene_idx, *placement)
+                    moved_this_pass += 1
+            if not moved_this_pass:
+                break
+
+        moved = int(((encoded.day != original.day) | (encoded.slot != original.slot) |
+                     (encoded.teacher != original.teacher) | (encoded.room != original.room)).sum())
+        report = {
+            'affected': len(affected),
+            'moved': moved,
+            'unplaceable': unplaceable,
+            'conflicts_before': conflicts_before,
+            'conflicts_after': state.conflicts,
+            'fitness': 1 / (1 + state.conflicts),
+            'elapsed': time.perf_counter() - started
+        }
+        if not self.incremental:
+            encoded.state = None
+        return self._like(encoded, solution), report
+
+    @staticmethod
+    def cell_of(chromosome: EncodedChromosome, gene_idx: int) -> Tuple[int, int, int, int]:
+        """A gene's current (day, slot, teacher, room)"""
+        return (int(chromosome.day[gene_idx]), int(chromosome.slot[gene_idx]),
+                int(chromosome.teacher[gene_idx]), int(chromosome.room[gene_idx]))
+
+    def _placement_allowed(self, chromosome: EncodedChromosome, gene_idx: int) -> bool:
+        """Whether a gene's teacher and room are still qualified, large enough and free"""
+        course_idx, day, slot = (int(chromosome.course[gene_idx]), int(chromosome.day[gene_idx]),
+                                 int(chromosome.slot[gene_idx]))
+        return (int(chromosome.teacher[gene_idx]) in self.index.free_teachers_for(course_idx, day, slot) and
+                int(chromosome.room[gene_idx]) in self.index.free_rooms_for(course_idx, day, slot))
+
+    def best_placement(self, chromosome: EncodedChromosome, gene_idx: int,
+                       original: EncodedChromosome):
+        """Cheapest allowed (day, slot, teacher, room) for one gene, or None if there is none.
+
+        Candidates are ranked by the conflicts they would add, then by how
+        many of the original day/slot, teacher and room they change, then
+        randomly. chromosome must carry its occupancy counters; original is
+        the timetable whose placement of the gene should be kept if it can
+        (pass chromosome itself to prefer the current one).
+        """
+        state = chromosome.state
+        course_idx = int(chromosome.course[gene_idx])
+        current = self.cell_of(chromosome, gene_idx)
+        home = self.cell_of(original, gene_idx)
+
+        # Score candidates against the timetable without this gene in it
+        state.remove(*current)
+        best, best_rank = None, None
+        for day, slots in self.index.open_slots_for(course_idx):
+            for slot in slots:
+                teacher = min(self.index.free_teachers_for(course_idx, day, slot),
+                              key=lambda t: (state.teacher_counts[t, day, slot] +
+                                             0.5 * state.neighbours(t, day, slot), t != home[2]))
+                room = min(self.index.free_rooms_for(course_idx, day, slot),
+                           key=lambda r: (state.room_counts[r, day, slot], r != home[3]))
+                cost = (int(state.teacher_counts[teacher, day, slot]) +
+                        int(state.room_counts[room, day, slot]) +
+                        0.5 * state.neighbours(teacher, day, slot))
+                displacement = ((day, slot) != home[:2]) + (teacher != home[2]) + (room != home[3])
+                rank = (cost, displacement, self.rng.random())
+                if best_rank is None or rank < best_rank:
+                    best, best_rank = (day, slot, teacher, room), rank
+        state.add(*current)
+        return best
 
     def is_teacher_available(self, teacher: Dict, day: int, slot: int) -> bool:
         """Check if teacher is available at given time"""
-        return teacher['availability'][day][slot]
+        return self.grid.is_free(self.grid.mask_of(teacher), day, slot)
 
-    def generate_timetable(self) -> Dict:
+    def generate_timetable(self, callback: Callable[[Dict], bool] = None,
+                           time_budget: float = None) -> Dict:
         """Generate and format timetable for display"""
-        solution = self.evolve()
+        return self.format_timetable(self.evolve(callback, time_budget))
+
+    def format_timetable(self, solution) -> Dict:
+        """Lay a solution out as a day -> slot -> class grid"""
+        solution = self.decode(solution)
         timetable = {day: {slot: None for slot in self.time_slots} 
                     for day in self.days}
         
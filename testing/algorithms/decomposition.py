@@ -0,0 +1,328 @@
+# testing/algorithms/decomposition.py
+
+import os
+import copy
+import time
+import random
+import multiprocessing
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Callable, List, Dict, Optional, Tuple
+from .encoding import EncodedChromosome
+from .diversity import DiversityTracker
+from .fitness_cache import FitnessCache
+from .problem import CompiledProblem
+from .profiling import RunProfiler
+
+
+def course_components(problem: CompiledProblem) -> List[List[int]]:
+    """Groups of course indices that can share a teacher, largest first.
+
+    Courses are linked when some teacher is qualified for both, i.e. the
+    connected components of the teacher-sharing graph. Rooms are left out:
+    any course fits the largest rooms, so they would link everything.
+    """
+    parent = list(range(len(problem.courses)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    def union(a, b):
+        parent[find(a)] = find(b)
+
+    by_subject = {}
+    for i, course in enumerate(problem.courses):
+        by_subject.setdefault(course['subject'], []).append(i)
+    for courses in by_subject.values():
+        for i in courses[1:]:
+            union(courses[0], i)
+    for teacher in problem.teachers:
+        taught = [by_subject[s][0] for s in teacher['subjects'] if s in by_subject]
+        for i in taught[1:]:
+            union(taught[0], i)
+
+    groups = {}
+    for i in range(len(problem.courses)):
+        groups.setdefault(find(i), []).append(i)
+    return sorted(groups.values(), key=len, reverse=True)
+
+
+def allot_rooms(problem: CompiledProblem, groups: List[List[int]]) -> List[List[int]]:
+    """Split the classrooms between course groups, so separately solved parts can't clash in a room.
+
+    Rooms go out largest first, each to the group with the most sessions
+    still uncovered that can use it, with the group's largest class served
+    first. A group then keeps every room it needs for its largest class
+    even if that room went to another group.
+    """
+    index = problem.index
+    sessions = [sum(problem.courses[c].get('sessions_per_week', 1) for c in group) for group in groups]
+    largest = [max(problem.courses[c]['students'] for c in group) for group in groups]
+    allotted = [[] for _ in groups]
+    served = [0.0] * len(groups)
+    for room in reversed(index.rooms_by_capacity):
+        capacity = problem.classrooms[room]['capacity']
+        users = [g for g in range(len(groups)) if sessions[g]]
+        if not users:
+            break
+        # Groups whose largest class still lacks a room come first
+        unmet = [g for g in users if not allotted[g] and largest[g] <= capacity]
+        g = max(unmet or users, key=lambda g: (sessions[g] - served[g]) / sessions[g])
+        allotted[g].append(room)
+        served[g] += problem.grid.n_days * problem.grid.n_slots
+    for g, group in enumerate(groups):
+        for c in group:
+            if not any(problem.classrooms[r]['capacity'] >= problem.courses[c]['students']
+                       for r in allotted[g]):
+                fitting = index.rooms_for(c)
+                if fitting:
+                    allotted[g].append(fitting[0])
+    return [sorted(set(rooms)) for rooms in allotted]
+
+
+# Progress queue and stop flag installed once per worker process, when a callback is given
+_worker_relay = None
+
+
+def _init_relay(progress, stop):
+    global _worker_relay
+    _worker_relay = (progress, stop)
+
+
+def _relay(part: int, stats: Dict) -> bool:
+    """Worker-side callback: send a part's stats to the parent and ask whether to go on"""
+    progress, stop = _worker_relay
+    progress.put((part, stats))
+    return not stop.is_set()
+
+
+def _solve_part(scheduler, seed: int, part: int = 0,
+                callback: Optional[Callable[[int, Dict], bool]] = None,
+                deadline: Optional[float] = None) -> Tuple[List[tuple], Dict]:
+    """Evolve one part; returns its best timetable as index rows and a run summary with its profile.
+
+    callback, if given, gets the part number and each generation's stats
+    and stops the part by returning False. deadline, a time.time() value
+    shared by all parts, limits the part to the time left when it starts.
+    """
+    scheduler.rng = random.Random(seed)
+    outcome = {'generation': -1, 'best_fitness': None}
+    best = None
+    time_budget = max(0.0, deadline - time.time()) if deadline is not None else None
+    for stats, best in scheduler.evolution(time_budget):
+        outcome = stats
+        if callback is not None and callback(part, stats) is False:
+            scheduler.stop_reason = 'callback'
+            break
+    rows = []
+    if best is not None and len(best):
+        encoded = best if isinstance(best, EncodedChromosome) else scheduler.encoder.encode(best)
+        rows = list(zip(*(column.tolist() for column in encoded.columns())))
+    return rows, {'generations': outcome['generation'] + 1, 'best_fitness': outcome['best_fitness'],
+                  'stop_reason': scheduler.stop_reason, 'report': scheduler.run_report()}
+
+
+def _solve_relayed_part(scheduler, seed: int, part: int,
+                        deadline: Optional[float] = None) -> Tuple[List[tuple], Dict]:
+    return _solve_part(scheduler, seed, part, _relay, deadline)
+
+
+class DecomposedSolver:
+    """Solve weakly coupled parts of a problem separately, then merge and repair.
+
+    The courses are split into the connected components of the
+    teacher-sharing graph, so no teacher appears in two parts. Classrooms,
+    which any large-enough class may use, are divided between the parts
+    (or, with share_rooms, all given to every part). Each part runs the
+    scheduler's GA as its own smaller problem, in parallel processes; the
+    merged timetable then gets min-conflict repair passes over every
+    session still in a conflict, free to use any room.
+    """
+
+    def __init__(self, scheduler, share_rooms: bool = False, max_workers: Optional[int] = None,
+                 repair_passes: int = 3, seed: Optional[int] = None):
+        self.scheduler = scheduler
+        self.share_rooms = share_rooms
+        # max_workers=0 solves the parts one after another in this process
+        self.max_workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        self.repair_passes = repair_passes
+        self.seed = seed
+        self.parts = []
+        self.best = None
+
+    def split(self) -> List[Dict]:
+        """Course, teacher and room indices of every part"""
+        problem = self.scheduler.problem
+        # Courses that can't be placed anywhere are left out, as in create_chromosome
+        groups = [g for g in course_components(problem)
+                  if any(self.scheduler.index.open_slots_for(c) for c in g)]
+        if self.share_rooms:
+            rooms = [list(range(len(problem.classrooms)))] * len(groups)
+        else:
+            rooms = allot_rooms(problem, groups)
+        parts = []
+        for courses, part_rooms in zip(groups, rooms):
+            subjects = {problem.courses[c]['subject'] for c in courses}
+            teachers = [t for t, teacher in enumerate(problem.teachers)
+                        if subjects.intersection(teacher['subjects'])]
+            parts.append({'courses': courses, 'teachers': teachers, 'rooms': part_rooms})
+        return parts
+
+    def _part_scheduler(self, part: Dict):
+        """A copy of the scheduler, with its own run state, on the part's subproblem"""
+        problem = self.scheduler.problem
+        subproblem = CompiledProblem([problem.teachers[t] for t in part['teachers']],
+                                     [problem.classrooms[r] for r in part['rooms']],
+                                     [problem.courses[c] for c in part['courses']],
+                                     problem.grid.n_days, problem.grid.n_slots)
+        scheduler = copy.copy(self.scheduler)
+        scheduler.fitness_cache = (FitnessCache(self.scheduler.fitness_cache.maxsize)
+                                   if self.scheduler.fitness_cache is not None else None)
+        scheduler.profiler = (RunProfiler(self.scheduler.profiler.sample_every)
+                              if self.scheduler.profiler is not None else None)
+        scheduler.diversity = DiversityTracker()
+        # Parts already run in parallel; don't start fitness pools inside them
+        scheduler.fitness_workers = 0 if self.max_workers > 0 else scheduler.fitness_workers
+        scheduler.use_problem(subproblem)
+        return scheduler
+
+    def solve(self, callback: Callable[[Dict], bool] = None, time_budget: float = None) -> Dict:
+        """Best merged timetable with per-part results and the repair outcome.
+
+        callback, if given, receives every part's per-generation stats, with
+        the part's number under 'part', and can stop all parts by returning
+        False (stop_reason 'callback'); parts in worker processes pass their
+        stats back through a queue. Each part's run profile is under 'report'
+        in its entry of 'parts'. The scheduler's time_budget (or the one
+        given here) covers all parts together: each gets the time left when
+        it starts, so parts queued behind others don't get a fresh budget.
+        """
+        started = time.perf_counter()
+        scheduler = self.scheduler
+        time_budget = time_budget if time_budget is not None else scheduler.time_budget
+        # Wall-clock, so worker processes can compare against it
+        deadline = time.time() + time_budget if time_budget is not None else None
+        parts = self.split()
+        rng = random.Random(self.seed) if self.seed is not None else random.Random(scheduler.rng.getrandbits(64))
+        seeds = [rng.getrandbits(32) for _ in parts]
+        repair_seed = rng.getrandbits(32)
+        schedulers = [self._part_scheduler(part) for part in parts]
+
+        stopped = False
+        if self.max_workers > 0 and len(parts) > 1:
+            results, stopped = self._solve_in_pool(schedulers, seeds, callback, deadline)
+        else:
+            results = []
+
+            def forward(part: int, stats: Dict) -> bool:
+                nonlocal stopped
+                stopped = callback(dict(stats, part=part)) is False
+                return not stopped
+
+            for part, (part_scheduler, seed) in enumerate(zip(schedulers, seeds)):
+                if stopped:
+                    # Cancelled: the parts not started yet are left out
+                    results.append(([], {'generations': 0, 'best_fitness': None,
+                                         'stop_reason': 'callback', 'report': None}))
+                    continue
+                results.append(_solve_part(part_scheduler, seed, part,
+                                           forward if callback is not None else None, deadline))
+
+        # Map every part's rows back to the full problem's indices
+        rows = []
+        for part, (part_rows, summary) in zip(parts, results):
+            for course, session, day, slot, teacher, room in part_rows:
+                rows.append((part['courses'][course], session, day, slot,
+                             part['teachers'][teacher], part['rooms'][room]))
+            part.update(summary, courses=len(part['courses']), teachers=len(part['teachers']),
+                        rooms=len(part['rooms']))
+        rows.sort(key=lambda row: (row[0], row[1]))
+        merged = EncodedChromosome.from_rows(rows)
+
+        state = scheduler.occupancy(merged)
+        conflicts_before = state.conflicts
+        self.repair(merged, random.Random(repair_seed))
+        if not scheduler.incremental:
+            merged.state = None
+
+        self.parts = parts
+        if scheduler.encoding == 'array':
+            self.best = merged
+        elif scheduler.encoding == 'compact':
+            self.best = scheduler.encoder.compact(merged)
+        else:
+            self.best = scheduler.encoder.decode(merged)
+        return {
+            'timetable': scheduler.format_timetable(self.best),
+            'stop_reason': 'callback' if stopped else 'decomposed',
+            'generations': max((part['generations'] for part in parts), default=0),
+            'best_fitness': 1 / (1 + state.conflicts),
+            'elapsed': time.perf_counter() - started,
+            'parts': [{key: part[key] for key in ('courses', 'teachers', 'rooms', 'generations',
+                                                  'best_fitness', 'stop_reason', 'report')}
+                      for part in parts],
+            'conflicts_before_repair': conflicts_before,
+            'conflicts_after_repair': state.conflicts
+        }
+
+    def _solve_in_pool(self, schedulers: List, seeds: List[int],
+                       callback: Optional[Callable[[Dict], bool]],
+                       deadline: Optional[float] = None) -> Tuple[List[Tuple[List[tuple], Dict]], bool]:
+        """Solve the parts on worker processes, forwarding their stats to callback as they arrive.
+
+        Returns the parts' results and whether the callback stopped the run.
+        """
+        workers = min(self.max_workers, len(schedulers))
+        if callback is None:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_solve_part, s, seed, part, None, deadline)
+                           for part, (s, seed) in enumerate(zip(schedulers, seeds))]
+                return [future.result() for future in futures], False
+
+        progress, stop = multiprocessing.SimpleQueue(), multiprocessing.Event()
+
+        def forward():
+            while not progress.empty():
+                part, stats = progress.get()
+                if callback(dict(stats, part=part)) is False:
+                    stop.set()
+
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_relay,
+                                 initargs=(progress, stop)) as executor:
+            futures = [executor.submit(_solve_relayed_part, s, seed, part, deadline)
+                       for part, (s, seed) in enumerate(zip(schedulers, seeds))]
+            pending = set(futures)
+            while pending:
+                _, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+                forward()
+            # Workers put their stats before returning, so nothing is left in flight
+            forward()
+            return [future.result() for future in futures], stop.is_set()
+
+    def repair(self, merged: EncodedChromosome, rng: Optional[random.Random] = None) -> int:
+        """Move conflicting sessions to their cheapest allowed placement; returns moves made.
+
+        Ties between placements are broken with rng, the scheduler's stream by default.
+        """
+        scheduler = copy.copy(self.scheduler)
+        if rng is not None:
+            scheduler.rng = rng
+        state = merged.state
+        moved = 0
+        for _ in range(self.repair_passes):
+            before = state.conflicts
+            for gene in scheduler.tabu_search.conflicted(merged, state).tolist():
+                placement = scheduler.best_placement(merged, gene, merged)
+                if placement is not None and placement != scheduler.cell_of(merged, gene):
+                    scheduler.move_gene(merged, gene, *placement)
+                    moved += 1
+            if state.conflicts >= before:
+                break
+        return moved
+
+    def generate_timetable(self, callback: Callable[[Dict], bool] = None,
+                           time_budget: float = None) -> Dict:
+        """Generate and format timetable for display"""
+        return self.solve(callback, time_budget)['timetable']
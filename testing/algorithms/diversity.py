@@ -0,0 +1,39 @@
+# testing/algorithms/diversity.py
+
+from typing import List
+from .fitness_cache import chromosome_key
+
+
+class DiversityTracker:
+    """Share of structurally distinct chromosomes in each generation's population.
+
+    Chromosomes carried over unchanged from the previous generation (the
+    elite, parents that skipped crossover and mutation) are the same
+    objects, so their structural keys are reused instead of rebuilt.
+    """
+
+    def __init__(self):
+        self._keys = {}  # id(chromosome) -> (chromosome, key) for the last population
+
+    def keys(self, population: List) -> List[bytes]:
+        """chromosome_key of every chromosome, computing it only for ones not seen last generation"""
+        known = self._keys
+        current = {}
+        keys = []
+        for chrom in population:
+            entry = known.get(id(chrom))
+            # The stored reference keeps the id from being reused by another object
+            if entry is None or entry[0] is not chrom:
+                entry = (chrom, chromosome_key(chrom))
+            current[id(chrom)] = entry
+            keys.append(entry[1])
+        self._keys = current
+        return keys
+
+    def distinct_ratio(self, population: List) -> float:
+        if not population:
+            return 0.0
+        return len(set(self.keys(population))) / len(population)
+
+    def reset(self):
+        self._keys = {}
@@ -0,0 +1,132 @@
+# testing/algorithms/encoding.py
+
+import numpy as np
+from typing import List, Dict, NamedTuple
+
+
+class EncodedChromosome:
+    """Chromosome stored as parallel NumPy integer columns (one row per gene)"""
+
+    COLUMNS = ('course', 'session', 'day', 'slot', 'teacher', 'room')
+    # state optionally carries an OccupancyState for delta fitness updates
+    __slots__ = COLUMNS + ('state',)
+
+    # Column dtypes: indices into the scheduler's course/teacher/classroom
+    # lists fit in int16, grid positions and session numbers in int8
+    DTYPES = {
+        'course': np.int16,
+        'session': np.int8,
+        'day': np.int8,
+        'slot': np.int8,
+        'teacher': np.int16,
+        'room': np.int16,
+    }
+
+    def __init__(self, course, session, day, slot, teacher, room, state=None):
+        self.course = np.asarray(course, dtype=self.DTYPES['course'])
+        self.session = np.asarray(session, dtype=self.DTYPES['session'])
+        self.day = np.asarray(day, dtype=self.DTYPES['day'])
+        self.slot = np.asarray(slot, dtype=self.DTYPES['slot'])
+        self.teacher = np.asarray(teacher, dtype=self.DTYPES['teacher'])
+        self.room = np.asarray(room, dtype=self.DTYPES['room'])
+        self.state = state
+
+    @classmethod
+    def from_rows(cls, rows: List[tuple]) -> 'EncodedChromosome':
+        """Build from (course, session, day, slot, teacher, room) tuples"""
+        if not rows:
+            return cls(*([] for _ in cls.COLUMNS))
+        return cls(*zip(*rows))
+
+    def __len__(self) -> int:
+        return len(self.course)
+
+    def columns(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.COLUMNS)
+
+    def copy(self) -> 'EncodedChromosome':
+        state = self.state.copy() if self.state is not None else None
+        return EncodedChromosome(*(col.copy() for col in self.columns()), state=state)
+
+    def splice(self, other: 'EncodedChromosome', point: int) -> 'EncodedChromosome':
+        """Return self[:point] followed by other[point:]"""
+        return EncodedChromosome(*(np.concatenate((a[:point], b[point:]))
+                                   for a, b in zip(self.columns(), other.columns())))
+
+    @property
+    def nbytes(self) -> int:
+        return sum(col.nbytes for col in self.columns())
+
+
+class Gene(NamedTuple):
+    """One session's assignment as indices into the problem's course/teacher/classroom lists.
+
+    Immutable, so chromosomes that are lists of genes can share them:
+    crossover children reuse their parents' genes and a mutation replaces
+    a single gene (gene._replace(day=...)) instead of copying or editing it.
+    """
+    course: int
+    session: int
+    day: int
+    slot: int
+    teacher: int
+    room: int
+
+
+def is_compact(chromosome) -> bool:
+    """Whether chromosome is a list of Gene records"""
+    return isinstance(chromosome, list) and bool(chromosome) and isinstance(chromosome[0], Gene)
+
+
+class ChromosomeEncoder:
+    """Translate between dict genes and EncodedChromosome columns"""
+
+    def __init__(self, courses: List[Dict], teachers: List[Dict], classrooms: List[Dict]):
+        self.courses = courses
+        self.teachers = teachers
+        self.classrooms = classrooms
+
+        # Genes reference the loaded dicts, so map them back through their ids
+        self.course_index = {c['id']: i for i, c in enumerate(courses)}
+        self.teacher_index = {t['id']: i for i, t in enumerate(teachers)}
+        self.room_index = {c['id']: i for i, c in enumerate(classrooms)}
+
+    def encode(self, chromosome: List[Dict]) -> EncodedChromosome:
+        """Encode a list of dict genes or Gene records"""
+        if is_compact(chromosome):
+            return EncodedChromosome.from_rows(chromosome)
+        rows = []
+        sessions_seen = {}
+        for gene in chromosome:
+            course_idx = self.course_index[gene['course']['id']]
+            session = sessions_seen.get(course_idx, 0)
+            sessions_seen[course_idx] = session + 1
+            rows.append((course_idx,
+                         session,
+                         gene['day'],
+                         gene['time_slot'],
+                         self.teacher_index[gene['teacher']['id']],
+                         self.room_index[gene['classroom']['id']]))
+        return EncodedChromosome.from_rows(rows)
+
+    def decode_gene(self, course: int, day: int, slot: int, teacher: int, room: int) -> Dict:
+        return {
+            'day': int(day),
+            'time_slot': int(slot),
+            'course': self.courses[course],
+            'teacher': self.teachers[teacher],
+            'classroom': self.classrooms[room]
+        }
+
+    def compact(self, encoded: EncodedChromosome) -> List[Gene]:
+        """Gene records of an encoded chromosome"""
+        return [Gene(*row) for row in zip(*(column.tolist() for column in encoded.columns()))]
+
+    def decode(self, encoded) -> List[Dict]:
+        """Decode back to the dict gene format used by generate_timetable"""
+        if is_compact(encoded):
+            return [self.decode_gene(g.course, g.day, g.slot, g.teacher, g.room) for g in encoded]
+        return [self.decode_gene(c, d, s, t, r)
+                for c, d, s, t, r in zip(encoded.course.tolist(), encoded.day.tolist(),
+                                         encoded.slot.tolist(), encoded.teacher.tolist(),
+                                         encoded.room.tolist())]
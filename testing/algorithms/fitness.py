@@ -1,9 +1,17 @@
 # testing/algorithms/fitness.py
 
-from typing import List, Dict
+from collections import Counter, defaultdict
+from typing import List, Dict, Optional
+import numpy as np
+from .availability import AvailabilityGrid
+from .batch_fitness import BatchFitnessEvaluator
 
 class FitnessCalculator:
-    def __init__(self):
+    def __init__(self, engine: str = 'scalar', grid: Optional[AvailabilityGrid] = None):
+        if engine not in ('scalar', 'batch'):
+            raise ValueError(f"Unknown fitness engine: {engine}")
+        self.engine = engine
+        self.grid = grid or AvailabilityGrid()
         self.weights = {
             'teacher_conflict': 1.0,
             'room_conflict': 1.0,
@@ -14,6 +22,9 @@ class FitnessCalculator:
 
     def calculate_fitness(self, chromosome: List[Dict]) -> float:
         """Calculate overall fitness score"""
+        if self.engine == 'batch':
+            return self.calculate_population_fitness([chromosome])[0]
+
         penalties = 0
         
         # Check hard constraints
@@ -29,27 +40,62 @@ class FitnessCalculator:
         fitness = 1 / (1 + penalties)
         return fitness
 
+    def calculate_population_fitness(self, population: List[List[Dict]]) -> List[float]:
+        """Calculate fitness scores for every chromosome in a population"""
+        if self.engine == 'scalar':
+            return [self.calculate_fitness(chromosome) for chromosome in population]
+        stacked, evaluator = self.stack_population(population)
+        return evaluator.weighted_fitness(stacked, self.weights).tolist()
+
+    def stack_population(self, population: List[List[Dict]]):
+        """Encode dict genes into a stacked array plus an evaluator with matching lookup tables"""
+        indexes = {'course': {}, 'teacher': {}, 'classroom': {}}
+        resources = {'course': [], 'teacher': [], 'classroom': []}
+
+        def index_of(kind: str, obj: Dict) -> int:
+            # Teachers and rooms are matched by id as in the scalar checks;
+            # courses carry no guaranteed id, so use the dict itself
+            key = id(obj) if kind == 'course' else obj['id']
+            if key not in indexes[kind]:
+                indexes[kind][key] = len(resources[kind])
+                resources[kind].append(obj)
+            return indexes[kind][key]
+
+        width = max((len(chromosome) for chromosome in population), default=0)
+        stacked = np.full((len(population), 6, width), -1, dtype=np.int32)
+        for row, chromosome in enumerate(population):
+            for col, gene in enumerate(chromosome):
+                stacked[row, :, col] = (index_of('course', gene['course']), 0,
+                                        gene['day'], gene['time_slot'],
+                                        index_of('teacher', gene['teacher']),
+                                        index_of('classroom', gene['classroom']))
+
+        availability = [self.grid.to_array(self.grid.mask_of(t)) for t in resources['teacher']]
+        evaluator = BatchFitnessEvaluator(
+            self.grid.n_days, self.grid.n_slots,
+            course_students=np.array([c['students'] for c in resources['course']]),
+            room_capacity=np.array([c['capacity'] for c in resources['classroom']]),
+            teacher_availability=np.array(availability, dtype=bool).reshape(
+                -1, self.grid.n_days, self.grid.n_slots)
+        )
+        return stacked, evaluator
+
     def check_teacher_conflicts(self, chromosome: List[Dict]) -> int:
         """Check for teachers assigned to multiple classes at same time"""
-        conflicts = 0
-        for i, gene1 in enumerate(chromosome):
-            for gene2 in chromosome[i+1:]:
-                if (gene1['day'] == gene2['day'] and 
-                    gene1['time_slot'] == gene2['time_slot'] and
-                    gene1['teacher']['id'] == gene2['teacher']['id']):
-                    conflicts += 1
-        return conflicts
+        buckets = Counter((gene['day'], gene['time_slot'], gene['teacher']['id'])
+                          for gene in chromosome)
+        return self.count_colliding_pairs(buckets)
 
     def check_room_conflicts(self, chromosome: List[Dict]) -> int:
         """Check for multiple classes in same room at same time"""
-        conflicts = 0
-        for i, gene1 in enumerate(chromosome):
-            for gene2 in chromosome[i+1:]:
-                if (gene1['day'] == gene2['day'] and 
-                    gene1['time_slot'] == gene2['time_slot'] and
-                    gene1['classroom']['id'] == gene2['classroom']['id']):
-                    conflicts += 1
-        return conflicts
+        buckets = Counter((gene['day'], gene['time_slot'], gene['classroom']['id'])
+                          for gene in chromosome)
+        return self.count_colliding_pairs(buckets)
+
+    @staticmethod
+    def count_colliding_pairs(buckets: Counter) -> int:
+        """Number of gene pairs sharing a bucket (k genes give k*(k-1)/2 pairs)"""
+        return sum(count * (count - 1) // 2 for count in buckets.values())
 
     def check_capacity_violations(self, chromosome: List[Dict]) -> int:
         """Check if room capacity is sufficient for class size"""
@@ -61,62 +107,20 @@ class FitnessCalculator:
 
     def check_consecutive_classes(self, chromosome: List[Dict]) -> int:
         """Check for teachers having too many consecutive classes"""
-        penalties = 0
-        for i, gene1 in enumerate(chromosome):
-            consecutive_count = 1
-            for gene2 in chromosome[i+1:]:
-                if (gene1['day'] == gene2['day'] and 
-                    gene1['teacher']['id'] == gene2['teacher']['id'] and
-                    abs(gene1['time_slot'] - gene2['time_slot']) == 1):
-                    consecutive_count += 1
-            if consecutive_count > 3:  # More than 3 consecutive classes
-                penalties += consecutive_count - 3
-        return penalties
+        # One occupancy bitmask per teacher for the whole week
+        occupied = defaultdict(int)
+        for gene in chromosome:
+            occupied[gene['teacher']['id']] |= self.grid.bit(gene['day'], gene['time_slot'])
+        return sum(self.grid.consecutive_penalty(mask) for mask in occupied.values())
 
     def check_teacher_preferences(self, chromosome: List[Dict]) -> int:
         """Check if teacher preferences are violated"""
         violations = 0
+        masks = {}
         for gene in chromosome:
             teacher = gene['teacher']
-            if not teacher['availability'][gene['day']][gene['time_slot']]:
+            if id(teacher) not in masks:
+                masks[id(teacher)] = self.grid.mask_of(teacher)
+            if not self.grid.is_free(masks[id(teacher)], gene['day'], gene['time_slot']):
                 violations += 1
         return violations
-    
-    
-    # testing/algorithms/fitness.py
-
-def check_consecutive_classes(self, chromosome: List[Dict]) -> int:
-    """Check for teachers having too many consecutive classes"""
-    penalties = 0
-    # Sort by day and time slot
-    sorted_chromosome = sorted(chromosome, 
-                             key=lambda x: (x['day'], x['time_slot']))
-    
-    # Group by teacher and day
-    teachers = {}
-    for gene in sorted_chromosome:
-        teacher_id = gene['teacher']['id']
-        day = gene['day']
-        if teacher_id not in teachers:
-            teachers[teacher_id] = {}
-        if day not in teachers[teacher_id]:
-            teachers[teacher_id][day] = []
-        teachers[teacher_id][day].append(gene['time_slot'])
-    
-    # Check consecutive slots for each teacher each day
-    for teacher_days in teachers.values():
-        for slots in teacher_days.values():
-            consecutive = 1
-            slots.sort()
-            for i in range(1, len(slots)):
-                if slots[i] - slots[i-1] == 1:
-                    consecutive += 1
-                else:
-                    if consecutive > 3:
-                        penalties += consecutive - 3
-                    consecutive = 1
-            # Check last sequence
-            if consecutive > 3:
-                penalties += consecutive - 3
-                
-    return penalties
\ No newline at end of file
@@ -0,0 +1,73 @@
+# testing/algorithms/fitness_cache.py
+
+import hashlib
+import numpy as np
+from collections import OrderedDict
+from typing import Dict, Optional
+from .encoding import EncodedChromosome, is_compact
+
+
+def chromosome_key(chromosome) -> bytes:
+    """128-bit digest of a chromosome's assignments.
+
+    Computed from the genes' current contents rather than object identity,
+    so a gene edited in place after an earlier lookup simply gets a
+    different key instead of returning a stale score. A 16-byte digest
+    keeps every cache entry small whatever the chromosome length, while
+    making a collision between two different chromosomes negligible.
+    """
+    if isinstance(chromosome, EncodedChromosome):
+        data = b''.join(column.tobytes() for column in
+                        (chromosome.course, chromosome.day, chromosome.slot,
+                         chromosome.teacher, chromosome.room))
+    elif is_compact(chromosome):
+        data = np.array(chromosome, dtype=np.int64).tobytes()
+    else:
+        data = repr(tuple((gene['course']['id'], gene['day'], gene['time_slot'],
+                           gene['teacher']['id'], gene['classroom']['id'])
+                          for gene in chromosome)).encode()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+class FitnessCache:
+    """Bounded least-recently-used map from chromosome key to fitness"""
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._scores = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def get(self, key: bytes) -> Optional[float]:
+        score = self._scores.get(key)
+        if score is None:
+            self.misses += 1
+            return None
+        self._scores.move_to_end(key)
+        self.hits += 1
+        return score
+
+    def put(self, key: bytes, score: float):
+        self._scores[key] = score
+        self._scores.move_to_end(key)
+        if len(self._scores) > self.maxsize:
+            self._scores.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        self._scores.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self._scores),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0
+        }
@@ -0,0 +1,74 @@
+# testing/algorithms/incremental.py
+
+import numpy as np
+from .encoding import EncodedChromosome
+
+
+class OccupancyState:
+    """Occupancy counters for one encoded chromosome.
+
+    Keeps teacher x day x slot and room x day x slot gene counts together
+    with the conflict total that AGADRScheduler.fitness is derived from, so
+    a single-gene move can update the total without rescanning the genes.
+    """
+
+    __slots__ = ('teacher_counts', 'room_counts', 'conflicts')
+
+    def __init__(self, teacher_counts: np.ndarray, room_counts: np.ndarray, conflicts: float):
+        self.teacher_counts = teacher_counts
+        self.room_counts = room_counts
+        self.conflicts = conflicts
+
+    @classmethod
+    def build(cls, chromosome: EncodedChromosome, n_teachers: int, n_rooms: int,
+              n_days: int, n_slots: int) -> 'OccupancyState':
+        """Full recompute from the chromosome's columns"""
+        grid = n_days * n_slots
+        cell = chromosome.day.astype(np.intp) * n_slots + chromosome.slot
+        teacher_counts = np.bincount(chromosome.teacher.astype(np.intp) * grid + cell,
+                                     minlength=n_teachers * grid)
+        room_counts = np.bincount(chromosome.room.astype(np.intp) * grid + cell,
+                                  minlength=n_rooms * grid)
+        teacher_counts = teacher_counts.reshape(n_teachers, n_days, n_slots)
+        room_counts = room_counts.reshape(n_rooms, n_days, n_slots)
+
+        # Same conflict definition as AGADRScheduler.fitness: colliding pairs
+        # plus half a conflict per same-day neighbouring-slot pair
+        conflicts = int((teacher_counts * (teacher_counts - 1)).sum() // 2)
+        conflicts += int((room_counts * (room_counts - 1)).sum() // 2)
+        conflicts += 0.5 * int((teacher_counts[:, :, :-1] * teacher_counts[:, :, 1:]).sum())
+        return cls(teacher_counts.astype(np.int16), room_counts.astype(np.int16), conflicts)
+
+    def copy(self) -> 'OccupancyState':
+        return OccupancyState(self.teacher_counts.copy(), self.room_counts.copy(), self.conflicts)
+
+    def neighbours(self, teacher: int, day: int, slot: int) -> int:
+        """Classes the teacher has in the periods right before and after (day, slot)"""
+        row = self.teacher_counts[teacher, day]
+        count = int(row[slot - 1]) if slot > 0 else 0
+        if slot + 1 < len(row):
+            count += int(row[slot + 1])
+        return count
+
+    def remove(self, day: int, slot: int, teacher: int, room: int):
+        """Take one gene out of the counters"""
+        self.teacher_counts[teacher, day, slot] -= 1
+        self.room_counts[room, day, slot] -= 1
+        # The genes left in each cell no longer collide with the removed one
+        self.conflicts -= int(self.teacher_counts[teacher, day, slot])
+        self.conflicts -= int(self.room_counts[room, day, slot])
+        self.conflicts -= 0.5 * self.neighbours(teacher, day, slot)
+
+    def add(self, day: int, slot: int, teacher: int, room: int):
+        """Put one gene into the counters"""
+        self.conflicts += int(self.teacher_counts[teacher, day, slot])
+        self.conflicts += int(self.room_counts[room, day, slot])
+        self.conflicts += 0.5 * self.neighbours(teacher, day, slot)
+        self.teacher_counts[teacher, day, slot] += 1
+        self.room_counts[room, day, slot] += 1
+
+    def move(self, old: tuple, new: tuple):
+        """Move one gene from old to new (day, slot, teacher, room)"""
+        self.remove(*old)
+        self.add(*new)
+
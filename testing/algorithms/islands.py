@@ -0,0 +1,174 @@
+# testing/algorithms/islands.py
+
+import os
+import time
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Optional, Tuple
+from .encoding import EncodedChromosome, is_compact
+
+# Scheduler installed once per worker process by the pool initializer
+_worker_scheduler = None
+
+
+def _init_worker(scheduler):
+    global _worker_scheduler
+    # Islands already use every worker; don't start fitness pools inside them
+    scheduler.fitness_workers = 0
+    _worker_scheduler = scheduler
+
+
+def _run_island(scheduler, population: Optional[List], generations: int, rng_state) -> Tuple:
+    """Evolve one island for a number of generations.
+
+    Generations go through the scheduler's step, so adaptive_rates and
+    eliminate_clones apply on each island. The island's random state
+    travels with it, so a seeded run gives the same result whether islands
+    run in a pool or one after another.
+    """
+    scheduler.rng = random.Random()
+    if isinstance(rng_state, int):
+        scheduler.rng.seed(rng_state)
+    else:
+        scheduler.rng.setstate(rng_state)
+
+    if population is None:
+        population = scheduler.initialize_population()
+    for generation in range(generations):
+        population, _, _ = scheduler.step(generation, population)
+
+    # Return the island ranked best first, for migration
+    fitness_scores = scheduler.evaluate_population(population)
+    ranked = sorted(zip(fitness_scores, population), key=lambda pair: pair[0], reverse=True)
+    population = [chrom for _, chrom in ranked]
+    for chrom in population:
+        # Occupancy counters are cheaper to rebuild than to ship between processes
+        if isinstance(chrom, EncodedChromosome):
+            chrom.state = None
+    return population, [score for score, _ in ranked], scheduler.rng.getstate()
+
+
+def _run_island_in_worker(population, generations, rng_state):
+    return _run_island(_worker_scheduler, population, generations, rng_state)
+
+
+class IslandModel:
+    """Run several AGADR populations side by side with periodic elite migration"""
+
+    def __init__(self, scheduler, n_islands: int = 4, migration_interval: int = 10,
+                 migration_size: int = 2, topology: str = 'ring', seed: Optional[int] = None,
+                 max_workers: Optional[int] = None):
+        if topology not in ('ring', 'random'):
+            raise ValueError(f"Unknown migration topology: {topology}")
+        self.scheduler = scheduler
+        self.n_islands = n_islands
+        self.migration_interval = max(1, migration_interval)
+        self.migration_size = migration_size
+        self.topology = topology
+        self.seed = seed
+        # max_workers=0 runs the islands one after another in this process
+        self.max_workers = min(n_islands, os.cpu_count() or 1) if max_workers is None else max_workers
+        self.best_fitness = 0.0
+        self.history = []
+        self.stop_reason = None
+
+    @staticmethod
+    def _clone(chromosome):
+        """Independent copy, so a migrant never shares mutable genes with its source island"""
+        if isinstance(chromosome, EncodedChromosome):
+            return chromosome.copy()
+        if is_compact(chromosome):
+            return list(chromosome)  # Gene records are immutable, so they can be shared
+        return [dict(gene) for gene in chromosome]
+
+    def migrate(self, islands: List[List], rng: random.Random):
+        """Copy each island's best chromosomes over the worst ones of its target island"""
+        if self.n_islands < 2 or self.migration_size <= 0:
+            return
+        if self.topology == 'ring':
+            targets = [(i + 1) % self.n_islands for i in range(self.n_islands)]
+        else:
+            targets = [rng.choice([j for j in range(self.n_islands) if j != i])
+                       for i in range(self.n_islands)]
+
+        emigrants = [[self._clone(chrom) for chrom in island[:self.migration_size]]
+                     for island in islands]
+        for source, target in enumerate(targets):
+            incoming = emigrants[source]
+            islands[target][-len(incoming):] = incoming
+
+    def evolve(self, time_budget: float = None):
+        """Evolve all islands and return the best chromosome found on any of them.
+
+        The scheduler's stopping rules apply to the best fitness over all
+        islands, checked between migration epochs: its target_fitness, its
+        time_budget (or the one given here) and stagnation_limit generations
+        without a gain above stagnation_epsilon. stop_reason says which rule
+        ended the run, as for AGADRScheduler.evolution.
+        """
+        scheduler = self.scheduler
+        generations = scheduler.generations
+        started = time.perf_counter()
+        time_budget = time_budget if time_budget is not None else scheduler.time_budget
+        deadline = started + time_budget if time_budget is not None else None
+        self.stop_reason = None
+        best_seen, stale = float('-inf'), 0
+        rng = random.Random(self.seed) if self.seed is not None else random.Random(self.scheduler.rng.getrandbits(64))
+        rng_states = [rng.getrandbits(32) for _ in range(self.n_islands)]
+        islands = [None] * self.n_islands
+        best, self.best_fitness, self.history = None, 0.0, []
+
+        executor = None
+        if self.max_workers > 0:
+            executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                           initializer=_init_worker, initargs=(self.scheduler,))
+        caller_rng = self.scheduler.rng
+        try:
+            done = 0
+            while done < generations:
+                epoch = min(self.migration_interval, generations - done)
+                if executor is not None:
+                    futures = [executor.submit(_run_island_in_worker, islands[i], epoch, rng_states[i])
+                               for i in range(self.n_islands)]
+                    results = [future.result() for future in futures]
+                else:
+                    results = [_run_island(self.scheduler, islands[i], epoch, rng_states[i])
+                               for i in range(self.n_islands)]
+                done += epoch
+
+                islands = [population for population, _, _ in results]
+                rng_states = [state for _, _, state in results]
+                epoch_best = [scores[0] for _, scores, _ in results]
+                self.history.append({'generation': done, 'island_best': epoch_best})
+
+                leader = max(range(self.n_islands), key=lambda i: epoch_best[i])
+                if epoch_best[leader] > self.best_fitness or best is None:
+                    best, self.best_fitness = islands[leader][0], epoch_best[leader]
+
+                # Convergence check
+                if self.best_fitness > scheduler.target_fitness:
+                    self.stop_reason = 'target_reached'
+                    break
+                if self.best_fitness > best_seen + scheduler.stagnation_epsilon:
+                    best_seen, stale = self.best_fitness, 0
+                else:
+                    stale += epoch
+                if scheduler.stagnation_limit is not None and stale >= scheduler.stagnation_limit:
+                    self.stop_reason = 'stagnation'
+                    break
+                if deadline is not None and time.perf_counter() >= deadline:
+                    self.stop_reason = 'time_budget'
+                    break
+                self.migrate(islands, rng)
+            else:
+                self.stop_reason = 'generations'
+        finally:
+            self.scheduler.rng = caller_rng
+            if executor is not None:
+                executor.shutdown()
+
+        return best
+
+    def generate_timetable(self) -> Dict:
+        """Generate and format timetable for display"""
+        return self.scheduler.format_timetable(self.evolve())
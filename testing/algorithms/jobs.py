@@ -0,0 +1,193 @@
+# testing/algorithms/jobs.py
+
+import time
+import uuid
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import Manager
+from typing import Callable, Dict, Iterator, Optional
+from .result_cache import ResultCache
+
+
+class QueueFullError(Exception):
+    """Raised when a job is submitted while the queue is at its depth limit"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Solver queue is full, retry later")
+        self.retry_after = retry_after
+
+
+def _run_job(solve: Callable, job_id: str, payload: Dict, progress, cancelled):
+    """Worker side of a job: publish per-generation stats and honour cancel requests.
+
+    solve(payload, callback) must call callback(stats) once per generation
+    and stop early when it returns False.
+    """
+    progress[job_id] = {'generation': None}
+
+    def callback(stats: Dict) -> bool:
+        progress[job_id] = stats
+        return job_id not in cancelled
+
+    return solve(payload, callback)
+
+
+class JobManager:
+    """Run solves on a bounded worker pool and track them by job id.
+
+    Jobs are queued in the executor; submit refuses new work with
+    QueueFullError once max_queue jobs are already waiting for a worker,
+    so bursts are pushed back to the client instead of piling up. Progress
+    and cancel flags live in shared dicts the workers can reach, and are
+    checked by the solver between generations.
+    """
+
+    FINISHED = ('succeeded', 'failed', 'cancelled')
+
+    def __init__(self, solve: Callable, max_workers: int = 2, max_queue: int = 32,
+                 use_processes: bool = True, max_finished: int = 256,
+                 cache: Optional[ResultCache] = None,
+                 on_finish: Optional[Callable[[Dict], None]] = None):
+        self.solve = solve
+        # Called with each finished job's status, e.g. to collect run metrics
+        self.on_finish = on_finish
+        # Results of earlier identical payloads, served without running the solver
+        self.cache = cache
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.max_finished = max_finished
+        if use_processes:
+            self._manager = Manager()
+            self._progress = self._manager.dict()
+            self._cancelled = self._manager.dict()
+            self._executor = ProcessPoolExecutor(max_workers=max_workers)
+        else:
+            self._manager = None
+            self._progress = {}
+            self._cancelled = {}
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        # Recent run times, for the Retry-After estimate
+        self._durations = []
+
+    def _unfinished(self) -> int:
+        return sum(1 for job in self._jobs.values() if not job['future'].done())
+
+    def _retry_after(self) -> int:
+        average = sum(self._durations) / len(self._durations) if self._durations else 5.0
+        return max(1, int(average * (self.max_queue + self.max_workers) / self.max_workers))
+
+    def _prune(self):
+        """Forget the oldest finished jobs beyond max_finished"""
+        finished = [job_id for job_id, job in self._jobs.items() if job['future'].done()]
+        for job_id in finished[:max(0, len(finished) - self.max_finished)]:
+            del self._jobs[job_id]
+
+    def submit(self, payload: Dict) -> str:
+        """Queue a solve and return its job id; cached payloads finish immediately"""
+        key = self.cache.key(payload) if self.cache is not None else None
+        cached = self.cache.get(key) if key is not None else None
+        with self._lock:
+            if cached is None and self._unfinished() >= self.max_workers + self.max_queue:
+                raise QueueFullError(self._retry_after())
+            self._prune()
+            job_id = uuid.uuid4().hex
+            job = {'id': job_id, 'key': key, 'submitted_at': time.time(), 'finished_at': None,
+                   'progress': None, 'cancel_requested': False, 'cached': cached is not None}
+            if cached is None:
+                job['future'] = self._executor.submit(_run_job, self.solve, job_id, payload,
+                                                      self._progress, self._cancelled)
+            else:
+                job['future'] = Future()
+                job['future'].set_result(cached)
+            self._jobs[job_id] = job
+        job['future'].add_done_callback(lambda _: self._finish(job))
+        return job_id
+
+    def _finish(self, job: Dict):
+        """Move a finished job's last progress out of the shared dicts and cache its result"""
+        finished_at = time.time()
+        if not job['cached']:
+            job['progress'] = self._progress.get(job['id'], job['progress'])
+            self._progress.pop(job['id'], None)
+            self._cancelled.pop(job['id'], None)
+            if not job['future'].cancelled():
+                self._durations = (self._durations + [finished_at - job['submitted_at']])[-20:]
+            if job['key'] is not None and self._status_of(job) == 'succeeded':
+                self.cache.put(job['key'], job['future'].result())
+        job['finished_at'] = finished_at
+        if self.on_finish is not None and not job['cached']:
+            self.on_finish(self.status(job['id']))
+
+    def _status_of(self, job: Dict) -> str:
+        future = job['future']
+        if future.cancelled():
+            return 'cancelled'
+        if future.done():
+            if future.exception() is not None:
+                return 'failed'
+            return 'cancelled' if job['cancel_requested'] else 'succeeded'
+        return 'running' if job['id'] in self._progress else 'queued'
+
+    def status(self, job_id: str) -> Optional[Dict]:
+        """Status and latest progress of a job, or None for an unknown id"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        status = self._status_of(job)
+        progress = job['progress']
+        if job['finished_at'] is None:
+            progress = self._progress.get(job_id, progress)
+        report = {'id': job_id, 'status': status, 'progress': progress, 'cached': job['cached'],
+                  'submitted_at': job['submitted_at'], 'finished_at': job['finished_at']}
+        if status == 'failed':
+            report['error'] = str(job['future'].exception())
+        return report
+
+    def result(self, job_id: str):
+        """Result of a succeeded job; None while it is unfinished, cancelled or failed"""
+        job = self._jobs.get(job_id)
+        if job is None or self._status_of(job) != 'succeeded':
+            return None
+        return job['future'].result()
+
+    def counts(self) -> Dict[str, int]:
+        """Number of tracked jobs in each status"""
+        counts = dict.fromkeys(('queued', 'running') + self.FINISHED, 0)
+        for job in list(self._jobs.values()):
+            counts[self._status_of(job)] += 1
+        return counts
+
+    def watch(self, job_id: str, interval: float = 0.5) -> Iterator[Dict]:
+        """Yield the job's status each time its progress changes, ending once it finishes"""
+        last = None
+        while True:
+            status = self.status(job_id)
+            if status is None:
+                return
+            if (status['status'], status['progress']) != last:
+                last = (status['status'], status['progress'])
+                yield status
+            if status['status'] in self.FINISHED:
+                return
+            time.sleep(interval)
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued job, or ask a running one to stop after its current generation"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return False
+        if not job['future'].done():
+            job['cancel_requested'] = True
+            if not job['future'].cancel():
+                self._cancelled[job_id] = True
+        return True
+
+    def shutdown(self):
+        for job_id in list(self._jobs):
+            self.cancel(job_id)
+        self._executor.shutdown(wait=True)
+        if self._manager is not None:
+            self._manager.shutdown()
@@ -0,0 +1,137 @@
+# testing/algorithms/local_search.py
+
+import random
+import numpy as np
+from typing import List, Optional, Tuple
+from .encoding import EncodedChromosome
+from .incremental import OccupancyState
+from .problem_index import ProblemIndex
+
+# One gene's new (day, slot, teacher, room)
+Move = List[Tuple[int, Tuple[int, int, int, int]]]
+
+
+class TabuSearch:
+    """Tabu search over single-session moves, scored by occupancy deltas.
+
+    Each step picks a session involved in a conflict and tries `sample`
+    neighbours: re-placing it at a random period with a free qualified
+    teacher and large-enough room, or swapping periods with another session
+    when both stay allowed. The best non-tabu neighbour is taken even if it
+    is worse, so the search can leave local optima; a neighbour that beats
+    the best timetable found overrides the tabu list. Every neighbour costs
+    a few counter updates on the OccupancyState instead of a fitness call.
+    """
+
+    def __init__(self, index: ProblemIndex, n_slots: int, sample: int = 8,
+                 tenure: int = 10, swap_rate: float = 0.3):
+        self.index = index
+        self.n_slots = n_slots
+        self.sample = sample
+        self.tenure = tenure
+        self.swap_rate = swap_rate
+
+    def conflicted(self, chromosome: EncodedChromosome, state: OccupancyState) -> np.ndarray:
+        """Indices of genes sharing a teacher or room cell, or next to a class of their teacher"""
+        teacher, room, day, slot = chromosome.teacher, chromosome.room, chromosome.day, chromosome.slot
+        counts = state.teacher_counts
+        clash = (counts[teacher, day, slot] > 1) | (state.room_counts[room, day, slot] > 1)
+        before = np.where(slot > 0, counts[teacher, day, np.maximum(slot - 1, 0)], 0)
+        after = np.where(slot + 1 < self.n_slots,
+                         counts[teacher, day, np.minimum(slot + 1, self.n_slots - 1)], 0)
+        return np.flatnonzero(clash | (before + after > 0))
+
+    @staticmethod
+    def _cell(chromosome: EncodedChromosome, gene: int) -> Tuple[int, int, int, int]:
+        return (int(chromosome.day[gene]), int(chromosome.slot[gene]),
+                int(chromosome.teacher[gene]), int(chromosome.room[gene]))
+
+    def _allowed(self, chromosome: EncodedChromosome, gene: int, day: int, slot: int) -> bool:
+        course = int(chromosome.course[gene])
+        return (int(chromosome.teacher[gene]) in self.index.free_teachers_for(course, day, slot) and
+                int(chromosome.room[gene]) in self.index.free_rooms_for(course, day, slot))
+
+    def neighbour(self, chromosome: EncodedChromosome, gene: int, rng=random) -> Optional[Move]:
+        """A random allowed move or period swap involving gene, or None"""
+        day, slot, teacher, room = self._cell(chromosome, gene)
+        if rng.random() < self.swap_rate:
+            other = rng.randrange(len(chromosome))
+            other_day, other_slot, other_teacher, other_room = self._cell(chromosome, other)
+            if ((day, slot) != (other_day, other_slot) and
+                    self._allowed(chromosome, gene, other_day, other_slot) and
+                    self._allowed(chromosome, other, day, slot)):
+                return [(gene, (other_day, other_slot, teacher, room)),
+                        (other, (day, slot, other_teacher, other_room))]
+            return None
+
+        course = int(chromosome.course[gene])
+        open_days = self.index.open_slots_for(course)
+        if not open_days:
+            return None
+        new_day, slots = rng.choice(open_days)
+        new_slot = rng.choice(slots)
+        return [(gene, (new_day, new_slot,
+                        rng.choice(self.index.free_teachers_for(course, new_day, new_slot)),
+                        rng.choice(self.index.free_rooms_for(course, new_day, new_slot))))]
+
+    def apply(self, chromosome: EncodedChromosome, state: OccupancyState, move: Move) -> Move:
+        """Make a move, returning the move that undoes it"""
+        undo = []
+        for gene, cell in move:
+            old = self._cell(chromosome, gene)
+            state.move(old, cell)
+            chromosome.day[gene], chromosome.slot[gene], chromosome.teacher[gene], chromosome.room[gene] = cell
+            undo.append((gene, old))
+        return undo[::-1]
+
+    def improve(self, chromosome: EncodedChromosome, state: OccupancyState,
+                budget: int, rng=random) -> Tuple[int, int]:
+        """Search in place for at most budget neighbour evaluations, ending on the best timetable found.
+
+        Random choices come from rng (a random.Random or the random module).
+        Returns (neighbours evaluated, moves made).
+        """
+        best_conflicts = state.conflicts
+        best = (chromosome.day.copy(), chromosome.slot.copy(),
+                chromosome.teacher.copy(), chromosome.room.copy())
+        tabu = {}  # (gene, day, slot) -> last step it may not be moved back
+        evaluated, applied, step = 0, 0, 0
+        while evaluated < budget and state.conflicts > 0:
+            candidates = self.conflicted(chromosome, state)
+            if not len(candidates):
+                break
+            gene = int(rng.choice(candidates))
+            chosen, chosen_conflicts = None, None
+            for _ in range(min(self.sample, budget - evaluated)):
+                evaluated += 1
+                move = self.neighbour(chromosome, gene, rng)
+                if move is None:
+                    continue
+                undo = self.apply(chromosome, state, move)
+                conflicts = state.conflicts
+                self.apply(chromosome, state, undo)
+                is_tabu = any(tabu.get((g, cell[0], cell[1]), -1) >= step for g, cell in move)
+                if is_tabu and conflicts >= best_conflicts:
+                    continue
+                if chosen is None or conflicts < chosen_conflicts:
+                    chosen, chosen_conflicts = move, conflicts
+
+            step += 1
+            if chosen is None:
+                continue
+            for gene_moved, (day, slot, _, _) in self.apply(chromosome, state, chosen):
+                tabu[(gene_moved, day, slot)] = step + self.tenure
+            applied += 1
+            if state.conflicts < best_conflicts:
+                best_conflicts = state.conflicts
+                best = (chromosome.day.copy(), chromosome.slot.copy(),
+                        chromosome.teacher.copy(), chromosome.room.copy())
+
+        if state.conflicts > best_conflicts:
+            # Walk back to the best timetable seen, keeping the counters in step
+            day, slot, teacher, room = best
+            changed = np.flatnonzero((chromosome.day != day) | (chromosome.slot != slot) |
+                                     (chromosome.teacher != teacher) | (chromosome.room != room))
+            self.apply(chromosome, state, [(int(g), (int(day[g]), int(slot[g]), int(teacher[g]), int(room[g])))
+                                           for g in changed])
+        return evaluated, applied
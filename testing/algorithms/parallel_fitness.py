@@ -0,0 +1,137 @@
+# testing/algorithms/parallel_fitness.py
+
+import os
+import weakref
+import threading
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Optional
+from .batch_fitness import BatchFitnessEvaluator
+
+# Evaluator installed once per worker process, and the shared block it last attached
+_worker_evaluator = None
+_worker_segment = None
+
+
+def _init_worker(evaluator: BatchFitnessEvaluator):
+    global _worker_evaluator
+    _worker_evaluator = evaluator
+
+
+def _score_rows(name: str, shape: tuple, start: int, stop: int) -> list:
+    """Fitness of rows start:stop of the stacked population in shared block name"""
+    global _worker_segment
+    if _worker_segment is None or _worker_segment.name != name:
+        if _worker_segment is not None:
+            _worker_segment.close()
+        _worker_segment = shared_memory.SharedMemory(name=name)
+    stacked = np.ndarray(shape, dtype=np.int32, buffer=_worker_segment.buf)
+    return _worker_evaluator.fitness(stacked[start:stop]).tolist()
+
+
+def _release(executor: ProcessPoolExecutor, segments: list, pid: int):
+    # A forked child inherits this finalizer, but the pool and blocks are its parent's
+    if os.getpid() != pid:
+        return
+    executor.shutdown(wait=True)
+    for segment in segments:
+        segment.close()
+        segment.unlink()
+
+
+class ParallelFitnessEvaluator:
+    """Score stacked populations on a persistent process pool through shared memory.
+
+    Workers get the (small) batch evaluator once when they start. Each
+    call copies the stacked integer columns into one shared-memory block
+    and hands every worker a row range of it, so only the block name,
+    shape and per-chromosome scores cross process boundaries; course,
+    teacher and classroom records are never pickled. The block is reused
+    while populations fit in it, and the pool lives until close() or
+    interpreter exit, so later runs don't pay for starting workers again.
+    Calls from several threads take turns.
+    """
+
+    # Genes (population x chromosome length) below which the pool's
+    # dispatch overhead outweighs the parallel speedup
+    MIN_GENES = 100_000
+
+    def __init__(self, evaluator: BatchFitnessEvaluator, max_workers: Optional[int] = None):
+        self.evaluator = evaluator
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor = None
+        self._segment = None
+        # Blocks and pool to release when this evaluator is collected or closed
+        self._segments = []
+        self._finalizer = None
+        self._lock = threading.Lock()
+
+    def _block_for(self, nbytes: int) -> shared_memory.SharedMemory:
+        if self._segment is None or self._segment.size < nbytes:
+            # Grow with headroom, so slightly larger populations reuse the block
+            self._segment = shared_memory.SharedMemory(create=True, size=max(nbytes * 5 // 4, 1))
+            for old in self._segments:
+                old.close()
+                old.unlink()
+            self._segments[:] = [self._segment]
+        return self._segment
+
+    def fitness(self, stacked: np.ndarray) -> np.ndarray:
+        """Fitness vector of a stacked population, as BatchFitnessEvaluator.fitness"""
+        with self._lock:
+            return self._fitness(stacked)
+
+    def _fitness(self, stacked: np.ndarray) -> np.ndarray:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 initializer=_init_worker, initargs=(self.evaluator,))
+            self._finalizer = weakref.finalize(self, _release, self._executor, self._segments, os.getpid())
+
+        stacked = np.ascontiguousarray(stacked, dtype=np.int32)
+        segment = self._block_for(stacked.nbytes)
+        np.ndarray(stacked.shape, dtype=np.int32, buffer=segment.buf)[...] = stacked
+
+        n_rows = stacked.shape[0]
+        bounds = np.linspace(0, n_rows, min(self.max_workers, n_rows) + 1).astype(int)
+        futures = [self._executor.submit(_score_rows, segment.name, stacked.shape, int(start), int(stop))
+                   for start, stop in zip(bounds[:-1], bounds[1:]) if stop > start]
+        scores = []
+        for future in futures:
+            scores.extend(future.result())
+        return np.array(scores)
+
+    def close(self):
+        """Stop the worker pool and free the shared block; the next call starts them again"""
+        with self._lock:
+            if self._finalizer is not None:
+                self._finalizer()
+            self._executor = None
+            self._segment = None
+            self._segments = []
+            self._finalizer = None
+
+
+# Process-wide pools by (process, days, slots, workers). Workers only hold a
+# BatchFitnessEvaluator, which depends on nothing but the grid size, so
+# every problem with the same grid shares one pool
+_shared_evaluators = {}
+_shared_lock = threading.Lock()
+
+
+def shared_evaluator(n_days: int, n_slots: int, workers: int) -> ParallelFitnessEvaluator:
+    """The persistent worker pool scoring populations on an n_days x n_slots grid"""
+    key = (os.getpid(), n_days, n_slots, workers)
+    with _shared_lock:
+        if key not in _shared_evaluators:
+            _shared_evaluators[key] = ParallelFitnessEvaluator(BatchFitnessEvaluator(n_days, n_slots), workers)
+        return _shared_evaluators[key]
+
+
+def close_shared_evaluators(n_days: Optional[int] = None, n_slots: Optional[int] = None):
+    """Stop this process's shared pools, or those for one grid size; they start again when next needed"""
+    with _shared_lock:
+        evaluators = [evaluator for (pid, days, slots, _), evaluator in _shared_evaluators.items()
+                      if pid == os.getpid() and n_days in (None, days) and n_slots in (None, slots)]
+    for evaluator in evaluators:
+        evaluator.close()
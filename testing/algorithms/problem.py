@@ -0,0 +1,148 @@
+# testing/algorithms/problem.py
+
+import os
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+from .availability import AvailabilityGrid
+from .encoding import ChromosomeEncoder
+from .batch_fitness import BatchFitnessEvaluator
+from .problem_index import ProblemIndex
+from .seeding import ConstructiveSeeder
+
+DATA_FILES = ('teachers', 'classrooms', 'courses')
+
+
+def dataset_version(teachers: List[Dict], classrooms: List[Dict], courses: List[Dict],
+                    n_days: int = 5, n_slots: int = 8) -> str:
+    """Content hash of an instance's records and grid size"""
+    text = json.dumps([teachers, classrooms, courses, n_days, n_slots],
+                      sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+def directory_version(data_dir: str, n_days: int = 5, n_slots: int = 8) -> str:
+    """Version of the data files from their size and modification time, without reading them"""
+    stamps = []
+    for name in DATA_FILES:
+        stat = os.stat(os.path.join(data_dir, f'{name}.json'))
+        stamps.append((name, stat.st_size, stat.st_mtime_ns))
+    text = json.dumps([os.path.abspath(data_dir), stamps, n_days, n_slots])
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class CompiledProblem:
+    """One timetabling instance with everything derived from it, built once and shared read-only.
+
+    Holds the teacher, classroom and course records (resources carrying
+    compiled availability masks), the availability grid, encoder,
+    eligibility index, batch evaluator and constructive seeder. Schedulers never modify it, so
+    one instance can back any number of runs; with_changes builds a new one.
+    """
+
+    def __init__(self, teachers: List[Dict], classrooms: List[Dict], courses: List[Dict],
+                 n_days: int = 5, n_slots: int = 8, version: str = None):
+        self.grid = AvailabilityGrid(n_days, n_slots)
+        # Own copies, so callers' records never gain availability_mask or later edits
+        self.teachers = [self._compiled(teacher) for teacher in teachers]
+        self.classrooms = [self._compiled(classroom) for classroom in classrooms]
+        self.courses = [dict(course) for course in courses]
+        self.version = version or dataset_version(teachers, classrooms, courses, n_days, n_slots)
+
+        self.encoder = ChromosomeEncoder(self.courses, self.teachers, self.classrooms)
+        self.batch_evaluator = BatchFitnessEvaluator(n_days, n_slots)
+        self.index = ProblemIndex(self.courses, self.teachers, self.classrooms, self.grid)
+        self.seeder = ConstructiveSeeder(self.index, n_days, n_slots)
+
+    def _compiled(self, resource: Dict) -> Dict:
+        return dict(resource, availability_mask=self.grid.compile(resource.get('availability', {})))
+
+    @classmethod
+    def from_directory(cls, data_dir: str = './data', n_days: int = 5,
+                       n_slots: int = 8) -> 'CompiledProblem':
+        """Compile the instance in data_dir's teachers/classrooms/courses.json"""
+        version = directory_version(data_dir, n_days, n_slots)
+        records = {}
+        for name in DATA_FILES:
+            with open(os.path.join(data_dir, f'{name}.json'), 'r') as f:
+                records[name] = json.load(f)[name]
+        return cls(records['teachers'], records['classrooms'], records['courses'],
+                   n_days, n_slots, version=version)
+
+    def with_changes(self, changes: Dict) -> 'CompiledProblem':
+        """New instance with field updates applied, e.g. {'courses': {7: {'students': 45}}}"""
+        records = {}
+        for kind in DATA_FILES:
+            updates = {str(record_id): fields for record_id, fields in changes.get(kind, {}).items()}
+            known = {str(record['id']) for record in getattr(self, kind)}
+            for record_id in updates:
+                if record_id not in known:
+                    raise ValueError(f"Unknown {kind[:-1]} id: {record_id}")
+            records[kind] = [dict(record, **updates.get(str(record['id']), {}))
+                             for record in getattr(self, kind)]
+        return CompiledProblem(records['teachers'], records['classrooms'], records['courses'],
+                               self.grid.n_days, self.grid.n_slots)
+
+
+class ProblemPool:
+    """Compiled problems by dataset version, dropping the least recently used past maxsize"""
+
+    def __init__(self, maxsize: int = 8):
+        self.maxsize = maxsize
+        self._problems = OrderedDict()
+        # Versions being compiled, so concurrent requests for one wait for a single build
+        self._building = {}
+        self._lock = threading.Lock()
+        self.builds = 0
+
+    def __len__(self) -> int:
+        return len(self._problems)
+
+    def get(self, version: str, build: Callable[[], CompiledProblem]) -> CompiledProblem:
+        """The pooled problem for a version, compiling it with build() the first time.
+
+        Compiling happens outside the pool's lock, so requests for other
+        versions are never held up by it.
+        """
+        with self._lock:
+            if version in self._problems:
+                self._problems.move_to_end(version)
+                return self._problems[version]
+            building = self._building.get(version)
+            if building is None:
+                building = self._building[version] = Future()
+                owner = True
+            else:
+                owner = False
+        if not owner:
+            return building.result()
+
+        try:
+            problem = build()
+        except BaseException as e:
+            with self._lock:
+                del self._building[version]
+            building.set_exception(e)
+            raise
+        with self._lock:
+            del self._building[version]
+            self.builds += 1
+            self._problems[version] = problem
+            if len(self._problems) > self.maxsize:
+                self._problems.popitem(last=False)
+        building.set_result(problem)
+        return problem
+
+    def from_directory(self, data_dir: str, n_days: int = 5, n_slots: int = 8) -> CompiledProblem:
+        """Problem for the data files as they are now; they are only read when they change"""
+        version = directory_version(data_dir, n_days, n_slots)
+        return self.get(version, lambda: CompiledProblem.from_directory(data_dir, n_days, n_slots))
+
+    def from_records(self, teachers: List[Dict], classrooms: List[Dict], courses: List[Dict],
+                     n_days: int = 5, n_slots: int = 8) -> CompiledProblem:
+        version = dataset_version(teachers, classrooms, courses, n_days, n_slots)
+        return self.get(version, lambda: CompiledProblem(teachers, classrooms, courses,
+                                                         n_days, n_slots, version=version))
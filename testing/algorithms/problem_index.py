@@ -0,0 +1,88 @@
+# testing/algorithms/problem_index.py
+
+from bisect import bisect_left
+from typing import List, Dict
+from .availability import AvailabilityGrid
+
+
+class ProblemIndex:
+    """Eligibility lookups for one problem instance, built once per scheduler.
+
+    Answers "which teachers / rooms could take this course" and "which of
+    them are free at (day, slot)" without rescanning every teacher and
+    classroom. Results are lists of indices into the scheduler's teacher
+    and classroom lists.
+    """
+
+    def __init__(self, courses: List[Dict], teachers: List[Dict], classrooms: List[Dict],
+                 grid: AvailabilityGrid):
+        self.courses = courses
+        self.days = list(range(grid.n_days))
+        self.time_slots = list(range(grid.n_slots))
+
+        # subject -> indices of teachers qualified to teach it
+        self.qualified_teachers = {}
+        for i, teacher in enumerate(teachers):
+            for subject in teacher['subjects']:
+                self.qualified_teachers.setdefault(subject, []).append(i)
+
+        # Rooms sorted by capacity, so rooms large enough for a class are a suffix
+        self.rooms_by_capacity = sorted(range(len(classrooms)),
+                                        key=lambda i: classrooms[i]['capacity'])
+        self.capacities = [classrooms[i]['capacity'] for i in self.rooms_by_capacity]
+
+        # (day, slot) -> indices of teachers / rooms free at that time, read
+        # off the compiled availability bitmasks
+        teacher_masks = [grid.mask_of(t) for t in teachers]
+        room_masks = [grid.mask_of(c) for c in classrooms]
+        self.free_teachers = {}
+        self.free_rooms = {}
+        for day in self.days:
+            for slot in self.time_slots:
+                bit = grid.bit(day, slot)
+                self.free_teachers[(day, slot)] = {i for i, m in enumerate(teacher_masks) if m & bit}
+                self.free_rooms[(day, slot)] = {i for i, m in enumerate(room_masks) if m & bit}
+
+        self._teacher_cache = {}
+        self._room_cache = {}
+        self._open_slot_cache = {}
+
+    def teachers_for(self, course_idx: int) -> List[int]:
+        """Teachers qualified for the course's subject"""
+        return self.qualified_teachers.get(self.courses[course_idx]['subject'], [])
+
+    def rooms_for(self, course_idx: int) -> List[int]:
+        """Rooms with enough capacity for the course, smallest first"""
+        start = bisect_left(self.capacities, self.courses[course_idx]['students'])
+        return self.rooms_by_capacity[start:]
+
+    def free_teachers_for(self, course_idx: int, day: int, slot: int) -> List[int]:
+        """Qualified teachers available at (day, slot)"""
+        key = (self.courses[course_idx]['subject'], day, slot)
+        if key not in self._teacher_cache:
+            free = self.free_teachers[(day, slot)]
+            self._teacher_cache[key] = [i for i in self.teachers_for(course_idx) if i in free]
+        return self._teacher_cache[key]
+
+    def free_rooms_for(self, course_idx: int, day: int, slot: int) -> List[int]:
+        """Large-enough rooms available at (day, slot)"""
+        key = (self.courses[course_idx]['students'], day, slot)
+        if key not in self._room_cache:
+            free = self.free_rooms[(day, slot)]
+            self._room_cache[key] = [i for i in self.rooms_for(course_idx) if i in free]
+        return self._room_cache[key]
+
+    def open_slots_for(self, course_idx: int) -> List[tuple]:
+        """(day, slots) pairs where the course could get both a teacher and a room"""
+        course = self.courses[course_idx]
+        key = (course['subject'], course['students'])
+        if key not in self._open_slot_cache:
+            open_days = []
+            for day in self.days:
+                slots = [slot for slot in self.time_slots
+                         if self.free_teachers_for(course_idx, day, slot) and
+                         self.free_rooms_for(course_idx, day, slot)]
+                if slots:
+                    open_days.append((day, slots))
+            self._open_slot_cache[key] = open_days
+        return self._open_slot_cache[key]
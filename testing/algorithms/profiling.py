@@ -0,0 +1,133 @@
+# testing/algorithms/profiling.py
+
+import threading
+from collections import Counter
+from typing import Dict, List, Optional
+
+
+class RunProfiler:
+    """Per-phase timers and operator counters for one GA run.
+
+    Whole-generation phases (initialization, fitness, breeding) are timed
+    every generation; the per-operator split of breeding into selection,
+    crossover and mutation, operator application counts and the tracking of
+    which children improved on their parents only every sample_every-th
+    generation. Sampled operator times are scaled up to the whole run in
+    the report; counts are left as sampled.
+    """
+
+    PHASES = ('initialization', 'fitness', 'selection', 'crossover', 'mutation')
+
+    def __init__(self, sample_every: int = 1):
+        self.sample_every = max(1, sample_every)
+        self.reset()
+
+    def reset(self, cache_stats: Optional[Dict] = None):
+        # Fitness cache counters at the start of the run, as the cache outlives runs
+        self.cache_start = cache_stats
+        self.seconds = dict.fromkeys(self.PHASES, 0.0)
+        self.breeding_seconds = 0.0
+        self.sampled_breeding_seconds = 0.0
+        self.counters = Counter()
+        self.generations = 0
+        self.sampled_generations = 0
+        self.sampling = False
+        # (best parent score, operators applied) per child of the last sampled generation
+        self.lineage = None
+
+    def start_generation(self, generation: int):
+        self.sampling = generation % self.sample_every == 0
+
+    def credit(self, fitness_scores: List[float]):
+        """Count children of the last sampled generation that beat their parents, by operator"""
+        if self.lineage is None:
+            return
+        for score, origin in zip(fitness_scores, self.lineage):
+            if origin is not None and score > origin[0]:
+                for operator in origin[1]:
+                    self.counters[f'{operator}_improvements'] += 1
+        self.lineage = None
+
+    def report(self, cache_stats: Optional[Dict] = None) -> Dict:
+        """Phase seconds, counters and sampling details as a plain dict"""
+        seconds = dict(self.seconds)
+        if self.sampled_breeding_seconds > 0:
+            # Spread the measured breeding time over operators in the sampled proportions
+            sampled = sum(seconds[phase] for phase in ('selection', 'crossover', 'mutation'))
+            for phase in ('selection', 'crossover', 'mutation'):
+                seconds[phase] = self.breeding_seconds * seconds[phase] / sampled if sampled else 0.0
+        counters = dict(self.counters)
+        if cache_stats is not None:
+            start = self.cache_start or {'hits': 0, 'misses': 0}
+            counters['cache_hits'] = cache_stats['hits'] - start['hits']
+            counters['cache_misses'] = cache_stats['misses'] - start['misses']
+        return {
+            'generations': self.generations,
+            'sampled_generations': self.sampled_generations,
+            'sample_every': self.sample_every,
+            'phase_seconds': seconds,
+            'counters': counters
+        }
+
+
+class MetricsRegistry:
+    """Totals over finished run reports, rendered in the Prometheus text format"""
+
+    COUNTERS = {
+        'evaluations': 'Chromosome fitness evaluations',
+        'cache_hits': 'Fitness cache hits',
+        'cache_misses': 'Fitness cache misses',
+        'local_search_evaluations': 'Neighbours scored by local search on the elite',
+        'clones_eliminated': 'Duplicate chromosomes replaced at generation boundaries',
+    }
+
+    def __init__(self, prefix: str = 'agadr'):
+        self.prefix = prefix
+        self.runs = 0
+        self.generations = 0
+        self.phase_seconds = Counter()
+        self.counters = Counter()
+        self._lock = threading.Lock()
+
+    def record(self, report: Optional[Dict]):
+        if not report:
+            return
+        with self._lock:
+            self.runs += 1
+            self.generations += report['generations']
+            self.phase_seconds.update(report['phase_seconds'])
+            self.counters.update(report['counters'])
+
+    def render(self, gauges: Dict[str, Dict] = None) -> str:
+        """Exposition text, plus live values given as {name: {'help', 'label', 'values': {label value: number}}}.
+
+        Those are gauges unless their entry sets 'type'.
+        """
+        p = self.prefix
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f'# HELP {p}_{name} {help_text}')
+            lines.append(f'# TYPE {p}_{name} {kind}')
+            for labels, value in samples:
+                lines.append(f'{p}_{name}{labels} {value}')
+
+        with self._lock:
+            metric('runs_total', 'counter', 'Finished GA runs', [('', self.runs)])
+            metric('generations_total', 'counter', 'Generations evolved', [('', self.generations)])
+            metric('phase_seconds_total', 'counter', 'Seconds spent per GA phase',
+                   [(f'{{phase="{phase}"}}', round(self.phase_seconds[phase], 6))
+                    for phase in RunProfiler.PHASES])
+            for name, help_text in self.COUNTERS.items():
+                metric(f'{name}_total', 'counter', help_text, [('', self.counters[name])])
+            operators = ('crossover', 'mutation')
+            metric('operator_applications_total', 'counter', 'Operator applications (sampled generations)',
+                   [(f'{{operator="{op}"}}', self.counters[op]) for op in operators])
+            metric('operator_improvements_total', 'counter',
+                   'Children fitter than their best parent, by operator applied (sampled generations)',
+                   [(f'{{operator="{op}"}}', self.counters[f'{op}_improvements']) for op in operators])
+        for name, samples in (gauges or {}).items():
+            label, values = samples['label'], samples['values']
+            metric(name, samples.get('type', 'gauge'), samples['help'],
+                   [(f'{{{label}="{key}"}}', value) for key, value in values.items()])
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,132 @@
+# testing/algorithms/result_cache.py
+
+import os
+import json
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional
+
+
+def canonical_key(payload: Dict, fields: Iterable[str]) -> str:
+    """SHA-256 of the payload's listed fields as canonical JSON.
+
+    Keys are sorted and separators fixed, so payloads that differ only in
+    key order or whitespace, or in fields outside the list, share a key.
+    """
+    normalized = {field: payload.get(field) for field in fields}
+    text = json.dumps(normalized, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """Solve results by content key: a bounded in-memory LRU in front of an optional directory.
+
+    Disk entries are one JSON file per key and survive restarts; the
+    oldest-used files are removed once there are more than max_disk_entries.
+    Results are stored in their JSON form, so a hit returns what the
+    original response serialized to.
+    """
+
+    def __init__(self, fields: Iterable[str], maxsize: int = 128,
+                 directory: Optional[str] = None, max_disk_entries: int = 1024):
+        self.fields = tuple(fields)
+        self.maxsize = maxsize
+        self.directory = directory
+        self.max_disk_entries = max_disk_entries
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._results = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, payload: Dict) -> str:
+        return canonical_key(payload, self.fields)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.json')
+
+    def get(self, key: str):
+        with self._lock:
+            if key in self._results:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return self._results[key]
+        result = self._read(key)
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                return None
+            self.disk_hits += 1
+            self._remember(key, result)
+        return result
+
+    def put(self, key: str, result):
+        result = json.loads(json.dumps(result))
+        with self._lock:
+            self._remember(key, result)
+        self._write(key, result)
+
+    def _remember(self, key: str, result):
+        self._results[key] = result
+        self._results.move_to_end(key)
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+
+    def _read(self, key: str):
+        if not self.directory:
+            return None
+        try:
+            with open(self._path(key), 'r') as f:
+                result = json.load(f)
+            os.utime(self._path(key))  # Mark as recently used for disk eviction
+            return result
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def _write(self, key: str, result):
+        """Store an entry on disk; a failed write only costs the disk tier that entry"""
+        if not self.directory:
+            return
+        # Write then rename, so a reader never sees a half-written entry. The
+        # temporary name is unique across threads and processes sharing the directory
+        tmp_path = None
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f'{key}.', suffix='.tmp')
+            with os.fdopen(fd, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, self._path(key))
+        except OSError as e:
+            print(f"Could not write cached result {key}: {e}")
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        try:
+            entries = [entry for entry in os.scandir(self.directory) if entry.name.endswith('.json')]
+            if len(entries) > self.max_disk_entries:
+                entries.sort(key=lambda entry: entry.stat().st_mtime)
+                for entry in entries[:len(entries) - self.max_disk_entries]:
+                    os.remove(entry.path)
+        except FileNotFoundError:
+            pass  # Another process evicted the same entries first
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
+        if self.directory:
+            for entry in os.scandir(self.directory):
+                if entry.name.endswith('.json'):
+                    os.remove(entry.path)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            'size': len(self._results),
+            'maxsize': self.maxsize,
+            'hits': self.hits,
+            'disk_hits': self.disk_hits,
+            'misses': self.misses
+        }
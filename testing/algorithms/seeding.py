@@ -0,0 +1,106 @@
+# testing/algorithms/seeding.py
+
+import random
+from typing import Dict, Iterator, List, Tuple
+from .problem_index import ProblemIndex
+
+
+def _bits(mask: int) -> List[int]:
+    """Indices of the set bits of mask"""
+    indices = []
+    while mask:
+        low = mask & -mask
+        indices.append(low.bit_length() - 1)
+        mask ^= low
+    return indices
+
+
+class ConstructiveSeeder:
+    """Near-feasible timetables built most-constrained-course first (DSatur-style).
+
+    Courses are placed in order of how few (day, slot, teacher, room)
+    options they have per session, with randomized tie-breaks and jitter so
+    repeated calls give different timetables. Each session then goes to a
+    random period where a qualified teacher and a large-enough room are
+    both still unused, preferring teachers without a class in the
+    neighbouring periods. Occupancy is kept as one teacher bitmask and one
+    room bitmask per period, so checking a period is a couple of int ops.
+    Sessions with no clash-free period left are placed at random, like
+    AGADRScheduler.create_chromosome does.
+    """
+
+    def __init__(self, index: ProblemIndex, n_days: int, n_slots: int, jitter: float = 0.3):
+        self.index = index
+        self.n_days = n_days
+        self.n_slots = n_slots
+        self.jitter = jitter
+        self._mask_cache = {}
+        self._difficulty = {}
+
+    def _candidate_masks(self, course_idx: int) -> Dict[Tuple[int, int], Tuple[int, int]]:
+        """(day, slot) -> (teacher mask, room mask) of the course's available candidates"""
+        course = self.index.courses[course_idx]
+        key = (course['subject'], course['students'])
+        if key not in self._mask_cache:
+            masks = {}
+            for day, slots in self.index.open_slots_for(course_idx):
+                for slot in slots:
+                    teachers = sum(1 << t for t in self.index.free_teachers_for(course_idx, day, slot))
+                    rooms = sum(1 << r for r in self.index.free_rooms_for(course_idx, day, slot))
+                    masks[(day, slot)] = (teachers, rooms)
+            self._mask_cache[key] = masks
+        return self._mask_cache[key]
+
+    def difficulty(self, course_idx: int) -> float:
+        """Options per session needed: fewer means more constrained"""
+        if course_idx not in self._difficulty:
+            options = sum(min(bin(t).count('1'), bin(r).count('1'))
+                          for t, r in self._candidate_masks(course_idx).values())
+            sessions = self.index.courses[course_idx].get('sessions_per_week', 1)
+            self._difficulty[course_idx] = options / max(sessions, 1)
+        return self._difficulty[course_idx]
+
+    def place(self, rng=random) -> Iterator[Tuple[int, int, int, int, int, int]]:
+        """Yield (course, session, day, slot, teacher, room) rows in course order.
+
+        rng is the random.Random (or the random module) to draw choices from;
+        the seeder is shared by every scheduler on the problem, so it keeps none.
+        """
+        courses = [c for c in range(len(self.index.courses)) if self._candidate_masks(c)]
+        order = sorted(courses, key=lambda c: self.difficulty(c) *
+                       rng.uniform(1 - self.jitter, 1 + self.jitter))
+
+        busy_teachers = {}
+        busy_rooms = {}
+        rows = []
+        for course_idx in order:
+            candidates = self._candidate_masks(course_idx)
+            cells = list(candidates)
+            for session in range(self.index.courses[course_idx].get('sessions_per_week', 1)):
+                free_cells = []
+                for cell in cells:
+                    teachers, rooms = candidates[cell]
+                    teachers &= ~busy_teachers.get(cell, 0)
+                    rooms &= ~busy_rooms.get(cell, 0)
+                    if teachers and rooms:
+                        free_cells.append((cell, teachers, rooms))
+
+                if free_cells:
+                    (day, slot), teachers, rooms = rng.choice(free_cells)
+                    # Avoid back-to-back classes when a teacher without one is free
+                    neighbours = busy_teachers.get((day, slot - 1), 0) | busy_teachers.get((day, slot + 1), 0)
+                    rested = teachers & ~neighbours
+                    teacher = rng.choice(_bits(rested or teachers))
+                    room = rng.choice(_bits(rooms))
+                else:
+                    day, slot = rng.choice(cells)
+                    teacher = rng.choice(self.index.free_teachers_for(course_idx, day, slot))
+                    room = rng.choice(self.index.free_rooms_for(course_idx, day, slot))
+
+                busy_teachers[(day, slot)] = busy_teachers.get((day, slot), 0) | 1 << teacher
+                busy_rooms[(day, slot)] = busy_rooms.get((day, slot), 0) | 1 << room
+                rows.append((course_idx, session, day, slot, teacher, room))
+
+        # Genes stay in course order, so crossover lines up with random chromosomes
+        rows.sort(key=lambda row: (row[0], row[1]))
+        return iter(rows)
@@ -0,0 +1,43 @@
+# testing/algorithms/selection.py
+
+import numpy as np
+
+
+def tournament(scores: np.ndarray, n: int, size: float, rng: np.random.Generator) -> np.ndarray:
+    """Winners of n tournaments of `size` individuals drawn with replacement"""
+    entrants = rng.integers(0, len(scores), size=(n, max(1, int(size))))
+    return entrants[np.arange(n), scores[entrants].argmax(axis=1)]
+
+
+def linear_rank(scores: np.ndarray, n: int, pressure: float, rng: np.random.Generator) -> np.ndarray:
+    """n draws weighted by fitness rank; the best is `pressure` times as likely as average (1 to 2)"""
+    size = len(scores)
+    if size == 1:
+        return np.zeros(n, dtype=np.intp)
+    ranks = np.empty(size)
+    ranks[np.argsort(scores, kind='stable')] = np.arange(size)
+    weights = (2 - pressure) / size + 2 * ranks * (pressure - 1) / (size * (size - 1))
+    return stochastic_universal(weights, n, 1.0, rng)
+
+
+def stochastic_universal(scores: np.ndarray, n: int, pressure: float, rng: np.random.Generator) -> np.ndarray:
+    """n draws proportional to scores ** pressure with evenly spaced pointers, in random order.
+
+    Every individual gets within one of its expected number of copies.
+    """
+    weights = np.power(np.maximum(scores, 0.0), pressure)
+    total = weights.sum()
+    if total <= 0:
+        return rng.integers(0, len(scores), size=n)
+    cumulative = np.cumsum(weights / total)
+    pointers = (rng.random() + np.arange(n)) / n
+    chosen = np.minimum(np.searchsorted(cumulative, pointers, side='right'), len(scores) - 1)
+    return rng.permutation(chosen)
+
+
+# Scheme -> (function, default selection pressure)
+SCHEMES = {
+    'tournament': (tournament, 3),
+    'rank': (linear_rank, 1.5),
+    'sus': (stochastic_universal, 1.0),
+}
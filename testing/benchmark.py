@@ -0,0 +1,146 @@
+# testing/benchmark.py
+
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import resource
+import tracemalloc
+import numpy as np
+from algorithms.agadr import AGADRScheduler
+from algorithms.fitness import FitnessCalculator
+from algorithms.problem import CompiledProblem
+from utils.data_generator import generate_instance
+
+# Instance sizes benchmarked by default
+SCALES = {
+    'small': {'n_teachers': 20, 'n_rooms': 10, 'n_courses': 50, 'n_subjects': 10},
+    'medium': {'n_teachers': 100, 'n_rooms': 60, 'n_courses': 300, 'n_subjects': 30},
+    'large': {'n_teachers': 300, 'n_rooms': 150, 'n_courses': 1000, 'n_subjects': 60},
+}
+
+def time_operation(operation, min_time: float = 0.2, max_repeats: int = 10000) -> dict:
+    """Call operation until min_time has passed and report its rate"""
+    operation()  # Warm up lazily built lookups first
+    repeats, started = 0, time.perf_counter()
+    elapsed = 0.0
+    while elapsed < min_time and repeats < max_repeats:
+        operation()
+        repeats += 1
+        elapsed = time.perf_counter() - started
+    return {'ops_per_sec': repeats / elapsed, 'mean_ms': 1000 * elapsed / repeats, 'repeats': repeats}
+
+def peak_memory(operation) -> int:
+    """Peak bytes allocated by Python while running operation once"""
+    tracemalloc.start()
+    try:
+        operation()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def benchmark_scale(params: dict, encoding: str = 'dict', population_size: int = 50,
+                    generations: int = 20, seed: int = 0, min_time: float = 0.2) -> dict:
+    """Time the GA's operators and a full run on one generated instance"""
+    random.seed(seed)
+    instance = generate_instance(seed=seed, **params)
+    problem = CompiledProblem(instance['teachers'], instance['classrooms'], instance['courses'])
+    scheduler = AGADRScheduler(population_size=population_size, generations=generations,
+                               encoding=encoding, fitness_cache_size=0, problem=problem)
+    calculator = FitnessCalculator(grid=problem.grid)
+
+    parent1, parent2 = scheduler.create_chromosome(), scheduler.create_chromosome()
+    decoded = scheduler.decode(parent1)
+    operations = {
+        'create_chromosome': scheduler.create_chromosome,
+        'fitness': lambda: scheduler.fitness(parent1),
+        'calculate_fitness': lambda: calculator.calculate_fitness(decoded),
+        'crossover': lambda: scheduler.crossover(parent1, parent2),
+        'mutate': lambda: scheduler.mutate(parent1),
+    }
+    # Cross over and mutate on every call, so the rates measure the operators
+    # rather than the coin flips
+    rates = scheduler.mutation_rate, scheduler.crossover_rate
+    scheduler.mutation_rate = scheduler.crossover_rate = 1.0
+    results = {name: time_operation(operation, min_time) for name, operation in operations.items()}
+    scheduler.mutation_rate, scheduler.crossover_rate = rates
+
+    def run():
+        ran = 0
+        for ran, _ in enumerate(scheduler.evolution(), 1):
+            pass
+        return ran
+
+    started = time.perf_counter()
+    ran = run()
+    elapsed = time.perf_counter() - started
+    results['evolve'] = {'generations': ran, 'seconds': elapsed,
+                         'generations_per_sec': ran / elapsed if elapsed else 0.0,
+                         'peak_bytes': peak_memory(run)}
+    return {'params': params, 'sessions': len(parent1), 'results': results}
+
+def compare(report: dict, baseline: dict, threshold: float) -> list:
+    """Operations whose rate fell by more than threshold (a fraction) against the baseline"""
+    regressions = []
+    for scale, current in report['scales'].items():
+        previous = baseline.get('scales', {}).get(scale)
+        if previous is None:
+            continue
+        for name, result in current['results'].items():
+            metric = 'generations_per_sec' if name == 'evolve' else 'ops_per_sec'
+            before = previous['results'].get(name, {}).get(metric)
+            if before and result[metric] < before * (1 - threshold):
+                regressions.append({'scale': scale, 'operation': name, 'metric': metric,
+                                    'baseline': before, 'current': result[metric]})
+    return regressions
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the AGADR scheduler")
+    parser.add_argument('--scales', default='small,medium',
+                        help=f"comma-separated subset of {', '.join(SCALES)}")
+    parser.add_argument('--encoding', default='dict', choices=('dict', 'array', 'compact'))
+    parser.add_argument('--population', type=int, default=50)
+    parser.add_argument('--generations', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--min-time', type=float, default=0.2,
+                        help="seconds to spend timing each operation")
+    parser.add_argument('--output', help="write the JSON report here instead of stdout")
+    parser.add_argument('--baseline', help="earlier report to check for regressions")
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help="allowed slowdown against the baseline, as a fraction")
+    args = parser.parse_args(argv)
+
+    report = {
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'machine': platform.machine(),
+        'timestamp': time.time(),
+        'encoding': args.encoding,
+        'population_size': args.population,
+        'scales': {}
+    }
+    for scale in args.scales.split(','):
+        print(f"Benchmarking {scale}...", file=sys.stderr)
+        report['scales'][scale] = benchmark_scale(SCALES[scale], args.encoding, args.population,
+                                                  args.generations, args.seed, args.min_time)
+    # Linux reports kilobytes
+    report['max_rss_bytes'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        report['regressions'] = regressions
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w') as f:
+            f.write(text)
+    else:
+        print(text)
+    return 1 if regressions else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -32,6 +32,10 @@ if __name__ == '__main__':
     if len(sys.argv) > 1 and sys.argv[1] == 'test':
         success = run_all_tests()
         sys.exit(0 if success else 1)
+    # 'bench' runs the benchmark suite, passing on the remaining arguments
+    elif len(sys.argv) > 1 and sys.argv[1] == 'bench':
+        from benchmark import main
+        sys.exit(main(sys.argv[2:]))
     # Otherwise generate sample schedule
     else:
         run_sample_schedule()
\ No newline at end of file
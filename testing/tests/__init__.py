@@ -1 +0,0 @@
-t
\ No newline at end of file
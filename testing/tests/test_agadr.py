@@ -1,7 +1,10 @@
 # testing/tests/test_agadr.py
 
+import random
+import threading
 import unittest
 from algorithms.agadr import AGADRScheduler
+from utils.data_generator import generate_instance
 
 class TestAGADRScheduler(unittest.TestCase):
     def setUp(self):
@@ -31,6 +34,15 @@ class TestAGADRScheduler(unittest.TestCase):
         self.assertGreaterEqual(fitness, 0)
         self.assertLessEqual(fitness, 1)
 
+    def test_mutation_leaves_parent_untouched(self):
+        """Test if mutating a dict chromosome never edits genes the parent still holds"""
+        self.scheduler.mutation_rate = 1.0
+        parent = self.scheduler.create_chromosome()
+        snapshot = [dict(gene) for gene in parent]
+        for _ in range(20):
+            self.scheduler.mutate(parent)
+        self.assertEqual(parent, snapshot)
+
     def test_crossover(self):
         """Test if crossover produces valid offspring"""
         parent1 = self.scheduler.create_chromosome()
@@ -54,6 +66,111 @@ class TestAGADRScheduler(unittest.TestCase):
         if solution:
             self.assertIsInstance(solution[0], dict)
 
+    def test_evolution_stats(self):
+        """Test if the evolution generator yields per-generation stats and the best so far"""
+        for stats, best in self.scheduler.evolution():
+            self.assertEqual(set(stats), {'generation', 'best_fitness', 'mean_fitness',
+                                          'diversity', 'elapsed'})
+            self.assertLessEqual(stats['mean_fitness'], stats['best_fitness'])
+            self.assertGreater(stats['diversity'], 0)
+            self.assertAlmostEqual(self.scheduler.fitness(best), stats['best_fitness'])
+
+    def test_stop_reasons(self):
+        """Test if each stopping rule ends the run and is reported as the stop reason"""
+        scheduler = self.make_small_scheduler(generations=3, target_fitness=2.0)
+        self.assertEqual(scheduler.solve()['stop_reason'], 'generations')
+
+        scheduler = self.make_small_scheduler(generations=50, target_fitness=2.0, stagnation_limit=2)
+        outcome = scheduler.solve()
+        self.assertEqual(outcome['stop_reason'], 'stagnation')
+        self.assertLess(outcome['generations'], 50)
+
+        scheduler = self.make_small_scheduler(generations=1000, target_fitness=2.0)
+        outcome = scheduler.solve(time_budget=0.05)
+        self.assertEqual(outcome['stop_reason'], 'time_budget')
+        self.assertLess(outcome['generations'], 1000)
+        self.assertIsInstance(outcome['timetable'], dict)
+
+        scheduler = self.make_small_scheduler(target_fitness=0.0)
+        self.assertEqual(scheduler.solve()['stop_reason'], 'target_reached')
+        scheduler.evolve(callback=lambda stats: False)
+        self.assertEqual(scheduler.stop_reason, 'callback')
+        with self.assertRaises(ValueError):
+            self.make_small_scheduler(time_budget=0)
+
+    def test_seeded_runs_ignore_other_threads(self):
+        """Test if concurrent seeded solves match a lone one while other threads reseed random"""
+        # Big enough for the threads to interleave mid-run
+        instance = generate_instance(n_teachers=3, n_rooms=2, n_courses=30, n_subjects=3, seed=0)
+
+        def seeded_solve():
+            return AGADRScheduler(population_size=10, generations=10, target_fitness=2.0, seed=7,
+                                  seeding='constructive', local_search_budget=10,
+                                  **instance).solve()['timetable']
+
+        expected = seeded_solve()
+        results = [None, None]
+        stop = threading.Event()
+
+        def solve(i):
+            results[i] = seeded_solve()
+
+        def disturb():
+            while not stop.is_set():
+                random.seed(random.random())
+
+        noise = threading.Thread(target=disturb)
+        solvers = [threading.Thread(target=solve, args=(i,)) for i in range(2)]
+        noise.start()
+        for thread in solvers:
+            thread.start()
+        for thread in solvers:
+            thread.join()
+        stop.set()
+        noise.join()
+        self.assertEqual(results, [expected, expected])
+
+    def make_small_scheduler(self, **kwargs):
+        week = {str(day): [True] * 8 for day in range(5)}
+        teachers = [{'id': i, 'name': f'T{i}', 'subjects': ['Mathematics'], 'availability': week}
+                    for i in range(2)]
+        classrooms = [{'id': i, 'room_number': str(100 + i), 'capacity': 30 + 10 * i,
+                       'availability': week} for i in range(2)]
+        courses = [{'id': i, 'name': f'C{i}', 'subject': 'Mathematics', 'students': 25,
+                    'sessions_per_week': 2} for i in range(3)]
+        kwargs.setdefault('generations', 5)
+        return AGADRScheduler(population_size=6, teachers=teachers,
+                              classrooms=classrooms, courses=courses, **kwargs)
+
+    def test_repair_moves_only_affected_sessions(self):
+        """Test if repair re-places the sessions a change invalidates and keeps the rest"""
+        scheduler = self.make_small_scheduler(encoding='array')
+        solution = scheduler.create_chromosome()
+        teacher = scheduler.teachers[int(solution.teacher[0])]
+        day = int(solution.day[0])
+        availability = {str(d): [d != day] * 8 for d in range(5)}
+
+        repaired, report = scheduler.repair(solution, {'teachers': {teacher['id']: {'availability': availability}}})
+        affected = [i for i in range(len(solution))
+                    if solution.teacher[i] == solution.teacher[0] and solution.day[i] == day]
+        self.assertEqual(report['affected'], len(affected))
+        self.assertLessEqual(report['moved'], len(affected))
+        for i in range(len(solution)):
+            self.assertTrue(scheduler._placement_allowed(repaired, i))
+            if i not in affected:
+                self.assertEqual(scheduler.cell_of(repaired, i), scheduler.cell_of(solution, i))
+
+    def test_repair_course_growth_keeps_encoding(self):
+        """Test if repair moves a grown course to a larger room and returns dict genes for dict input"""
+        scheduler = self.make_small_scheduler()
+        solution = scheduler.create_chromosome()
+        repaired, report = scheduler.repair(solution, {'courses': {'0': {'students': 35}}})
+        self.assertIsInstance(repaired, list)
+        for gene in repaired:
+            self.assertGreaterEqual(gene['classroom']['capacity'], gene['course']['students'])
+        with self.assertRaises(ValueError):
+            scheduler.repair(solution, {'teachers': {99: {}}})
+
     def test_timetable_generation(self):
         """Test if timetable generation produces valid format"""
         timetable = self.scheduler.generate_timetable()
@@ -61,6 +178,31 @@ class TestAGADRScheduler(unittest.TestCase):
         for day in range(5):
             self.assertIn(day, timetable)
             self.assertIsInstance(timetable[day], dict)
+
+    def test_crossover_point_matches_exhaustive_search(self):
+        """Test if the sweep picks the same cut point as scoring every child"""
+        random.seed(5)
+        for _ in range(20):
+            parent1 = self.scheduler.create_chromosome()
+            parent2 = self.scheduler.create_chromosome()
+            for gene in parent1 + parent2:
+                gene['day'] = 0
+            scores = [self.scheduler.fitness(parent1[:i] + parent2[i:])
+                      for i in range(len(parent1))]
+            self.assertEqual(self.scheduler.best_crossover_point(parent1, parent2),
+                             scores.index(max(scores)))
+
+    def test_uniform_and_segment_crossover(self):
+        """Test if uniform and segment crossover keep every gene position"""
+        parent1 = self.scheduler.create_chromosome()
+        parent2 = self.scheduler.create_chromosome()
+        for method in ('uniform', 'segment'):
+            self.scheduler.crossover_method = method
+            self.scheduler.crossover_rate = 1.0
+            child1, child2 = self.scheduler.crossover(parent1, parent2)
+            self.assertEqual(len(child1), len(parent1))
+            for g1, g2, c1, c2 in zip(parent1, parent2, child1, child2):
+                self.assertTrue((c1 is g1 and c2 is g2) or (c1 is g2 and c2 is g1))
             # testing/tests/test_agadr.py
 
 def setUp(self):
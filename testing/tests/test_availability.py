@@ -0,0 +1,48 @@
+# testing/tests/test_availability.py
+
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.availability import AvailabilityGrid
+
+class TestAvailabilityGrid(unittest.TestCase):
+    def setUp(self):
+        self.grid = AvailabilityGrid(n_days=6, n_slots=12)
+
+    def test_compile_key_styles(self):
+        """Test if string-keyed, int-keyed and list availability compile alike"""
+        days = [[slot % 2 == 0 for slot in range(12)] for _ in range(6)]
+        as_list = self.grid.compile(days)
+        self.assertEqual(self.grid.compile({str(d): v for d, v in enumerate(days)}), as_list)
+        self.assertEqual(self.grid.compile({d: v for d, v in enumerate(days)}), as_list)
+        self.assertTrue(self.grid.is_free(as_list, 5, 10))
+        self.assertFalse(self.grid.is_free(as_list, 5, 11))
+
+    def test_missing_periods_unavailable(self):
+        """Test if days and slots absent from the data count as unavailable"""
+        mask = self.grid.compile({'0': [True] * 8})
+        self.assertTrue(self.grid.is_free(mask, 0, 7))
+        self.assertFalse(self.grid.is_free(mask, 0, 8))
+        self.assertFalse(self.grid.is_free(mask, 1, 0))
+
+    def test_consecutive_penalty(self):
+        """Test if runs longer than three are penalised without crossing days"""
+        busy = 0
+        for slot in range(6):           # run of 6 on day 0 -> 3
+            busy |= self.grid.bit(0, slot)
+        for slot in (9, 10, 11):        # run of 3 ending the day -> 0
+            busy |= self.grid.bit(1, slot)
+        for slot in (0, 1):             # continues into day 2, but must not join
+            busy |= self.grid.bit(2, slot)
+        self.assertEqual(self.grid.consecutive_penalty(busy), 3)
+
+    def test_scheduler_grid_size(self):
+        """Test if the scheduler honours a configurable week grid"""
+        scheduler = AGADRScheduler(n_days=6, n_slots=12)
+        self.assertEqual(len(scheduler.days), 6)
+        self.assertEqual(len(scheduler.format_timetable([])[5]), 12)
+        for gene in scheduler.create_chromosome():
+            self.assertTrue(scheduler.is_teacher_available(gene['teacher'], gene['day'],
+                                                           gene['time_slot']))
+
+if __name__ == '__main__':
+    unittest.main()
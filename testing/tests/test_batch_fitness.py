@@ -0,0 +1,56 @@
+# testing/tests/test_batch_fitness.py
+
+import random
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.fitness import FitnessCalculator
+
+class TestBatchFitness(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.scheduler = AGADRScheduler(encoding='array', fitness_engine='batch')
+        self.population = self.scheduler.initialize_population()
+        # Squeeze the timetable into one morning so every kind of conflict occurs
+        for chromosome in self.population:
+            chromosome.day[:] = 0
+            chromosome.slot[:] = [random.randrange(5) for _ in range(len(chromosome))]
+
+    def random_dict_chromosome(self, n_genes):
+        teachers = [{'id': i, 'availability': [[slot % 3 != 0 for slot in range(8)]] * 5}
+                    for i in range(3)]
+        rooms = [{'id': i, 'capacity': 25 + 5 * i} for i in range(3)]
+        courses = [{'name': f'Course{i}', 'students': 20 + 5 * i} for i in range(4)]
+        return [{
+            'day': random.randrange(2),
+            'time_slot': random.randrange(8),
+            'course': random.choice(courses),
+            'teacher': random.choice(teachers),
+            'classroom': random.choice(rooms)
+        } for _ in range(n_genes)]
+
+    def test_scheduler_batch_matches_scalar(self):
+        """Test if batch population fitness equals per-chromosome fitness"""
+        batch = self.scheduler.evaluate_population(self.population)
+        scalar = [self.scheduler.fitness(self.scheduler.decode(chrom))
+                  for chrom in self.population]
+        for b, s in zip(batch, scalar):
+            self.assertAlmostEqual(b, s)
+        self.assertLess(min(batch), 1)
+
+    def test_calculator_batch_matches_scalar(self):
+        """Test if the batch FitnessCalculator engine equals the scalar engine"""
+        population = [self.random_dict_chromosome(n) for n in (0, 1, 12, 30, 60)]
+        scalar = FitnessCalculator().calculate_population_fitness(population)
+        batch = FitnessCalculator(engine='batch').calculate_population_fitness(population)
+        for b, s in zip(batch, scalar):
+            self.assertAlmostEqual(b, s)
+        self.assertAlmostEqual(FitnessCalculator(engine='batch').calculate_fitness(population[3]),
+                               scalar[3])
+
+    def test_evolve_with_batch_engine(self):
+        """Test if evolution runs with the batch fitness engine"""
+        solution = self.scheduler.evolve()
+        self.assertEqual(len(self.scheduler.decode(solution)), len(solution))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,22 @@
+# testing/tests/test_benchmark.py
+
+import unittest
+from benchmark import benchmark_scale, compare
+
+class TestBenchmark(unittest.TestCase):
+    def test_report_and_regression_check(self):
+        """Test if a tiny benchmark reports every operation and compare flags slowdowns"""
+        params = {'n_teachers': 4, 'n_rooms': 2, 'n_courses': 5, 'n_subjects': 2}
+        result = benchmark_scale(params, population_size=4, generations=2, min_time=0.001)
+        self.assertEqual(set(result['results']), {'create_chromosome', 'fitness', 'calculate_fitness',
+                                                  'crossover', 'mutate', 'evolve'})
+        self.assertGreater(result['results']['fitness']['ops_per_sec'], 0)
+        self.assertGreater(result['results']['evolve']['peak_bytes'], 0)
+
+        report = {'scales': {'tiny': result}}
+        faster = {'scales': {'tiny': {'results': {'fitness': {'ops_per_sec': 1e12}}}}}
+        self.assertEqual(compare(report, report, 0.2), [])
+        self.assertEqual([r['operation'] for r in compare(report, faster, 0.2)], ['fitness'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,46 @@
+# testing/tests/test_data_generator.py
+
+import tempfile
+import unittest
+from algorithms.agadr import AGADRScheduler
+from utils.data_generator import generate_instance, write_instance
+
+class TestGenerateInstance(unittest.TestCase):
+    def test_sizes_and_reproducibility(self):
+        """Test if the instance has the requested sizes and a seed reproduces it"""
+        instance = generate_instance(n_teachers=12, n_rooms=5, n_courses=30, seed=3)
+        self.assertEqual([len(instance[k]) for k in ('teachers', 'classrooms', 'courses')], [12, 5, 30])
+        self.assertEqual(instance, generate_instance(n_teachers=12, n_rooms=5, n_courses=30, seed=3))
+        self.assertNotEqual(instance, generate_instance(n_teachers=12, n_rooms=5, n_courses=30, seed=4))
+
+    def test_every_course_has_candidates(self):
+        """Test if every course has a qualified teacher and a large-enough room"""
+        instance = generate_instance(n_teachers=10, n_rooms=4, n_courses=40, n_subjects=10, seed=1)
+        taught = {s for teacher in instance['teachers'] for s in teacher['subjects']}
+        largest = max(room['capacity'] for room in instance['classrooms'])
+        for course in instance['courses']:
+            self.assertIn(course['subject'], taught)
+            self.assertLessEqual(course['students'], largest)
+
+    def test_few_teachers_cover_every_subject(self):
+        """Test if subjects are shared out when there are fewer teachers than subjects"""
+        instance = generate_instance(n_teachers=3, n_subjects=10, subjects_per_teacher=(1, 1), seed=1)
+        taught = {s for teacher in instance['teachers'] for s in teacher['subjects']}
+        self.assertEqual(taught, {f"Subject {i}" for i in range(10)})
+
+    def test_availability_sparsity(self):
+        """Test if the share of free periods follows the availability parameter"""
+        instance = generate_instance(n_teachers=50, availability=0.3, seed=2)
+        periods = [free for t in instance['teachers'] for day in t['availability'].values() for free in day]
+        self.assertAlmostEqual(sum(periods) / len(periods), 0.3, delta=0.05)
+
+    def test_written_instance_loads(self):
+        """Test if a written instance loads through the scheduler's data directory path"""
+        instance = generate_instance(n_courses=8, seed=5)
+        with tempfile.TemporaryDirectory() as data_dir:
+            write_instance(instance, data_dir)
+            problem = AGADRScheduler(population_size=2).load_data(data_dir)
+        self.assertEqual(len(problem.courses), 8)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# testing/tests/test_decomposition.py
+
+import time
+import random
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.decomposition import DecomposedSolver, course_components
+from algorithms.problem import CompiledProblem
+from utils.data_generator import generate_instance
+
+def departments(k, **params):
+    """k generated instances side by side, sharing no subjects, teachers or rooms"""
+    teachers, classrooms, courses = [], [], []
+    for d in range(k):
+        instance = generate_instance(seed=d, **params)
+        teachers += [dict(t, id=f"{d}-{t['id']}", subjects=[f"{d}:{s}" for s in t['subjects']])
+                     for t in instance['teachers']]
+        classrooms += [dict(r, id=f"{d}-{r['id']}") for r in instance['classrooms']]
+        courses += [dict(c, id=f"{d}-{c['id']}", subject=f"{d}:{c['subject']}")
+                    for c in instance['courses']]
+    return CompiledProblem(teachers, classrooms, courses)
+
+class TestDecomposition(unittest.TestCase):
+    def setUp(self):
+        random.seed(6)
+        self.problem = departments(3, n_teachers=6, n_rooms=4, n_courses=10, n_subjects=3)
+        self.scheduler = AGADRScheduler(problem=self.problem, encoding='array', population_size=10,
+                                        generations=5, target_fitness=2)
+
+    def test_components_follow_departments(self):
+        """Test if courses split along the teacher-sharing graph"""
+        groups = course_components(self.problem)
+        self.assertEqual(sorted(len(g) for g in groups), [10, 10, 10])
+        for group in groups:
+            self.assertEqual(len({self.problem.courses[c]['id'].split('-')[0] for c in group}), 1)
+
+    def test_parts_get_disjoint_rooms(self):
+        """Test if allotted rooms don't overlap and fit each part's largest class"""
+        parts = DecomposedSolver(self.scheduler, max_workers=0).split()
+        rooms = [r for part in parts for r in part['rooms']]
+        self.assertEqual(len(rooms), len(set(rooms)))
+        for part in parts:
+            largest = max(self.problem.courses[c]['students'] for c in part['courses'])
+            self.assertTrue(any(self.problem.classrooms[r]['capacity'] >= largest for r in part['rooms']))
+
+    def test_merged_solution_covers_every_session(self):
+        """Test if the merged timetable has every session, in gene order, and repair never adds conflicts"""
+        solver = DecomposedSolver(self.scheduler, max_workers=2, seed=1)
+        outcome = solver.solve()
+        expected = sum(c.get('sessions_per_week', 1) for c in self.problem.courses
+                       if self.scheduler.index.open_slots_for(self.problem.courses.index(c)))
+        self.assertEqual(len(solver.best), expected)
+        order = list(zip(solver.best.course.tolist(), solver.best.session.tolist()))
+        self.assertEqual(order, sorted(order))
+        self.assertEqual(len(outcome['parts']), 3)
+        self.assertLessEqual(outcome['conflicts_after_repair'], outcome['conflicts_before_repair'])
+        self.assertAlmostEqual(outcome['best_fitness'], self.scheduler.fitness(solver.best))
+
+    def test_seeded_runs_repeat(self):
+        """Test if a seeded decomposition gives the same timetable in or out of process"""
+        first = DecomposedSolver(self.scheduler, max_workers=0, seed=3).solve()
+        second = DecomposedSolver(self.scheduler, max_workers=2, seed=3).solve()
+        self.assertEqual(first['timetable'], second['timetable'])
+
+    def test_callback_sees_every_part(self):
+        """Test if part progress reaches the callback, in or out of process, with per-part reports"""
+        scheduler = AGADRScheduler(problem=self.problem, encoding='array', population_size=10,
+                                   generations=5, target_fitness=2, profile_every=1)
+        for max_workers in (0, 2):
+            seen = []
+            outcome = DecomposedSolver(scheduler, max_workers=max_workers, seed=2).solve(
+                lambda stats: seen.append((stats['part'], stats['generation'])))
+            self.assertEqual(sorted(seen), [(p, g) for p in range(3) for g in range(5)])
+            self.assertEqual([part['report']['generations'] for part in outcome['parts']], [5, 5, 5])
+            self.assertEqual(outcome['stop_reason'], 'decomposed')
+
+    def test_callback_stops_all_parts(self):
+        """Test if a callback returning False cancels the decomposed solve"""
+        seen = []
+
+        def cancel(stats):
+            seen.append(stats['part'])
+            return False
+
+        outcome = DecomposedSolver(self.scheduler, max_workers=0, seed=2).solve(cancel)
+        self.assertEqual(outcome['stop_reason'], 'callback')
+        self.assertEqual(seen, [0])
+        self.assertEqual([part['generations'] for part in outcome['parts']], [1, 0, 0])
+
+        # Worker processes stop at the first generation boundary after the flag is raised
+        scheduler = AGADRScheduler(problem=self.problem, encoding='array', population_size=10,
+                                   generations=100000, target_fitness=2)
+        outcome = DecomposedSolver(scheduler, max_workers=2, seed=2).solve(lambda stats: False)
+        self.assertEqual(outcome['stop_reason'], 'callback')
+        self.assertTrue(all(part['generations'] < 100000 for part in outcome['parts']))
+
+    def test_time_budget_covers_all_parts(self):
+        """Test if parts solved one after another share one time budget"""
+        scheduler = AGADRScheduler(problem=self.problem, encoding='array', population_size=10,
+                                   generations=100000, target_fitness=2, time_budget=0.3)
+        started = time.perf_counter()
+        outcome = DecomposedSolver(scheduler, max_workers=0, seed=2).solve()
+        self.assertLess(time.perf_counter() - started, 0.6)
+        self.assertEqual([part['stop_reason'] for part in outcome['parts']], ['time_budget'] * 3)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+# testing/tests/test_diversity.py
+
+import random
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.diversity import DiversityTracker
+
+class TestAdaptiveRates(unittest.TestCase):
+    def setUp(self):
+        random.seed(8)
+        self.scheduler = AGADRScheduler(population_size=10, generations=4, adaptive_rates=True,
+                                        target_fitness=2, profile_every=1)
+
+    def test_distinct_ratio_counts_clones(self):
+        """Test if repeated and structurally equal chromosomes count once"""
+        tracker = DiversityTracker()
+        a = self.scheduler.create_chromosome()
+        b = self.scheduler.create_chromosome()
+        self.assertEqual(tracker.distinct_ratio([a, a, list(a), b]), 0.5)
+        self.assertEqual(tracker.distinct_ratio([a, b]), 1.0)
+
+    def test_rates_follow_diversity(self):
+        """Test if collapsing diversity raises mutation and lowers crossover within bounds"""
+        self.scheduler.adapt_rates(1.0)
+        self.assertAlmostEqual(self.scheduler.mutation_rate, AGADRScheduler.MUTATION_RANGE[0])
+        self.assertAlmostEqual(self.scheduler.crossover_rate, AGADRScheduler.CROSSOVER_RANGE[1])
+        self.scheduler.adapt_rates(0.0)
+        self.assertAlmostEqual(self.scheduler.mutation_rate, AGADRScheduler.MUTATION_RANGE[1])
+        self.assertAlmostEqual(self.scheduler.crossover_rate, AGADRScheduler.CROSSOVER_RANGE[0])
+
+    def test_restart_keeps_elite(self):
+        """Test if a restart replaces restart_fraction of the population past the elite"""
+        population = self.scheduler.initialize_population()
+        restarted = self.scheduler.restart(population)
+        self.assertEqual(len(restarted), len(population))
+        self.assertTrue(all(a is b for a, b in zip(restarted[:5], population[:5])))
+        self.assertFalse(any(a is b for a, b in zip(restarted[5:], population[5:])))
+
+    def test_trajectory_in_run_report(self):
+        """Test if every generation's rates and restarts reach stats and the run report"""
+        self.scheduler.restart_threshold = 1.1  # Restart every generation
+        stats = [s for s, _ in self.scheduler.evolution()]
+        self.assertTrue(all(s['restarted'] for s in stats))
+        rates = self.scheduler.run_report()['rates']
+        self.assertEqual([r['generation'] for r in rates], [0, 1, 2, 3])
+        self.assertEqual(rates[-1]['mutation_rate'], stats[-1]['mutation_rate'])
+
+class TestCloneElimination(unittest.TestCase):
+    def setUp(self):
+        random.seed(9)
+        self.scheduler = AGADRScheduler(population_size=12, generations=5, eliminate_clones=True,
+                                        target_fitness=2)
+
+    def test_replace_clones(self):
+        """Test if every repeat is replaced by a distinct chromosome and first copies are kept"""
+        a = self.scheduler.create_chromosome()
+        b = self.scheduler.create_chromosome()
+        population = [a, a, b, list(a), b]
+        keys = DiversityTracker().keys(population)
+        unique, replaced = self.scheduler.replace_clones(population, keys)
+        self.assertEqual(replaced, 3)
+        self.assertIs(unique[0], a)
+        self.assertIs(unique[2], b)
+        self.assertEqual(DiversityTracker().distinct_ratio(unique), 1.0)
+
+    def test_run_counts_clones(self):
+        """Test if each generation reports its replaced clones and breeds from distinct chromosomes"""
+        tracker = DiversityTracker()
+        self.scheduler.crossover_rate = 0.0  # Children are mostly copies of their parents
+        ratios = []
+        original = self.scheduler.evaluate_population
+
+        def evaluate(population):
+            ratios.append(tracker.distinct_ratio(population))
+            return original(population)
+
+        self.scheduler.evaluate_population = evaluate
+        stats = [s for s, _ in self.scheduler.evolution()]
+        self.assertTrue(all(ratio == 1.0 for ratio in ratios))
+        self.assertGreater(sum(s['clones_eliminated'] for s in stats), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+# testing/tests/test_encoding.py
+
+import unittest
+import numpy as np
+from algorithms.agadr import AGADRScheduler
+from algorithms.encoding import EncodedChromosome, Gene
+
+class TestChromosomeEncoding(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AGADRScheduler(encoding='array')
+        self.encoder = self.scheduler.encoder
+
+    def test_create_encoded_chromosome(self):
+        """Test if array encoding produces integer columns of equal length"""
+        chromosome = self.scheduler.create_chromosome()
+        self.assertIsInstance(chromosome, EncodedChromosome)
+        for column in chromosome.columns():
+            self.assertEqual(len(column), len(chromosome))
+            self.assertTrue(np.issubdtype(column.dtype, np.integer))
+
+    def test_round_trip(self):
+        """Test if decoding and re-encoding gives the same columns"""
+        chromosome = self.scheduler.create_chromosome()
+        decoded = self.encoder.decode(chromosome)
+        self.assertIsInstance(decoded[0], dict)
+        self.assertIn('classroom', decoded[0])
+        reencoded = self.encoder.encode(decoded)
+        for a, b in zip(chromosome.columns(), reencoded.columns()):
+            np.testing.assert_array_equal(a, b)
+
+    def test_fitness_matches_dict_path(self):
+        """Test if encoded fitness equals fitness of the decoded chromosome"""
+        chromosome = self.scheduler.create_chromosome()
+        # Force collisions so the comparison is not trivially 1.0
+        chromosome.day[:] = 0
+        chromosome.slot[:] = np.arange(len(chromosome)) % 2
+        decoded = self.encoder.decode(chromosome)
+        self.assertAlmostEqual(self.scheduler.fitness(chromosome),
+                               self.scheduler.fitness(decoded))
+
+    def test_operators_keep_encoding(self):
+        """Test if crossover and mutation return encoded chromosomes"""
+        self.scheduler.crossover_rate = 1.0
+        self.scheduler.mutation_rate = 1.0
+        parent1 = self.scheduler.create_chromosome()
+        parent2 = self.scheduler.create_chromosome()
+        child1, child2 = self.scheduler.crossover(parent1, parent2)
+        self.assertIsInstance(child1, EncodedChromosome)
+        self.assertEqual(len(child2), len(parent2))
+        mutated = self.scheduler.mutate(child1)
+        self.assertIsInstance(mutated, EncodedChromosome)
+
+    def test_timetable_generation(self):
+        """Test if array-encoded runs still produce the timetable format"""
+        timetable = self.scheduler.generate_timetable()
+        self.assertIsInstance(timetable, dict)
+        self.assertIn(0, timetable)
+
+class TestCompactGenes(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AGADRScheduler(encoding='compact')
+        self.scheduler.crossover_rate = 1.0
+        self.scheduler.mutation_rate = 1.0
+
+    def test_fitness_matches_dict_path(self):
+        """Test if compact chromosomes score the same as their dict decoding"""
+        chromosome = [gene._replace(day=0, slot=i % 2)
+                      for i, gene in enumerate(self.scheduler.create_chromosome())]
+        self.assertIsInstance(chromosome[0], Gene)
+        self.assertAlmostEqual(self.scheduler.fitness(chromosome),
+                               self.scheduler.fitness(self.scheduler.decode(chromosome)))
+        encoded = self.scheduler.encoder.encode(chromosome)
+        self.assertEqual(self.scheduler.encoder.compact(encoded), chromosome)
+
+    def test_children_share_unchanged_genes(self):
+        """Test if crossover reuses parent genes and mutation replaces exactly one"""
+        self.scheduler.crossover_method = 'uniform'
+        parent1 = self.scheduler.create_chromosome()
+        parent2 = self.scheduler.create_chromosome()
+        child1, _ = self.scheduler.crossover(parent1, parent2)
+        self.assertTrue(all(g is a or g is b for g, a, b in zip(child1, parent1, parent2)))
+
+        snapshot = list(parent1)
+        mutated = self.scheduler.mutate(parent1)
+        self.assertEqual(parent1, snapshot)
+        self.assertLessEqual(sum(a is not b for a, b in zip(mutated, parent1)), 1)
+
+    def test_timetable_generation(self):
+        """Test if compact runs still produce the timetable format"""
+        timetable = self.scheduler.generate_timetable()
+        self.assertIsInstance(timetable, dict)
+        self.assertIn(0, timetable)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -95,6 +95,38 @@ class TestFitnessCalculator(unittest.TestCase):
         penalties = self.calculator.check_consecutive_classes(consecutive_chromosome)
         self.assertGreater(penalties, 0)
 
+    def test_conflicts_count_pairs(self):
+        """Test that three classes sharing a teacher and slot count as three pairs"""
+        teacher = {'id': 1, 'name': 'Test Teacher'}
+        chromosome = [
+            {
+                'day': 2,
+                'time_slot': 4,
+                'teacher': teacher,
+                'course': {'name': f'Course{i}', 'students': 20},
+                'classroom': {'id': 1, 'capacity': 30}
+            }
+            for i in range(3)
+        ]
+
+        self.assertEqual(self.calculator.check_teacher_conflicts(chromosome), 3)
+        self.assertEqual(self.calculator.check_room_conflicts(chromosome), 3)
+
+    def test_consecutive_run_length(self):
+        """Test that each class beyond the third in a run adds one penalty"""
+        chromosome = [
+            {
+                'day': 1,
+                'time_slot': slot,
+                'teacher': {'id': 1, 'name': 'Test Teacher'},
+                'course': {'name': f'Course{slot}', 'students': 20},
+                'classroom': {'id': slot, 'capacity': 30}
+            }
+            for slot in [0, 1, 2, 3, 4, 6]
+        ]
+
+        self.assertEqual(self.calculator.check_consecutive_classes(chromosome), 2)
+
     def test_teacher_preferences(self):
         """Test detection of teacher preference violations"""
         # Create a violation by scheduling when teacher is unavailable
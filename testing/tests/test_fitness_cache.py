@@ -0,0 +1,70 @@
+# testing/tests/test_fitness_cache.py
+
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.fitness_cache import FitnessCache, chromosome_key
+
+class TestFitnessCache(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AGADRScheduler(fitness_cache_size=4)
+
+    def test_lru_eviction(self):
+        """Test if the least recently used score is evicted first"""
+        cache = FitnessCache(maxsize=2)
+        cache.put(1, 0.1)
+        cache.put(2, 0.2)
+        cache.get(1)
+        cache.put(3, 0.3)
+        self.assertIsNone(cache.get(2))
+        self.assertEqual(cache.get(1), 0.1)
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']), (2, 1, 1))
+
+    def test_repeat_is_a_hit(self):
+        """Test if scoring an unchanged chromosome again hits the cache"""
+        chromosome = self.scheduler.create_chromosome()
+        first = self.scheduler.fitness(chromosome)
+        self.assertEqual(self.scheduler.fitness(list(chromosome)), first)
+        self.assertEqual(self.scheduler.fitness_cache.hits, 1)
+
+    def test_in_place_edit_is_not_stale(self):
+        """Test if editing a shared gene in place changes the key and the score"""
+        chromosome = self.scheduler.create_chromosome()
+        for gene in chromosome:
+            gene['day'], gene['time_slot'] = 0, 0
+        before = self.scheduler.fitness(chromosome)
+        key = chromosome_key(chromosome)
+        chromosome[0]['time_slot'] = 7
+        self.assertNotEqual(chromosome_key(chromosome), key)
+        uncached = AGADRScheduler(fitness_cache_size=0).fitness(chromosome)
+        self.assertEqual(self.scheduler.fitness(chromosome), uncached)
+        self.assertNotEqual(uncached, before)
+
+    def test_batch_engine_scores_only_misses(self):
+        """Test if batch evaluation reuses cached scores"""
+        scheduler = AGADRScheduler(encoding='array', fitness_engine='batch')
+        population = scheduler.initialize_population()[:5]
+        first = scheduler.evaluate_population(population)
+        again = scheduler.evaluate_population(population)
+        self.assertEqual(first, again)
+        self.assertEqual(scheduler.fitness_cache.hits, 5)
+
+    def test_default_caches_array_encoding_only(self):
+        """Test if the cache is on by default only where its key is cheap"""
+        self.assertIsNone(AGADRScheduler().fitness_cache)
+        self.assertIsNone(AGADRScheduler(encoding='compact').fitness_cache)
+        self.assertIsNotNone(AGADRScheduler(encoding='array').fitness_cache)
+
+    def test_key_is_a_digest_of_the_assignments(self):
+        """Test if keys are fixed-size digests of the assignments"""
+        scheduler = AGADRScheduler(encoding='array')
+        chromosome = scheduler.create_chromosome()
+        key = chromosome_key(chromosome)
+        self.assertEqual(len(key), 16)
+        self.assertEqual(chromosome_key(chromosome.copy()), key)
+        moved = chromosome.copy()
+        moved.slot[0] = (moved.slot[0] + 1) % len(scheduler.time_slots)
+        self.assertNotEqual(chromosome_key(moved), key)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+# testing/tests/test_incremental.py
+
+import random
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.incremental import OccupancyState
+
+class TestIncrementalFitness(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.scheduler = AGADRScheduler(encoding='array', incremental=True)
+        self.scheduler.mutation_rate = 1.0
+
+    def full_fitness(self, chromosome):
+        return self.scheduler.fitness(self.scheduler.decode(chromosome))
+
+    def test_state_matches_full_recompute(self):
+        """Test if fitness from occupancy counters equals a full recompute"""
+        chromosome = self.scheduler.create_chromosome()
+        chromosome.day[:] = 0
+        self.assertIsNone(chromosome.state)
+        self.assertAlmostEqual(self.scheduler.fitness(chromosome), self.full_fitness(chromosome))
+        self.assertIsInstance(chromosome.state, OccupancyState)
+
+    def test_mutation_updates_by_delta(self):
+        """Test if repeated mutations keep the carried fitness exact"""
+        chromosome = self.scheduler.create_chromosome()
+        self.scheduler.fitness(chromosome)
+        for _ in range(200):
+            mutated = self.scheduler.mutate(chromosome)
+            self.assertIsNotNone(mutated.state)
+            self.assertAlmostEqual(self.scheduler.fitness(mutated), self.full_fitness(mutated))
+            # The parent keeps its own counters
+            self.assertAlmostEqual(self.scheduler.fitness(chromosome), self.full_fitness(chromosome))
+            chromosome = mutated
+
+    def test_crossover_children_recompute(self):
+        """Test if crossover children start without counters and score correctly"""
+        self.scheduler.crossover_rate = 1.0
+        parent1 = self.scheduler.create_chromosome()
+        parent2 = self.scheduler.create_chromosome()
+        self.scheduler.fitness(parent1)
+        self.scheduler.fitness(parent2)
+        child1, child2 = self.scheduler.crossover(parent1, parent2)
+        self.assertIsNone(child1.state)
+        self.assertAlmostEqual(self.scheduler.fitness(child1), self.full_fitness(child1))
+
+    def test_requires_array_encoding(self):
+        """Test if incremental fitness is rejected for dict chromosomes"""
+        with self.assertRaises(ValueError):
+            AGADRScheduler(incremental=True)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+# testing/tests/test_islands.py
+
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.islands import IslandModel
+
+class TestIslandModel(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AGADRScheduler(population_size=10, generations=6, encoding='array')
+
+    def run_islands(self, **kwargs):
+        model = IslandModel(self.scheduler, n_islands=3, migration_interval=2,
+                            migration_size=1, seed=42, **kwargs)
+        best = model.evolve()
+        return model, best
+
+    def test_returns_global_best(self):
+        """Test if the island model returns the best chromosome of all islands"""
+        model, best = self.run_islands(max_workers=0)
+        self.assertEqual(len(best), len(self.scheduler.create_chromosome()))
+        self.assertAlmostEqual(self.scheduler.fitness(best), model.best_fitness)
+        self.assertEqual(len(model.history[0]['island_best']), 3)
+
+    def test_seeded_runs_are_reproducible(self):
+        """Test if seeded runs agree across repeats and across pool and serial modes"""
+        _, serial = self.run_islands(max_workers=0)
+        _, again = self.run_islands(max_workers=0)
+        _, pooled = self.run_islands(max_workers=2)
+        for a, b, c in zip(serial.columns(), again.columns(), pooled.columns()):
+            self.assertEqual(a.tolist(), b.tolist())
+            self.assertEqual(a.tolist(), c.tolist())
+
+    def test_stop_reasons(self):
+        """Test if the scheduler's stopping rules end island runs between epochs"""
+        def run(time_budget=None, **kwargs):
+            scheduler = AGADRScheduler(population_size=10, encoding='array', **kwargs)
+            model = IslandModel(scheduler, n_islands=2, migration_interval=2, seed=1, max_workers=0)
+            model.evolve(time_budget)
+            return model
+
+        self.assertEqual(run(generations=4, target_fitness=2.0).stop_reason, 'generations')
+        model = run(generations=40, target_fitness=0.0)
+        self.assertEqual((model.stop_reason, len(model.history)), ('target_reached', 1))
+        model = run(generations=200, target_fitness=2.0, stagnation_limit=4, stagnation_epsilon=1.0)
+        self.assertEqual((model.stop_reason, len(model.history)), ('stagnation', 3))
+        model = run(time_budget=0.01, generations=10000, target_fitness=2.0)
+        self.assertEqual(model.stop_reason, 'time_budget')
+        self.assertLess(model.history[-1]['generation'], 10000)
+
+    def test_islands_apply_generation_options(self):
+        """Test if adaptive_rates and eliminate_clones act on every island, in pool and serial modes"""
+        def run(max_workers, calls=None):
+            scheduler = AGADRScheduler(population_size=10, generations=4, encoding='array',
+                                       target_fitness=2.0, adaptive_rates=True, eliminate_clones=True)
+            if calls is not None:
+                replace_clones = scheduler.replace_clones
+                scheduler.replace_clones = lambda *args: calls.append(1) or replace_clones(*args)
+            model = IslandModel(scheduler, n_islands=2, migration_interval=2, seed=3,
+                                max_workers=max_workers)
+            return scheduler, model.evolve()
+
+        calls = []
+        scheduler, serial = run(0, calls)
+        self.assertEqual(len(calls), 2 * 4)
+        self.assertNotEqual(scheduler.mutation_rate, AGADRScheduler().mutation_rate)
+        _, pooled = run(2)
+        for a, b in zip(serial.columns(), pooled.columns()):
+            self.assertEqual(a.tolist(), b.tolist())
+
+    def test_ring_migration(self):
+        """Test if ring migration replaces each island's worst with its neighbour's best"""
+        model = IslandModel(self.scheduler, n_islands=3, migration_size=1, max_workers=0)
+        islands = [[f'{i}-best', f'{i}-mid', f'{i}-worst'] for i in range(3)]
+        model._clone = lambda chrom: chrom
+        model.migrate(islands, rng=None)
+        self.assertEqual([island[-1] for island in islands], ['2-best', '0-best', '1-best'])
+
+if __name__ == '__main__':
+    unittest.main()
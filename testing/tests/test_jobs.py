@@ -0,0 +1,91 @@
+# testing/tests/test_jobs.py
+
+import threading
+import time
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.jobs import JobManager, QueueFullError
+
+def solve_in_steps(payload, callback):
+    """Fake solve: one 'generation' per step, each waiting on the test's gate"""
+    for generation in range(payload['steps']):
+        payload['gate'].wait(timeout=5)
+        if callback({'generation': generation}) is False:
+            break
+    return {'steps': payload['steps']}
+
+class TestJobManager(unittest.TestCase):
+    def setUp(self):
+        self.jobs = JobManager(solve_in_steps, max_workers=1, max_queue=1, use_processes=False)
+        self.gate = threading.Event()
+
+    def tearDown(self):
+        self.gate.set()
+        self.jobs.shutdown()
+
+    def wait(self, job_id):
+        while self.jobs.status(job_id)['finished_at'] is None:
+            time.sleep(0.01)
+
+    def test_job_runs_to_result(self):
+        """Test if a submitted job finishes with its result and last progress"""
+        self.gate.set()
+        job_id = self.jobs.submit({'steps': 3, 'gate': self.gate})
+        self.wait(job_id)
+        status = self.jobs.status(job_id)
+        self.assertEqual(status['status'], 'succeeded')
+        self.assertEqual(status['progress'], {'generation': 2})
+        self.assertEqual(self.jobs.result(job_id), {'steps': 3})
+
+    def test_queue_depth_limit(self):
+        """Test if submissions beyond the running and queued limit are refused"""
+        running = self.jobs.submit({'steps': 1, 'gate': self.gate})
+        queued = self.jobs.submit({'steps': 1, 'gate': self.gate})
+        with self.assertRaises(QueueFullError) as raised:
+            self.jobs.submit({'steps': 1, 'gate': self.gate})
+        self.assertGreaterEqual(raised.exception.retry_after, 1)
+        self.assertEqual(self.jobs.status(queued)['status'], 'queued')
+        self.gate.set()
+        self.wait(running)
+        self.wait(queued)
+
+    def test_cancel_queued_and_running(self):
+        """Test if cancel drops a queued job and stops a running one early"""
+        running = self.jobs.submit({'steps': 100, 'gate': self.gate})
+        queued = self.jobs.submit({'steps': 1, 'gate': self.gate})
+        self.assertTrue(self.jobs.cancel(queued))
+        self.assertTrue(self.jobs.cancel(running))
+        self.gate.set()
+        self.wait(running)
+        self.assertEqual(self.jobs.status(queued)['status'], 'cancelled')
+        self.assertEqual(self.jobs.status(running)['status'], 'cancelled')
+        self.assertLess(self.jobs.status(running)['progress']['generation'], 99)
+        self.assertIsNone(self.jobs.result(running))
+        self.assertFalse(self.jobs.cancel('no-such-job'))
+
+    def test_watch_streams_until_finished(self):
+        """Test if watch yields progress changes and ends with the final status"""
+        self.gate.set()
+        job_id = self.jobs.submit({'steps': 3, 'gate': self.gate})
+        statuses = list(self.jobs.watch(job_id, interval=0.01))
+        self.assertEqual(statuses[-1]['status'], 'succeeded')
+        self.assertEqual(statuses[-1]['progress'], {'generation': 2})
+        self.assertEqual(list(self.jobs.watch('no-such-job')), [])
+
+class TestEvolveCallback(unittest.TestCase):
+    def test_callback_stops_evolution(self):
+        """Test if evolve reports each generation and stops when the callback returns False"""
+        # More sessions than periods for a single teacher, so the run cannot converge
+        week = {str(day): [True] * 8 for day in range(5)}
+        teachers = [{'id': 1, 'name': 'T', 'subjects': ['Maths'], 'availability': week}]
+        classrooms = [{'id': 1, 'room_number': '101', 'capacity': 40, 'availability': week}]
+        courses = [{'id': i, 'name': f'C{i}', 'subject': 'Maths', 'students': 30,
+                    'sessions_per_week': 3} for i in range(20)]
+        scheduler = AGADRScheduler(population_size=6, generations=20, teachers=teachers,
+                                   classrooms=classrooms, courses=courses)
+        seen = []
+        scheduler.evolve(callback=lambda stats: seen.append(stats['generation']) or len(seen) < 3)
+        self.assertEqual(seen, [0, 1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,55 @@
+# testing/tests/test_local_search.py
+
+import random
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.incremental import OccupancyState
+from algorithms.problem import CompiledProblem
+from utils.data_generator import generate_instance
+
+class TestTabuSearch(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        instance = generate_instance(n_teachers=10, n_rooms=6, n_courses=30, seed=5)
+        self.problem = CompiledProblem(instance['teachers'], instance['classrooms'], instance['courses'])
+
+    def test_improve_keeps_counters_exact(self):
+        """Test if searching lowers conflicts and leaves counters matching a full rebuild"""
+        scheduler = AGADRScheduler(problem=self.problem, encoding='array', incremental=True)
+        chromosome = scheduler.create_chromosome()
+        before = scheduler.occupancy(chromosome).conflicts
+        improved = scheduler.improve(chromosome, 300)
+        self.assertIsNot(improved, chromosome)
+        self.assertEqual(scheduler.occupancy(chromosome).conflicts, before)
+
+        rebuilt = OccupancyState.build(improved, len(scheduler.teachers), len(scheduler.classrooms),
+                                       len(scheduler.days), len(scheduler.time_slots))
+        self.assertEqual(improved.state.conflicts, rebuilt.conflicts)
+        self.assertLess(rebuilt.conflicts, before)
+        self.assertTrue(all(scheduler._placement_allowed(improved, i) for i in range(len(improved))))
+
+    def test_dict_chromosomes_keep_their_encoding(self):
+        """Test if improving a dict chromosome returns a fitter dict chromosome"""
+        scheduler = AGADRScheduler(problem=self.problem)
+        chromosome = scheduler.create_chromosome()
+        improved = scheduler.improve(chromosome, 300)
+        self.assertIsInstance(improved[0], dict)
+        self.assertGreater(scheduler.fitness(improved), scheduler.fitness(chromosome))
+        self.assertEqual(scheduler.local_search_stats['improved'], 1)
+        self.assertLessEqual(scheduler.local_search_stats['evaluations'], 300)
+
+    def test_run_reports_local_search_gain(self):
+        """Test if a run with a budget reports per-generation and total local search stats"""
+        scheduler = AGADRScheduler(problem=self.problem, encoding='array', population_size=10,
+                                   generations=3, local_search_budget=100, target_fitness=2)
+        gains = [stats['local_search_gain'] for stats, _ in scheduler.evolution()]
+        self.assertEqual(len(gains), 3)
+        self.assertAlmostEqual(sum(gains), scheduler.local_search_stats['fitness_gain'])
+        self.assertEqual(scheduler.local_search_stats['calls'], 3 * scheduler.elite_size)
+
+    def test_negative_budget_rejected(self):
+        with self.assertRaises(ValueError):
+            AGADRScheduler(problem=self.problem, local_search_budget=-1)
+
+if __name__ == '__main__':
+    unittest.main()
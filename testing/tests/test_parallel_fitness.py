@@ -0,0 +1,81 @@
+# testing/tests/test_parallel_fitness.py
+
+import pickle
+import random
+import unittest
+import numpy as np
+from algorithms.agadr import AGADRScheduler
+from algorithms.batch_fitness import stack_population
+from algorithms.parallel_fitness import ParallelFitnessEvaluator, shared_evaluator, close_shared_evaluators
+from algorithms.problem import CompiledProblem
+
+class TestParallelFitness(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.scheduler = AGADRScheduler(encoding='array', fitness_cache_size=0, fitness_workers=2)
+
+    def tearDown(self):
+        self.scheduler.close()
+
+    def test_scores_match_serial(self):
+        """Test if worker scores equal the batch evaluator's, across growing populations"""
+        evaluator = ParallelFitnessEvaluator(self.scheduler.batch_evaluator, max_workers=2)
+        try:
+            for size in (3, 8, 20):
+                stacked = stack_population([self.scheduler.create_chromosome() for _ in range(size)])
+                np.testing.assert_allclose(evaluator.fitness(stacked),
+                                           self.scheduler.batch_evaluator.fitness(stacked))
+        finally:
+            evaluator.close()
+
+    def test_selected_by_population_size(self):
+        """Test if only populations of at least parallel_min_genes genes go to the workers"""
+        population = [self.scheduler.create_chromosome() for _ in range(6)]
+        genes = sum(len(chrom) for chrom in population)
+        self.assertIsNone(self.scheduler.parallel_evaluator(population))
+
+        self.scheduler.parallel_min_genes = genes
+        self.assertIsNotNone(self.scheduler.parallel_evaluator(population))
+        serial = [self.scheduler._score(chrom) for chrom in population]
+        self.assertEqual(self.scheduler.evaluate_population(population), serial)
+
+        self.scheduler.fitness_workers = 1
+        self.scheduler.close()
+        self.assertIsNone(self.scheduler.parallel_evaluator(population))
+
+    def test_scheduler_pickles_without_pool(self):
+        """Test if a scheduler with running workers can still be sent to another process"""
+        self.scheduler.parallel_min_genes = 0
+        self.scheduler.evaluate_population([self.scheduler.create_chromosome()])
+        copy = pickle.loads(pickle.dumps(self.scheduler))
+        self.assertEqual(copy.problem.version, self.scheduler.problem.version)
+
+    def test_pool_outlives_runs(self):
+        """Test if later runs and schedulers on other problems with the same grid reuse the workers"""
+        self.scheduler.parallel_min_genes = 0
+        self.scheduler.generations = 2
+        population = [self.scheduler.create_chromosome()]
+        self.scheduler.evolve()
+        executor = self.scheduler.parallel_evaluator(population)._executor
+        self.assertIsNotNone(executor)
+
+        problem = self.scheduler.problem
+        other_problem = CompiledProblem(problem.teachers, problem.classrooms, problem.courses[:-1])
+        other = AGADRScheduler(problem=other_problem, encoding='array', generations=2,
+                               fitness_workers=2)
+        other.parallel_min_genes = 0
+        other.evolve()
+        self.assertIs(other.parallel_evaluator(population)._executor, executor)
+
+        self.scheduler.close()
+        self.assertIsNone(other.parallel_evaluator(population)._executor)
+
+    def test_pool_per_grid_size(self):
+        """Test if a different grid size gets its own pool"""
+        evaluator = shared_evaluator(5, 8, 2)
+        self.assertIs(shared_evaluator(5, 8, 2), evaluator)
+        self.assertIsNot(shared_evaluator(4, 8, 2), evaluator)
+        close_shared_evaluators(4, 8)
+
+if __name__ == '__main__':
+    unittest.main()
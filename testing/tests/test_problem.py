@@ -0,0 +1,97 @@
+# testing/tests/test_problem.py
+
+import os
+import json
+import shutil
+import tempfile
+import threading
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.problem import CompiledProblem, ProblemPool
+
+class TestCompiledProblem(unittest.TestCase):
+    def setUp(self):
+        self.data_dir = tempfile.mkdtemp()
+        for name in ('teachers', 'classrooms', 'courses'):
+            shutil.copy(os.path.join('data', f'{name}.json'), self.data_dir)
+
+    def tearDown(self):
+        shutil.rmtree(self.data_dir)
+
+    def test_schedulers_share_a_pooled_problem(self):
+        """Test if schedulers built on a pooled problem reuse its compiled state"""
+        pool = ProblemPool()
+        problem = pool.from_directory(self.data_dir)
+        self.assertIs(pool.from_directory(self.data_dir), problem)
+        self.assertEqual(pool.builds, 1)
+
+        a = AGADRScheduler(problem=problem)
+        b = AGADRScheduler(problem=problem, encoding='array')
+        self.assertIs(a.index, b.index)
+        self.assertIs(a.teachers, problem.teachers)
+        self.assertIn('availability_mask', problem.teachers[0])
+        self.assertIsNotNone(b.fitness(b.create_chromosome()))
+
+    def test_changed_files_get_a_new_version(self):
+        """Test if editing a data file compiles a new problem on the next lookup"""
+        pool = ProblemPool()
+        before = pool.from_directory(self.data_dir)
+        path = os.path.join(self.data_dir, 'courses.json')
+        with open(path) as f:
+            courses = json.load(f)
+        courses['courses'].pop()
+        with open(path, 'w') as f:
+            json.dump(courses, f)
+
+        after = pool.from_directory(self.data_dir)
+        self.assertNotEqual(before.version, after.version)
+        self.assertEqual(len(after.courses), len(before.courses) - 1)
+
+    def test_with_changes_leaves_original_untouched(self):
+        """Test if applying changes builds a new problem and keeps the shared one as it was"""
+        problem = CompiledProblem.from_directory(self.data_dir)
+        course = problem.courses[0]
+        scheduler = AGADRScheduler(problem=problem)
+        scheduler.apply_changes({'courses': {course['id']: {'students': course['students'] + 5}}})
+        self.assertIsNot(scheduler.problem, problem)
+        self.assertEqual(scheduler.courses[0]['students'], course['students'] + 5)
+        self.assertEqual(problem.courses[0]['students'], course['students'])
+
+    def test_records_are_copied(self):
+        """Test if compiling records leaves the caller's dicts unchanged"""
+        teachers = [{'id': 1, 'name': 'T', 'subjects': [], 'availability': {}}]
+        pool = ProblemPool(maxsize=1)
+        problem = pool.from_records(teachers, [], [])
+        self.assertNotIn('availability_mask', teachers[0])
+        self.assertIs(pool.from_records(teachers, [], []), problem)
+        pool.from_records(teachers, [], [{'id': 1}])
+        self.assertEqual(len(pool), 1)
+
+    def test_build_does_not_block_the_pool(self):
+        """Test if pooled problems are served while another version compiles, and it compiles once"""
+        pool = ProblemPool()
+        ready = pool.get('ready', lambda: CompiledProblem([], [], []))
+        started, release = threading.Event(), threading.Event()
+        builds = []
+
+        def slow_build():
+            builds.append(1)
+            started.set()
+            release.wait(5)
+            return CompiledProblem([], [], [])
+
+        results = []
+        waiters = [threading.Thread(target=lambda: results.append(pool.get('slow', slow_build)))
+                   for _ in range(2)]
+        for thread in waiters:
+            thread.start()
+        started.wait(5)
+        self.assertIs(pool.get('ready', lambda: None), ready)
+        release.set()
+        for thread in waiters:
+            thread.join()
+        self.assertEqual(len(builds), 1)
+        self.assertIs(results[0], results[1])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+# testing/tests/test_problem_index.py
+
+import unittest
+from algorithms.agadr import AGADRScheduler
+
+class TestProblemIndex(unittest.TestCase):
+    def setUp(self):
+        self.scheduler = AGADRScheduler()
+        self.index = self.scheduler.index
+
+    def test_qualified_teachers(self):
+        """Test if every indexed teacher teaches the course's subject"""
+        for course_idx, course in enumerate(self.scheduler.courses):
+            expected = [i for i, t in enumerate(self.scheduler.teachers)
+                        if course['subject'] in t['subjects']]
+            self.assertEqual(self.index.teachers_for(course_idx), expected)
+
+    def test_rooms_by_capacity(self):
+        """Test if the capacity lookup returns exactly the large-enough rooms"""
+        for course_idx, course in enumerate(self.scheduler.courses):
+            expected = {i for i, c in enumerate(self.scheduler.classrooms)
+                        if c['capacity'] >= course['students']}
+            self.assertEqual(set(self.index.rooms_for(course_idx)), expected)
+
+    def test_free_resources_respect_availability(self):
+        """Test if per-slot lookups drop unavailable teachers and rooms"""
+        teacher = self.scheduler.teachers[0]
+        teacher['availability_mask'] &= ~self.scheduler.grid.bit(2, 3)
+        index = type(self.index)(self.scheduler.courses, self.scheduler.teachers,
+                                 self.scheduler.classrooms, self.scheduler.grid)
+        course_idx = next(i for i, c in enumerate(self.scheduler.courses)
+                          if c['subject'] in teacher['subjects'])
+        self.assertNotIn(0, index.free_teachers_for(course_idx, 2, 3))
+        self.assertIn(0, index.free_teachers_for(course_idx, 2, 4))
+
+    def test_chromosome_uses_eligible_resources(self):
+        """Test if seeded genes only use qualified teachers and large-enough rooms"""
+        for gene in self.scheduler.create_chromosome():
+            self.assertIn(gene['course']['subject'], gene['teacher']['subjects'])
+            self.assertGreaterEqual(gene['classroom']['capacity'], gene['course']['students'])
+            self.assertTrue(gene['teacher']['availability'][str(gene['day'])][gene['time_slot']])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+# testing/tests/test_profiling.py
+
+import random
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.profiling import RunProfiler, MetricsRegistry
+from utils.data_generator import generate_instance
+
+class TestRunProfiler(unittest.TestCase):
+    def run_profiled(self, profile_every):
+        random.seed(0)
+        # Too many sessions for three teachers, so all generations run
+        instance = generate_instance(n_teachers=3, n_rooms=2, n_courses=30, n_subjects=3, seed=0)
+        scheduler = AGADRScheduler(population_size=10, generations=4, profile_every=profile_every,
+                                   fitness_cache_size=2048, **instance)
+        scheduler.evolve()
+        return scheduler, scheduler.run_report()
+
+    def test_report_covers_phases_and_counters(self):
+        """Test if a profiled run reports every phase and its evaluation and operator counts"""
+        scheduler, report = self.run_profiled(1)
+        self.assertEqual(set(report['phase_seconds']), set(RunProfiler.PHASES))
+        self.assertGreater(report['phase_seconds']['initialization'], 0)
+        self.assertEqual(report['sampled_generations'], report['generations'])
+        self.assertEqual(report['counters']['evaluations'], 10 * report['generations'])
+        self.assertEqual(report['counters']['cache_hits'] + report['counters']['cache_misses'],
+                         report['counters']['evaluations'])
+        self.assertGreater(report['counters']['crossover'], 0)
+
+    def test_sampling_and_disabled(self):
+        """Test if sampling skips operator timing in most generations and 0 turns profiling off"""
+        _, report = self.run_profiled(3)
+        self.assertEqual(report['generations'], 4)
+        self.assertEqual(report['sampled_generations'], 2)
+        scheduler, report = self.run_profiled(0)
+        self.assertIsNone(report)
+        self.assertIsNone(scheduler.profiler)
+
+    def test_credit_improvements(self):
+        """Test if children that beat their best parent are credited to the operators applied"""
+        profiler = RunProfiler()
+        profiler.lineage = [None, (0.5, ('crossover', 'mutation')), (0.5, ('mutation',)), (0.9, ('crossover',))]
+        profiler.credit([1.0, 0.6, 0.4, 0.95])
+        self.assertEqual(profiler.counters['crossover_improvements'], 2)
+        self.assertEqual(profiler.counters['mutation_improvements'], 1)
+        self.assertIsNone(profiler.lineage)
+
+class TestMetricsRegistry(unittest.TestCase):
+    def test_render_totals(self):
+        """Test if recorded reports are summed into Prometheus exposition lines"""
+        registry = MetricsRegistry()
+        report = {'generations': 5, 'phase_seconds': {'fitness': 0.25},
+                  'counters': {'evaluations': 50, 'crossover': 20}}
+        registry.record(report)
+        registry.record(report)
+        registry.record(None)
+        text = registry.render({'jobs': {'help': 'Jobs', 'label': 'status', 'values': {'queued': 3}}})
+        lines = set(text.splitlines())
+        self.assertIn('agadr_runs_total 2', lines)
+        self.assertIn('agadr_generations_total 10', lines)
+        self.assertIn('agadr_phase_seconds_total{phase="fitness"} 0.5', lines)
+        self.assertIn('agadr_evaluations_total 100', lines)
+        self.assertIn('agadr_operator_applications_total{operator="crossover"} 40', lines)
+        self.assertIn('# TYPE agadr_jobs gauge', lines)
+        self.assertIn('agadr_jobs{status="queued"} 3', lines)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+# testing/tests/test_result_cache.py
+
+import os
+import tempfile
+import time
+import unittest
+from algorithms.jobs import JobManager
+from algorithms.result_cache import ResultCache, canonical_key
+
+FIELDS = ('teachers', 'semester', 'seed')
+
+class TestResultCache(unittest.TestCase):
+    def test_canonical_key(self):
+        """Test if the key ignores key order and unlisted fields but not values"""
+        a = {'semester': 'Fall', 'teachers': [{'name': 'A', 'id': 1}], 'seed': 1}
+        b = {'seed': 1, 'teachers': [{'id': 1, 'name': 'A'}], 'semester': 'Fall', 'note': 'x'}
+        self.assertEqual(canonical_key(a, FIELDS), canonical_key(b, FIELDS))
+        self.assertNotEqual(canonical_key(a, FIELDS), canonical_key(dict(a, seed=2), FIELDS))
+
+    def test_memory_eviction(self):
+        """Test if the in-memory tier drops its least recently used entry"""
+        cache = ResultCache(FIELDS, maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+
+    def test_disk_tier_survives_restart(self):
+        """Test if results written to the directory are served by a fresh cache"""
+        with tempfile.TemporaryDirectory() as directory:
+            ResultCache(FIELDS, directory=directory).put('k', {0: {1: 'x'}})
+            restarted = ResultCache(FIELDS, directory=directory)
+            self.assertEqual(restarted.get('k'), {'0': {'1': 'x'}})
+            self.assertEqual(restarted.disk_hits, 1)
+
+            small = ResultCache(FIELDS, directory=directory, max_disk_entries=2)
+            for key in 'abc':
+                small.put(key, key)
+            self.assertEqual(len(os.listdir(directory)), 2)
+
+    def test_failed_disk_write_keeps_result(self):
+        """Test if a disk write failure leaves the memory tier serving the result, without raising"""
+        with tempfile.TemporaryDirectory() as parent:
+            directory = os.path.join(parent, 'cache')
+            cache = ResultCache(FIELDS, directory=directory)
+            os.rmdir(directory)
+            cache.put('k', 'x')
+            self.assertEqual(cache.get('k'), 'x')
+
+    def test_job_manager_serves_hits_without_solving(self):
+        """Test if a repeated payload finishes from the cache without calling the solver"""
+        calls = []
+        def solve(payload, callback):
+            calls.append(payload)
+            return {'semester': payload['semester']}
+
+        jobs = JobManager(solve, max_workers=1, use_processes=False, cache=ResultCache(FIELDS))
+        try:
+            first = jobs.submit({'semester': 'Fall'})
+            while jobs.status(first)['finished_at'] is None:
+                time.sleep(0.01)
+            second = jobs.submit({'semester': 'Fall', 'note': 'retry'})
+            self.assertEqual(jobs.status(second)['status'], 'succeeded')
+            self.assertTrue(jobs.status(second)['cached'])
+            self.assertEqual(jobs.result(second), {'semester': 'Fall'})
+            self.assertEqual(len(calls), 1)
+        finally:
+            jobs.shutdown()
+
+if __name__ == '__main__':
+    unittest.main()
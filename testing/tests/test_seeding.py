@@ -0,0 +1,53 @@
+# testing/tests/test_seeding.py
+
+import random
+import unittest
+from algorithms.agadr import AGADRScheduler
+from algorithms.problem import CompiledProblem
+from utils.data_generator import generate_instance
+
+def clashes(chromosome):
+    teachers = [(g['day'], g['time_slot'], g['teacher']['id']) for g in chromosome]
+    rooms = [(g['day'], g['time_slot'], g['classroom']['id']) for g in chromosome]
+    return len(teachers) - len(set(teachers)) + len(rooms) - len(set(rooms))
+
+class TestConstructiveSeeder(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        instance = generate_instance(n_teachers=12, n_rooms=8, n_courses=30, availability=1.0, seed=3)
+        self.problem = CompiledProblem(instance['teachers'], instance['classrooms'], instance['courses'])
+        self.scheduler = AGADRScheduler(problem=self.problem, population_size=10,
+                                        seeding='constructive', seed_ratio=0.5)
+
+    def test_rows_line_up_with_random_chromosomes(self):
+        """Test if seeded genes cover the same sessions in the same order as random ones"""
+        seeded = self.scheduler.create_chromosome(constructive=True)
+        plain = self.scheduler.create_chromosome()
+        self.assertEqual([g['course']['id'] for g in seeded], [g['course']['id'] for g in plain])
+
+    def test_easy_instance_has_no_clashes(self):
+        """Test if seeding an instance with plenty of capacity gives a clash-free timetable"""
+        chromosome = self.scheduler.create_chromosome(constructive=True)
+        self.assertEqual(clashes(chromosome), 0)
+        self.assertGreater(self.scheduler.fitness(chromosome),
+                           self.scheduler.fitness(self.scheduler.create_chromosome()))
+
+    def test_seeded_timetables_differ(self):
+        """Test if repeated seeding gives diverse timetables"""
+        first = list(self.problem.seeder.place())
+        second = list(self.problem.seeder.place())
+        self.assertNotEqual(first, second)
+
+    def test_population_mix(self):
+        """Test if the population holds seed_ratio constructive individuals and the rest random"""
+        population = self.scheduler.initialize_population()
+        self.assertEqual(len(population), 10)
+        self.assertTrue(all(clashes(c) == 0 for c in population[:5]))
+        self.assertGreater(sum(clashes(c) for c in population[5:]), 0)
+
+    def test_unknown_mode_rejected(self):
+        with self.assertRaises(ValueError):
+            AGADRScheduler(problem=self.problem, seeding='greedy')
+
+if __name__ == '__main__':
+    unittest.main()
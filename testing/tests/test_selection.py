@@ -0,0 +1,55 @@
+# testing/tests/test_selection.py
+
+import random
+import unittest
+import numpy as np
+from algorithms.agadr import AGADRScheduler
+from algorithms.selection import tournament, linear_rank, stochastic_universal
+
+class TestSelection(unittest.TestCase):
+    def setUp(self):
+        self.rng = np.random.default_rng(0)
+        self.scores = np.linspace(0.01, 1.0, 100)
+
+    def test_pressure_favours_fitter_individuals(self):
+        """Test if every scheme picks fitter parents more often, and more so with higher pressure"""
+        for select, low, high in ((tournament, 2, 7), (linear_rank, 1.2, 2.0),
+                                  (stochastic_universal, 1.0, 4.0)):
+            mild = self.scores[select(self.scores, 5000, low, self.rng)].mean()
+            strong = self.scores[select(self.scores, 5000, high, self.rng)].mean()
+            self.assertGreater(mild, self.scores.mean(), select.__name__)
+            self.assertGreater(strong, mild, select.__name__)
+
+    def test_sus_copies_within_one_of_expected(self):
+        """Test if stochastic universal sampling gives each individual its expected share"""
+        chosen = stochastic_universal(self.scores, 1000, 1.0, self.rng)
+        expected = 1000 * self.scores / self.scores.sum()
+        counts = np.bincount(chosen, minlength=len(self.scores))
+        self.assertTrue(np.all(np.abs(counts - expected) < 1 + 1e-9))
+
+    def test_scheduler_pairs_are_reproducible(self):
+        """Test if a seeded scheduler draws the same parent pairs for a whole generation"""
+        scheduler = AGADRScheduler(selection='rank', selection_pressure=1.8)
+        random.seed(4)
+        first = scheduler.select_parent_pairs(list(self.scores), 24)
+        random.seed(4)
+        second = scheduler.select_parent_pairs(list(self.scores), 24)
+        self.assertEqual(first.shape, (24, 2))
+        np.testing.assert_array_equal(first, second)
+
+    def test_generation_size_for_every_scheme(self):
+        """Test if breeding fills the population under each scheme"""
+        for scheme in ('tournament', 'rank', 'sus'):
+            scheduler = AGADRScheduler(population_size=11, selection=scheme)
+            population = scheduler.initialize_population()
+            scores = scheduler.evaluate_population(population)
+            self.assertEqual(len(scheduler.next_generation(population, scores)), 11)
+
+    def test_invalid_options_rejected(self):
+        with self.assertRaises(ValueError):
+            AGADRScheduler(selection='roulette')
+        with self.assertRaises(ValueError):
+            AGADRScheduler(selection='rank', selection_pressure=3)
+
+if __name__ == '__main__':
+    unittest.main()
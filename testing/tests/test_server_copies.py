@@ -0,0 +1,21 @@
+# testing/tests/test_server_copies.py
+
+import unittest
+from pathlib import Path
+
+ALGORITHMS_DIR = Path(__file__).resolve().parent.parent / 'algorithms'
+SERVER_DIR = Path(__file__).resolve().parent.parent.parent / 'server' / 'algorithms'
+
+# Modules the server keeps its own copy of
+MIRRORED = ('fitness.py', 'encoding.py', 'batch_fitness.py', 'availability.py')
+
+@unittest.skipUnless(SERVER_DIR.is_dir(), "server sources not present")
+class TestServerCopies(unittest.TestCase):
+    def test_copies_match(self):
+        """Test if the server's copies of the fitness modules match the originals"""
+        for name in MIRRORED:
+            with self.subTest(module=name):
+                self.assertEqual((SERVER_DIR / name).read_text(), (ALGORITHMS_DIR / name).read_text())
+
+if __name__ == '__main__':
+    unittest.main()
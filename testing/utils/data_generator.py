@@ -1,3 +1,8 @@
+import os
+import json
+import random
+
+
 def generate_test_data():
     """Generate sample data for testing"""
     divisions = [
@@ -49,4 +54,54 @@ def generate_test_data():
         "divisions": divisions,
         "teachers": teachers,
         "classrooms": classrooms
-    } 
\ No newline at end of file
+    } 
+
+def generate_instance(n_teachers: int = 20, n_rooms: int = 10, n_courses: int = 50,
+                      n_subjects: int = 10, subject_skew: float = 1.0,
+                      subjects_per_teacher: tuple = (1, 3), availability: float = 0.8,
+                      sessions_per_week: tuple = (1, 3), students: tuple = (15, 60),
+                      n_days: int = 5, n_slots: int = 8, seed: int = None) -> dict:
+    """Generate a random problem instance in the scheduler's data file format.
+
+    Subjects are drawn for courses with Zipf-like weights 1 / rank**subject_skew,
+    so a few subjects dominate as in real departments. Each teacher and room
+    is free in each period with probability `availability`. Every subject
+    gets at least one teacher and the first room fits the largest class, so
+    no course is left without a qualified teacher or a large-enough room.
+    """
+    rng = random.Random(seed)
+    subjects = [f"Subject {i}" for i in range(n_subjects)]
+    weights = [1 / (rank + 1) ** subject_skew for rank in range(n_subjects)]
+
+    def week():
+        return {str(day): [rng.random() < availability for _ in range(n_slots)]
+                for day in range(n_days)}
+
+    teachers = []
+    for i in range(n_teachers):
+        count = min(rng.randint(*subjects_per_teacher), n_subjects)
+        taught = set(rng.choices(subjects, weights=weights, k=count))
+        # Cover every subject at least once, dealing them out round-robin
+        # when there are fewer teachers than subjects
+        taught.update(subjects[i::n_teachers])
+        teachers.append({"id": i + 1, "name": f"Teacher {i + 1}",
+                         "subjects": sorted(taught), "availability": week()})
+
+    classrooms = [{"id": i + 1, "room_number": str(101 + i),
+                   "capacity": rng.randint(students[0], students[1]) if i else students[1],
+                   "availability": week()} for i in range(n_rooms)]
+
+    courses = [{"id": i + 1, "name": f"Course {i + 1}",
+                "subject": rng.choices(subjects, weights=weights)[0],
+                "students": rng.randint(*students),
+                "sessions_per_week": rng.randint(*sessions_per_week)} for i in range(n_courses)]
+
+    return {"teachers": teachers, "classrooms": classrooms, "courses": courses}
+
+
+def write_instance(instance: dict, data_dir: str):
+    """Write an instance as teachers/classrooms/courses.json, the layout AGADRScheduler loads"""
+    os.makedirs(data_dir, exist_ok=True)
+    for name in ("teachers", "classrooms", "courses"):
+        with open(os.path.join(data_dir, f"{name}.json"), "w") as f:
+            json.dump({name: instance[name]}, f, indent=4)